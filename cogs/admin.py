@@ -1,4 +1,5 @@
 import aiohttp
+import asyncio
 import discord
 import importlib
 import os
@@ -9,6 +10,9 @@ from utils.default import CustomContext
 from utils import permissions, default, http
 from utils.data import DiscordBot
 
+AVATAR_MAX_BYTES = 10 * 1024 * 1024   # Discord's avatar upload limit
+AVATAR_FORMATS = ("png", "jpeg", "gif", "webp")
+
 
 def owner_only_slash(interaction: discord.Interaction) -> bool:
     return interaction.user.id == interaction.client.config.discord_owner_id
@@ -163,6 +167,35 @@ class Admin(commands.Cog):
             return await interaction.response.send_message(f"⚠️ Error: {e}", ephemeral=True)
         await interaction.response.send_message(f"✅ Reloaded **utils/{name}.py**", ephemeral=True)
 
+    # ── HTTP Stats ────────────────────────────────────────────────────
+
+    @commands.command()
+    @commands.check(permissions.is_owner)
+    async def httpstats(self, ctx: CustomContext):
+        """ Show external API cache and host health statistics. """
+        stats = http.cache.stats()
+        embed = discord.Embed(title="🌐  HTTP Cache", colour=discord.Colour.blurple())
+        embed.add_field(name="🗂️ Entries",   value=f"**{stats['entries']}** / {http.cache.max_entries}", inline=True)
+        embed.add_field(name="🎯 Hit Ratio", value=f"**{stats['hit_ratio']:.0%}**", inline=True)
+        embed.add_field(name="🧹 Evicted",   value=f"**{stats['evictions']}**", inline=True)
+        embed.add_field(
+            name="📊 Lookups",
+            value=f"fresh `{stats['hits']}` • stale `{stats['stale_hits']}` • coalesced `{stats['coalesced']}` • miss `{stats['misses']}`",
+            inline=False
+        )
+        states = {"closed": "🟢", "half-open": "🟡", "open": "🔴"}
+        for host, health in sorted(http.hosts.items(), key=lambda h: h[1].requests, reverse=True)[:10]:
+            s = health.stats()
+            embed.add_field(
+                name=f"{states[s['state']]} {host}",
+                value=(
+                    f"`{s['requests']}` req • `{s['failures']}` failed • `{s['retries']}` retried • `{s['rejected']}` short-circuited\n"
+                    f"latency avg `{s['avg_latency'] * 1000:.0f}ms` • max `{s['max_latency'] * 1000:.0f}ms`"
+                ),
+                inline=False
+            )
+        await ctx.send(embed=embed)
+
     # ── DM ────────────────────────────────────────────────────────────
 
     @commands.command()
@@ -215,6 +248,10 @@ class Admin(commands.Cog):
 
     # ── Change Avatar ─────────────────────────────────────────────────
 
+    async def _fetch_avatar(self, url: str) -> bytes:
+        result = await http.download(url, max_bytes=AVATAR_MAX_BYTES, formats=AVATAR_FORMATS)
+        return result.data
+
     @change.command(name="avatar")
     @commands.check(permissions.is_owner)
     async def change_avatar(self, ctx: CustomContext, url: str = None):
@@ -223,26 +260,28 @@ class Admin(commands.Cog):
             url = ctx.message.attachments[0].url
         elif url:
             url = url.strip("<>")
+        if not url:
+            return await ctx.send("❌ Please provide an image URL or attach an image.")
         try:
-            bio = await http.get(url, res_method="read")
-            await self.bot.user.edit(avatar=bio.response)
+            await self.bot.user.edit(avatar=await self._fetch_avatar(url))
             await ctx.send("✅ Avatar updated successfully.")
         except aiohttp.InvalidURL:
             await ctx.send("❌ The URL provided is invalid.")
-        except discord.InvalidArgument:
+        except http.DownloadError as err:
+            await ctx.send(f"❌ {err}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, http.CircuitOpenError):
+            await ctx.send("❌ Couldn't download that image.")
+        except ValueError:
             await ctx.send("❌ That URL doesn't contain a valid image.")
         except discord.HTTPException as err:
             await ctx.send(err)
-        except TypeError:
-            await ctx.send("❌ Please provide an image URL or attach an image.")
 
     @app_commands.command(name="change-avatar", description="Change the bot's avatar via URL. (Owner only)")
     @app_commands.describe(url="Image URL for the new avatar")
     @app_commands.check(owner_only_slash)
     async def slash_change_avatar(self, interaction: discord.Interaction, url: str):
         try:
-            bio = await http.get(url.strip("<>"), res_method="read")
-            await self.bot.user.edit(avatar=bio.response)
+            await self.bot.user.edit(avatar=await self._fetch_avatar(url.strip("<>")))
             await interaction.response.send_message("✅ Avatar updated successfully.", ephemeral=True)
         except Exception as e:
             await interaction.response.send_message(f"❌ {e}", ephemeral=True)
@@ -1,232 +1,350 @@
+import asyncio
 import base64
 import binascii
-import codecs
 import discord
+import string
 
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from discord.ext import commands
 from discord import app_commands
 from utils.default import CustomContext
-from utils import default, http
+from utils import default
 from utils.data import DiscordBot
 
+MAX_PIPELINE = 8   # stages allowed in one chained spec like base64|rot13|hex
 
-async def encryptout(ctx_or_interaction, convert: str, input_data) -> None:
-    """Send encode/decode result — works for both prefix and slash."""
-    is_interaction = isinstance(ctx_or_interaction, discord.Interaction)
-    send = ctx_or_interaction.followup.send if is_interaction else ctx_or_interaction.send
+# Attachments are transformed chunk by chunk on a worker thread so the shard keeps heartbeating
+FILE_MAX_BYTES = 25 * 1024 * 1024
+FILE_CHUNK_SIZE = 256 * 1024
+PROGRESS_INTERVAL = 2.0
+AUTO_RESULTS = 3       # candidates shown by decode auto
+AUTO_MIN_SCORE = 0.5   # below this the output doesn't look like text
+AUTO_ROT_MARGIN = 0.15 # how much more English-like (letter_score) than the input a ROT13 decode must be
+WHITESPACE = string.whitespace.encode()
+workers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="encryption")
 
-    if not input_data:
-        msg = "❌ You need to provide something to encode/decode."
-        if is_interaction:
-            return await ctx_or_interaction.followup.send(msg, ephemeral=True)
-        return await ctx_or_interaction.send(msg)
+ROT13 = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz",
+    b"NOPQRSTUVWXYZABCDEFGHIJKLMnopqrstuvwxyzabcdefghijklm"
+)
 
-    try:
-        text = input_data.decode("utf-8")
-    except AttributeError:
-        text = input_data
 
-    if len(text) > 1900:
-        data = BytesIO(text.encode("utf-8") if isinstance(text, str) else text)
-        try:
-            return await send(content=f"📑 **{convert}**", file=discord.File(data, filename=default.timetext("Encryption")))
-        except discord.HTTPException:
-            return await send("❌ The output file exceeded 8 MB, sorry.")
-    await send(f"📑 **{convert}**```fix\n{text}```")
+# ─── Codec registry ─────────────────────────────────────────────
+class Codec:
+    """ A reversible bytes → bytes transform, exposed as encode/decode <name>.
 
+    encode_block/decode_block are the input sizes that always map to whole output groups,
+    so a stream can be cut at any multiple of them; None means the codec needs all of its input at once.
+    """
 
-class Encryption(commands.Cog):
-    def __init__(self, bot):
-        self.bot: DiscordBot = bot
+    def __init__(self, name: str, label: str, encode, decode, blocks: tuple, aliases: tuple = (), strip: bool = True, alphabet: bytes = None):
+        self.name = name
+        self.label = label
+        self.encode = encode
+        self.decode = decode
+        self.encode_block, self.decode_block = blocks
+        self.aliases = aliases
+        self.strip = strip
+        self.alphabet = alphabet
 
-    # ── Prefix groups ─────────────────────────────────────────────────
+    def accepts(self, data: bytes) -> bool:
+        """ Cheap screen for decode auto: every byte must be in the codec's alphabet. """
+        return self.alphabet is None or not data.translate(None, self.alphabet)
 
-    @commands.group()
-    async def encode(self, ctx: CustomContext):
-        """ Encode text using various methods. """
-        if ctx.invoked_subcommand is None:
-            await ctx.send_help(str(ctx.command))
 
-    @commands.group()
-    async def decode(self, ctx: CustomContext):
-        """ Decode text using various methods. """
-        if ctx.invoked_subcommand is None:
-            await ctx.send_help(str(ctx.command))
+CODECS: dict[str, Codec] = {}
 
-    # ── Base32 ────────────────────────────────────────────────────────
 
-    @encode.command(name="base32", aliases=["b32"])
-    async def encode_base32(self, ctx, *, input: commands.clean_content = None):
-        """ Encode text to base32. """
-        await encryptout(ctx, "Text → base32", base64.b32encode((input or "").encode("utf-8")))
+def register(codec: Codec) -> None:
+    for key in (codec.name, *codec.aliases):
+        CODECS[key] = codec
 
-    @decode.command(name="base32", aliases=["b32"])
-    async def decode_base32(self, ctx, *, input: commands.clean_content = None):
-        """ Decode base32 to text. """
-        try:
-            await encryptout(ctx, "base32 → Text", base64.b32decode((input or "").encode("utf-8")))
-        except Exception:
-            await ctx.send("❌ Invalid base32 input.")
 
-    @app_commands.command(name="encode-base32", description="Encode text to base32.")
-    @app_commands.describe(text="Text to encode")
-    async def slash_encode_base32(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        await encryptout(interaction, "Text → base32", base64.b32encode(text.encode("utf-8")))
+B32_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567="
+B64_ALPHABET = string.ascii_letters.encode() + string.digits.encode() + b"+/-_="
+HEX_ALPHABET = string.hexdigits.encode()
+B85_ALPHABET = string.ascii_letters.encode() + string.digits.encode() + b"!#$%&()*+-;<=>?@^_`{|}~"
+A85_ALPHABET = bytes(range(ord("!"), ord("u") + 1)) + b"z" + WHITESPACE
 
-    @app_commands.command(name="decode-base32", description="Decode base32 to text.")
-    @app_commands.describe(text="base32 text to decode")
-    async def slash_decode_base32(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        try:
-            await encryptout(interaction, "base32 → Text", base64.b32decode(text.encode("utf-8")))
-        except Exception:
-            await interaction.followup.send("❌ Invalid base32 input.")
+register(Codec("base32",  "base32",  base64.b32encode,         base64.b32decode,         (5, 8),    ("b32",), alphabet=B32_ALPHABET))
+register(Codec("base64",  "base64",  base64.urlsafe_b64encode, base64.urlsafe_b64decode, (3, 4),    ("b64",), alphabet=B64_ALPHABET))
+register(Codec("rot13",   "ROT13",   lambda b: b.translate(ROT13), lambda b: b.translate(ROT13), (1, 1), ("r13",), strip=False))
+register(Codec("hex",     "Hex",     binascii.hexlify,         binascii.unhexlify,       (1, 2),    alphabet=HEX_ALPHABET))
+register(Codec("base85",  "base85",  base64.b85encode,         base64.b85decode,         (4, 5),    ("b85",), alphabet=B85_ALPHABET))
+# "z" folds four zero bytes into one character, so ASCII85 can't be cut at fixed offsets when decoding
+register(Codec("ascii85", "ASCII85", base64.a85encode,         base64.a85decode,         (4, None), ("a85",), alphabet=A85_ALPHABET))
 
-    # ── Base64 ────────────────────────────────────────────────────────
 
-    @encode.command(name="base64", aliases=["b64"])
-    async def encode_base64(self, ctx, *, input: commands.clean_content = None):
-        """ Encode text to base64. """
-        await encryptout(ctx, "Text → base64", base64.urlsafe_b64encode((input or "").encode("utf-8")))
+def codec_names() -> list[str]:
+    return sorted({c.name for c in CODECS.values()})
 
-    @decode.command(name="base64", aliases=["b64"])
-    async def decode_base64(self, ctx, *, input: commands.clean_content = None):
-        """ Decode base64 to text. """
-        try:
-            await encryptout(ctx, "base64 → Text", base64.urlsafe_b64decode((input or "").encode("utf-8")))
-        except Exception:
-            await ctx.send("❌ Invalid base64 input.")
 
-    @app_commands.command(name="encode-base64", description="Encode text to base64.")
-    @app_commands.describe(text="Text to encode")
-    async def slash_encode_base64(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        await encryptout(interaction, "Text → base64", base64.urlsafe_b64encode(text.encode("utf-8")))
+def parse_pipeline(spec: str) -> list[Codec]:
+    """ Resolve "base64|rot13|hex" into its codecs; raises ValueError with a user-facing message. """
+    names = [n.strip().lower() for n in spec.split("|")]
+    if len(names) > MAX_PIPELINE:
+        raise ValueError(f"Chains are limited to {MAX_PIPELINE} steps.")
+    unknown = [n for n in names if n not in CODECS]
+    if unknown:
+        raise ValueError(f"Unknown method `{unknown[0]}`. Available: {', '.join(codec_names())}")
+    return [CODECS[n] for n in names]
 
-    @app_commands.command(name="decode-base64", description="Decode base64 to text.")
-    @app_commands.describe(text="base64 text to decode")
-    async def slash_decode_base64(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
+
+def run_pipeline(stages: list[Codec], data: bytes, decode: bool) -> bytes:
+    """ Encode left to right, or undo the same chain right to left; the data stays bytes throughout. """
+    for stage in (reversed(stages) if decode else stages):
         try:
-            await encryptout(interaction, "base64 → Text", base64.urlsafe_b64decode(text.encode("utf-8")))
-        except Exception:
-            await interaction.followup.send("❌ Invalid base64 input.")
+            data = stage.decode(data) if decode else stage.encode(data)
+        except ValueError:
+            raise ValueError(f"Invalid {stage.label} input.")
+    return data
+
+
+def _stream_stage(codec: Codec, chunks, decode: bool):
+    """ Apply one codec to a stream of chunks, carrying partial blocks over to the next chunk. """
+    fn = codec.decode if decode else codec.encode
+    block = codec.decode_block if decode else codec.encode_block
+    carry = b""
+    for chunk in chunks:
+        if decode and codec.strip:
+            # Encoded files are usually line-wrapped; the decoders want a bare alphabet
+            chunk = chunk.translate(None, WHITESPACE)
+        buffer = carry + chunk if carry else chunk
+        cut = len(buffer) - len(buffer) % block if block else 0
+        if cut:
+            yield _apply(codec, fn, buffer[:cut])
+        carry = buffer[cut:]
+    if carry:
+        yield _apply(codec, fn, carry)
+
+
+def _apply(codec: Codec, fn, data: bytes) -> bytes:
+    try:
+        return fn(data)
+    except ValueError:
+        raise ValueError(f"Invalid {codec.label} input.")
+
+
+class FileJob:
+    """ One attachment pushed through a pipeline on a worker thread; done/total are read for progress. """
+
+    def __init__(self, stages: list[Codec], data: bytes, decode: bool, max_output: int):
+        self.stages = stages
+        self.data = data
+        self.decode = decode
+        self.max_output = max_output
+        self.done = 0
+        self.total = len(data)
+
+    def _source(self):
+        for offset in range(0, self.total, FILE_CHUNK_SIZE):
+            self.done = offset
+            yield self.data[offset:offset + FILE_CHUNK_SIZE]
+        self.done = self.total
+
+    def run(self) -> BytesIO:
+        chunks = self._source()
+        for stage in (reversed(self.stages) if self.decode else self.stages):
+            chunks = _stream_stage(stage, chunks, self.decode)
+        output = BytesIO()
+        for chunk in chunks:
+            if output.tell() + len(chunk) > self.max_output:
+                raise ValueError(f"The output would be larger than the {self.max_output / 1048576:.0f} MB upload limit.")
+            output.write(chunk)
+        output.seek(0)
+        return output
+
+
+# ─── decode auto ────────────────────────────────────────────────
+COMMON_TEXT = frozenset(b"etaoinshrdlu ETAOINSHRDLU")
+
+
+def text_score(data: bytes) -> float:
+    """ 0..1 guess of how much data looks like readable text: printable UTF-8, weighted by common English letters. """
+    if not data:
+        return 0.0
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return 0.0
+    printable = sum(c.isprintable() or c in "\n\r\t" for c in text) / len(text)
+    # About 60% of English prose is one of these characters; random alphabets sit well below it
+    common = min(1.0, sum(b in COMMON_TEXT for b in data) / len(data) / 0.6)
+    return printable * 0.6 + common * 0.4
 
-    # ── ROT13 ─────────────────────────────────────────────────────────
 
-    @encode.command(name="rot13", aliases=["r13"])
-    async def encode_rot13(self, ctx, *, input: commands.clean_content = None):
-        """ Encode text with ROT13. """
-        await encryptout(ctx, "Text → ROT13", codecs.decode(input or "", "rot_13"))
+def letter_score(data: bytes) -> float:
+    """ Share of ASCII letters that are common English ones: about 0.8 for prose, about 0.5 once ROT13'd. """
+    letters = [b for b in data if 65 <= b <= 90 or 97 <= b <= 122]
+    if not letters:
+        return 0.0
+    return sum(b in COMMON_TEXT for b in letters) / len(letters)
 
-    @decode.command(name="rot13", aliases=["r13"])
-    async def decode_rot13(self, ctx, *, input: commands.clean_content = None):
-        """ Decode ROT13 to text. """
-        await encryptout(ctx, "ROT13 → Text", codecs.decode(input or "", "rot_13"))
 
-    @app_commands.command(name="encode-rot13", description="Encode text with ROT13.")
-    @app_commands.describe(text="Text to encode")
-    async def slash_encode_rot13(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        await encryptout(interaction, "Text → ROT13", codecs.decode(text, "rot_13"))
+def _try_decode(codec: Codec, data: bytes) -> tuple[float, Codec, bytes] | None:
+    try:
+        output = codec.decode(data)
+    except ValueError:
+        return None
+    return text_score(output), codec, output
 
-    @app_commands.command(name="decode-rot13", description="Decode ROT13 to text.")
-    @app_commands.describe(text="ROT13 text to decode")
-    async def slash_decode_rot13(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        await encryptout(interaction, "ROT13 → Text", codecs.decode(text, "rot_13"))
 
-    # ── Hex ───────────────────────────────────────────────────────────
+def pipeline_label(stages: list[Codec], decode: bool) -> str:
+    labels = [s.label for s in stages]
+    if decode:
+        return " → ".join([*reversed(labels), "Text"])
+    return " → ".join(["Text", *labels])
 
-    @encode.command(name="hex")
-    async def encode_hex(self, ctx, *, input: commands.clean_content = None):
-        """ Encode text to hex. """
-        await encryptout(ctx, "Text → Hex", binascii.hexlify((input or "").encode("utf-8")))
 
-    @decode.command(name="hex")
-    async def decode_hex(self, ctx, *, input: commands.clean_content = None):
-        """ Decode hex to text. """
-        try:
-            await encryptout(ctx, "Hex → Text", binascii.unhexlify((input or "").encode("utf-8")))
-        except Exception:
-            await ctx.send("❌ Invalid hex input.")
+async def encryptout(ctx_or_interaction, convert: str, output: bytes) -> None:
+    """Send encode/decode result — works for both prefix and slash."""
+    is_interaction = isinstance(ctx_or_interaction, discord.Interaction)
+    send = ctx_or_interaction.followup.send if is_interaction else ctx_or_interaction.send
 
-    @app_commands.command(name="encode-hex", description="Encode text to hex.")
-    @app_commands.describe(text="Text to encode")
-    async def slash_encode_hex(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        await encryptout(interaction, "Text → Hex", binascii.hexlify(text.encode("utf-8")))
+    try:
+        text = output.decode("utf-8")
+    except UnicodeDecodeError:
+        text = None
 
-    @app_commands.command(name="decode-hex", description="Decode hex to text.")
-    @app_commands.describe(text="Hex text to decode")
-    async def slash_decode_hex(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
+    # Binary or long output goes out as a file straight from the bytes, no re-encode
+    if text is None or len(text) > 1900:
         try:
-            await encryptout(interaction, "Hex → Text", binascii.unhexlify(text.encode("utf-8")))
-        except Exception:
-            await interaction.followup.send("❌ Invalid hex input.")
+            return await send(content=f"📑 **{convert}**", file=discord.File(BytesIO(output), filename=default.timetext("Encryption")))
+        except discord.HTTPException:
+            return await send("❌ The output file exceeded 8 MB, sorry.")
+    await send(f"📑 **{convert}**```fix\n{text}```")
 
-    # ── Base85 ────────────────────────────────────────────────────────
 
-    @encode.command(name="base85", aliases=["b85"])
-    async def encode_base85(self, ctx, *, input: commands.clean_content = None):
-        """ Encode text to base85. """
-        await encryptout(ctx, "Text → base85", base64.b85encode((input or "").encode("utf-8")))
+class Encryption(commands.Cog):
+    def __init__(self, bot):
+        self.bot: DiscordBot = bot
 
-    @decode.command(name="base85", aliases=["b85"])
-    async def decode_base85(self, ctx, *, input: commands.clean_content = None):
-        """ Decode base85 to text. """
-        try:
-            await encryptout(ctx, "base85 → Text", base64.b85decode((input or "").encode("utf-8")))
-        except Exception:
-            await ctx.send("❌ Invalid base85 input.")
+    async def cog_unload(self):
+        workers.shutdown(wait=False, cancel_futures=True)
 
-    @app_commands.command(name="encode-base85", description="Encode text to base85.")
-    @app_commands.describe(text="Text to encode")
-    async def slash_encode_base85(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        await encryptout(interaction, "Text → base85", base64.b85encode(text.encode("utf-8")))
+    async def _transform(self, ctx_or_interaction, method: str, text: str, decode: bool, attachment: discord.Attachment = None) -> None:
+        is_interaction = isinstance(ctx_or_interaction, discord.Interaction)
+        send = ctx_or_interaction.followup.send if is_interaction else ctx_or_interaction.send
 
-    @app_commands.command(name="decode-base85", description="Decode base85 to text.")
-    @app_commands.describe(text="base85 text to decode")
-    async def slash_decode_base85(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
+        if not text and attachment is None:
+            return await send("❌ You need to provide something to encode/decode.")
+        if decode and method.strip().lower() == "auto":
+            if not text:
+                return await send("❌ `decode auto` works on text, not files.")
+            return await send(embed=await self._auto_decode_embed(text))
         try:
-            await encryptout(interaction, "base85 → Text", base64.b85decode(text.encode("utf-8")))
-        except Exception:
-            await interaction.followup.send("❌ Invalid base85 input.")
-
-    # ── ASCII85 ───────────────────────────────────────────────────────
+            stages = parse_pipeline(method)
+            if attachment is not None and not text:
+                return await self._transform_file(ctx_or_interaction, stages, attachment, decode)
+            output = run_pipeline(stages, text.encode("utf-8"), decode)
+        except ValueError as e:
+            return await send(f"❌ {e}")
+        await encryptout(ctx_or_interaction, pipeline_label(stages, decode), output)
+
+    async def _auto_decode_embed(self, text: str) -> discord.Embed:
+        raw = text.encode("utf-8")
+        stripped = raw.translate(None, WHITESPACE)
+        candidates = {c.name: c for c in CODECS.values()}.values()
+        candidates = [(c, stripped if c.strip else raw) for c in candidates if c.accepts(stripped if c.strip else raw)]
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(loop.run_in_executor(workers, _try_decode, codec, data) for codec, data in candidates))
+        # A strict alphabet that decodes to text is good evidence on its own. ROT13 accepts anything and
+        # never changes printability, so it only counts when nothing stricter matched and its letters
+        # look clearly more like English than the input's did
+        strict = [r for r in results if r and r[1].alphabet and r[0] >= AUTO_MIN_SCORE]
+        if strict:
+            ranked = strict
+        else:
+            floor = letter_score(raw) + AUTO_ROT_MARGIN
+            ranked = [r for r in results if r and not r[1].alphabet and r[0] >= AUTO_MIN_SCORE and letter_score(r[2]) >= floor]
+        ranked = sorted(ranked, key=lambda r: r[0], reverse=True)[:AUTO_RESULTS]
+
+        if not ranked:
+            return discord.Embed(description="❌ That doesn't look like any format I know.", colour=discord.Colour.red())
+        embed = discord.Embed(title="🔎  Auto Decode", colour=discord.Colour.blurple())
+        for score, codec, output in ranked:
+            preview = output.decode("utf-8")
+            if len(preview) > 900:
+                preview = preview[:900] + "…"
+            embed.add_field(name=f"{codec.label} → Text  •  {score:.0%} match", value=f"```fix\n{preview}```", inline=False)
+        embed.set_footer(text=f"Tried {len(candidates)} of {len(codec_names())} formats")
+        return embed
+
+    async def _transform_file(self, ctx_or_interaction, stages: list[Codec], attachment: discord.Attachment, decode: bool) -> None:
+        is_interaction = isinstance(ctx_or_interaction, discord.Interaction)
+        send = ctx_or_interaction.followup.send if is_interaction else ctx_or_interaction.send
+        guild = ctx_or_interaction.guild
+        upload_limit = guild.filesize_limit if guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+        if attachment.size > FILE_MAX_BYTES:
+            raise ValueError(f"Files are limited to {FILE_MAX_BYTES / 1048576:.0f} MB.")
+
+        job = FileJob(stages, await attachment.read(), decode, upload_limit)
+        future = asyncio.get_running_loop().run_in_executor(workers, job.run)
+        progress = None
+        while not future.done():
+            await asyncio.wait({future}, timeout=PROGRESS_INTERVAL)
+            if future.done():
+                break
+            status = f"⏳ Working on **{attachment.filename}**… {job.done * 100 // max(job.total, 1)}%"
+            if progress is None:
+                progress = await (send(status, wait=True) if is_interaction else send(status))
+            else:
+                await progress.edit(content=status)
+        if progress is not None:
+            await progress.delete()
+
+        output = future.result()
+        stem = attachment.filename.rsplit(".", 1)[0] if "." in attachment.filename else attachment.filename
+        filename = stem if decode else f"{attachment.filename}.{stages[-1].name}"
+        await send(content=f"📑 **{pipeline_label(stages, decode)}**", file=discord.File(output, filename=filename))
+
+    # ── Encode ────────────────────────────────────────────────────────
+
+    @commands.command()
+    async def encode(self, ctx: CustomContext, method: str = None, *, input: commands.clean_content = None):
+        """ Encode text or an attached file. Chain methods with |, e.g. base64|hex """
+        if method is None:
+            return await ctx.send(f"📑 Methods: {', '.join(f'`{n}`' for n in codec_names())}\nChain them with `|`, e.g. `encode base64|hex hello`")
+        await self._transform(ctx, method, input, False, ctx.message.attachments[0] if ctx.message.attachments else None)
+
+    @app_commands.command(name="encode", description="Encode text or a file. Chain methods with |, e.g. base64|hex")
+    @app_commands.describe(method="Method or chain of methods", text="Text to encode", file="File to encode instead of text")
+    async def slash_encode(self, interaction: discord.Interaction, method: str, text: str = None, file: discord.Attachment = None):
+        await interaction.response.defer()
+        await self._transform(interaction, method, text, False, file)
 
-    @encode.command(name="ascii85", aliases=["a85"])
-    async def encode_ascii85(self, ctx, *, input: commands.clean_content = None):
-        """ Encode text to ASCII85. """
-        await encryptout(ctx, "Text → ASCII85", base64.a85encode((input or "").encode("utf-8")))
+    # ── Decode ────────────────────────────────────────────────────────
 
-    @decode.command(name="ascii85", aliases=["a85"])
-    async def decode_ascii85(self, ctx, *, input: commands.clean_content = None):
-        """ Decode ASCII85 to text. """
-        try:
-            await encryptout(ctx, "ASCII85 → Text", base64.a85decode((input or "").encode("utf-8")))
-        except Exception:
-            await ctx.send("❌ Invalid ASCII85 input.")
+    @commands.command()
+    async def decode(self, ctx: CustomContext, method: str = None, *, input: commands.clean_content = None):
+        """ Decode text or an attached file. A chain like base64|hex undoes encode base64|hex; auto guesses the format """
+        if method is None:
+            return await ctx.send(f"📑 Methods: {', '.join(f'`{n}`' for n in codec_names())}\nChain them with `|`, e.g. `decode base64|hex 3631...`, or `decode auto <text>` to guess")
+        await self._transform(ctx, method, input, True, ctx.message.attachments[0] if ctx.message.attachments else None)
 
-    @app_commands.command(name="encode-ascii85", description="Encode text to ASCII85.")
-    @app_commands.describe(text="Text to encode")
-    async def slash_encode_ascii85(self, interaction: discord.Interaction, text: str):
+    @app_commands.command(name="decode", description="Decode text or a file. A chain like base64|hex undoes encode base64|hex")
+    @app_commands.describe(method="Method or chain of methods", text="Text to decode", file="File to decode instead of text")
+    async def slash_decode(self, interaction: discord.Interaction, method: str, text: str = None, file: discord.Attachment = None):
         await interaction.response.defer()
-        await encryptout(interaction, "Text → ASCII85", base64.a85encode(text.encode("utf-8")))
-
-    @app_commands.command(name="decode-ascii85", description="Decode ASCII85 to text.")
-    @app_commands.describe(text="ASCII85 text to decode")
-    async def slash_decode_ascii85(self, interaction: discord.Interaction, text: str):
-        await interaction.response.defer()
-        try:
-            await encryptout(interaction, "ASCII85 → Text", base64.a85decode(text.encode("utf-8")))
-        except Exception:
-            await interaction.followup.send("❌ Invalid ASCII85 input.")
+        await self._transform(interaction, method, text, True, file)
+
+    # ── Method autocomplete ───────────────────────────────────────────
+
+    @slash_encode.autocomplete("method")
+    @slash_decode.autocomplete("method")
+    async def method_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        # Complete the last step of a chain, keeping the steps already typed
+        done, _, last = current.rpartition("|")
+        prefix = f"{done}|" if done else ""
+        names = codec_names()
+        if interaction.command.name == "decode" and not done:
+            names = ["auto", *names]
+        return [
+            app_commands.Choice(name=f"{prefix}{name}", value=f"{prefix}{name}")
+            for name in names if name.startswith(last.strip().lower())
+        ][:25]
 
 
 async def setup(bot):
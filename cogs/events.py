@@ -17,7 +17,10 @@ class Events(commands.Cog):
 
     @commands.Cog.listener()
     async def on_command_error(self, ctx: CustomContext, err: Exception):
-        if isinstance(err, errors.MissingRequiredArgument) or isinstance(err, errors.BadArgument):
+        if isinstance(err, default.MemberSuggestions):
+            await ctx.send(f"❌ {err}")
+
+        elif isinstance(err, errors.MissingRequiredArgument) or isinstance(err, errors.BadArgument):
             helper = str(ctx.invoked_subcommand) if ctx.invoked_subcommand else str(ctx.command)
             await ctx.send_help(helper)
 
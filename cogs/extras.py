@@ -3,15 +3,104 @@ import asyncio
 import random
 import aiohttp
 import html
+import json
+import time
+import typing
 
-from datetime import datetime, timedelta
-from discord.ext import commands
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from discord.ext import commands, tasks
 from discord import app_commands
 from utils.default import CustomContext
 from utils.data import DiscordBot
+from utils import permissions, default, http, trivia_bank
+from utils.db import Database
+from utils.scheduler import Scheduler
 
 ACCENT = discord.Colour.from_str("#5865F2")
-snipe_cache: dict = {}
+
+SNIPE_DEPTH = 10                    # deleted messages remembered per channel
+SNIPE_TTL = 3600                    # seconds a deleted message stays snipeable
+SNIPE_MAX_BYTES = 4 * 1024 * 1024   # rough cap on cached text across all channels
+
+
+# ─── Snipe Cache ────────────────────────────────────────────────
+class SnipeRecord:
+    __slots__ = ("content", "author", "avatar", "timestamp", "deleted_at", "size")
+
+    def __init__(self, content: str, author: str, avatar: str, timestamp: datetime):
+        self.content = content
+        self.author = author
+        self.avatar = avatar
+        self.timestamp = timestamp
+        self.deleted_at = time.monotonic()
+        self.size = len(content) + len(author) + len(avatar) + 64
+
+
+class SnipeCache:
+    """ Last few deletes per channel; channels are evicted least-recently-used first past the byte cap. """
+
+    def __init__(self, depth: int = SNIPE_DEPTH, ttl: float = SNIPE_TTL, max_bytes: int = SNIPE_MAX_BYTES):
+        self.depth = depth
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.channels: OrderedDict[int, deque] = OrderedDict()
+        self.bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expire(self, channel_id: int, ring: deque):
+        cutoff = time.monotonic() - self.ttl
+        while ring and ring[0].deleted_at < cutoff:
+            self.bytes -= ring.popleft().size
+            self.expirations += 1
+        if not ring:
+            del self.channels[channel_id]
+
+    def add(self, channel_id: int, record: SnipeRecord):
+        ring = self.channels.get(channel_id)
+        if ring is None:
+            ring = self.channels[channel_id] = deque(maxlen=self.depth)
+        else:
+            self.channels.move_to_end(channel_id)
+        if len(ring) == self.depth:
+            self.bytes -= ring[0].size
+            self.evictions += 1
+        ring.append(record)
+        self.bytes += record.size
+
+        oldest_id = next(iter(self.channels))
+        if oldest_id != channel_id:
+            self._expire(oldest_id, self.channels[oldest_id])
+        while self.bytes > self.max_bytes and len(self.channels) > 1:
+            _, evicted = self.channels.popitem(last=False)
+            self.bytes -= sum(r.size for r in evicted)
+            self.evictions += len(evicted)
+
+    def get(self, channel_id: int, index: int = 1) -> tuple[SnipeRecord | None, int]:
+        """ Return the index-th most recent delete (1 = newest) and how many are cached. """
+        ring = self.channels.get(channel_id)
+        if ring is None:
+            return None, 0
+        self._expire(channel_id, ring)
+        if not ring:
+            return None, 0
+        self.channels.move_to_end(channel_id)
+        if index < 1 or index > len(ring):
+            return None, len(ring)
+        return ring[-index], len(ring)
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self.channels),
+            "records": sum(len(r) for r in self.channels.values()),
+            "bytes": self.bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+snipe_cache = SnipeCache()
 
 
 # ─── Tic Tac Toe ────────────────────────────────────────────────
@@ -81,6 +170,12 @@ class TTTView(discord.ui.View):
 
 
 # ─── Trivia ─────────────────────────────────────────────────────
+TRIVIA_URL = "https://opentdb.com/api.php?amount=50&type=multiple"
+TRIVIA_LOW_WATER = 15   # refill the pool when fewer questions than this are left
+TRIVIA_RECENT = 300     # recently served questions that won't be repeated
+TRIVIA_TIMEOUT = 5
+
+
 class TriviaView(discord.ui.View):
     def __init__(self, correct, all_answers, invoker_id):
         super().__init__(timeout=20)
@@ -123,14 +218,58 @@ class TriviaView(discord.ui.View):
                 except discord.NotFound: pass
 
 
-async def fetch_trivia():
-    async with aiohttp.ClientSession() as session:
-        async with session.get("https://opentdb.com/api.php?amount=1&type=multiple", timeout=aiohttp.ClientTimeout(total=5)) as resp:
-            return await resp.json()
+class TriviaPool:
+    """ Questions fetched from opentdb in bulk and refilled in the background, with an offline fallback. """
+
+    def __init__(self):
+        self.questions: deque = deque()
+        self.recent: deque = deque(maxlen=TRIVIA_RECENT)
+        self.recent_set: set[str] = set()
+        self.next_fetch = 0.0
+        self._task: asyncio.Task | None = None
+
+    def _remember(self, question: dict):
+        if len(self.recent) == self.recent.maxlen:
+            self.recent_set.discard(self.recent[0])
+        self.recent.append(question["question"])
+        self.recent_set.add(question["question"])
+
+    def take(self) -> dict:
+        question = None
+        while self.questions:
+            candidate = self.questions.popleft()
+            if candidate["question"] not in self.recent_set:
+                question = candidate
+                break
+        if question is None:
+            fresh = [q for q in trivia_bank.QUESTIONS if q["question"] not in self.recent_set]
+            question = random.choice(fresh or trivia_bank.QUESTIONS)
+        self._remember(question)
+        if len(self.questions) < TRIVIA_LOW_WATER:
+            self.refill()
+        return question
+
+    def refill(self):
+        if (self._task is None or self._task.done()) and time.monotonic() >= self.next_fetch:
+            self._task = asyncio.create_task(self._fetch())
+
+    async def _fetch(self):
+        try:
+            r = await http.get(TRIVIA_URL, res_method="json", timeout=aiohttp.ClientTimeout(total=TRIVIA_TIMEOUT))
+            results = r.response.get("results", []) if r.status == 200 else []
+        except Exception:
+            results = []
+        # opentdb allows one request every 5 seconds per IP; back off harder when it fails
+        self.next_fetch = time.monotonic() + (5 if results else 60)
+        queued = {q["question"] for q in self.questions}
+        self.questions.extend(q for q in results if q["question"] not in self.recent_set and q["question"] not in queued)
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
 
 
-def trivia_embed_and_view(data, invoker_id):
-    result = data["results"][0]
+def trivia_embed_and_view(result, invoker_id):
     question = html.unescape(result["question"])
     correct  = html.unescape(result["correct_answer"])
     incorrect = [html.unescape(a) for a in result["incorrect_answers"]]
@@ -145,10 +284,150 @@ def trivia_embed_and_view(data, invoker_id):
     return embed, view
 
 
+# ─── Polls ──────────────────────────────────────────────────────
+POLLS_DB = "data/polls.db"
+POLL_DEFAULT_DURATION = 86400   # seconds a poll stays open when no duration is given
+POLL_MAX_DURATION = 604800
+POLL_FLUSH_INTERVAL = 5.0       # seconds between vote write-backs
+NUMBER_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣"]
+
+POLLS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS polls (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id   INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    message_id INTEGER,
+    author_id  INTEGER NOT NULL,
+    question   TEXT    NOT NULL,
+    options    TEXT    NOT NULL,
+    closes_at  REAL    NOT NULL,
+    closed     INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS poll_votes (
+    poll_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    option  INTEGER NOT NULL,
+    PRIMARY KEY (poll_id, user_id)
+) WITHOUT ROWID;
+"""
+
+
+class PollState:
+    __slots__ = ("id", "channel_id", "message_id", "author_id", "question", "options", "votes", "tallies")
+
+    def __init__(self, poll_id: int, channel_id: int, message_id: int, author_id: int, question: str, options: list):
+        self.id = poll_id
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.author_id = author_id
+        self.question = question
+        self.options = options
+        self.votes: dict[int, int] = {}
+        self.tallies = [0] * len(options)
+
+
+class PollButton(discord.ui.DynamicItem[discord.ui.Button], template=r"poll:(?P<poll_id>\d+):(?P<option>\d)"):
+    def __init__(self, poll_id: int, option: int, label: str = None):
+        super().__init__(discord.ui.Button(
+            label=label[:80] if label else None, emoji=NUMBER_EMOJIS[option],
+            style=discord.ButtonStyle.secondary, custom_id=f"poll:{poll_id}:{option}"))
+        self.poll_id = poll_id
+        self.option = option
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(int(match["poll_id"]), int(match["option"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog("Extras")
+        if cog is None:
+            return await interaction.response.send_message("❌ Polls are unavailable right now.", ephemeral=True)
+        await cog._vote(interaction, self.poll_id, self.option)
+
+
+def _insert_poll(conn, channel, author_id: int, question: str, options: list, closes_at: float) -> int:
+    with conn:
+        return conn.execute(
+            "INSERT INTO polls (guild_id, channel_id, author_id, question, options, closes_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (channel.guild.id, channel.id, author_id, question, json.dumps(options), closes_at)
+        ).lastrowid
+
+
+def _load_open_polls(conn) -> list:
+    polls = {}
+    for row in conn.execute("SELECT * FROM polls WHERE closed = 0 AND message_id IS NOT NULL"):
+        poll = PollState(row["id"], row["channel_id"], row["message_id"], row["author_id"], row["question"], json.loads(row["options"]))
+        polls[poll.id] = (poll, row["closes_at"])
+    for row in conn.execute("SELECT v.poll_id, v.user_id, v.option FROM poll_votes v JOIN polls p ON p.id = v.poll_id WHERE p.closed = 0"):
+        entry = polls.get(row["poll_id"])
+        if entry:
+            entry[0].votes[row["user_id"]] = row["option"]
+            entry[0].tallies[row["option"]] += 1
+    return list(polls.values())
+
+
+# ─── Reminders ──────────────────────────────────────────────────
+REMINDERS_DB = "data/reminders.db"
+MAX_REMINDERS = 25   # pending reminders per user
+
+REMINDERS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id    INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    guild_id   INTEGER,
+    content    TEXT    NOT NULL,
+    created_at REAL    NOT NULL,
+    due_at     REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reminders_user ON reminders (user_id, due_at);
+"""
+
+
+def _insert_reminder(conn, user_id: int, channel_id: int, guild_id: int | None, content: str, created_at: float, due_at: float) -> int:
+    with conn:
+        return conn.execute(
+            "INSERT INTO reminders (user_id, channel_id, guild_id, content, created_at, due_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (user_id, channel_id, guild_id, content, created_at, due_at)
+        ).lastrowid
+
+
 # ─── Main Cog ───────────────────────────────────────────────────
 class Extras(commands.Cog):
     def __init__(self, bot):
         self.bot: DiscordBot = bot
+        self.reminder_db = Database(REMINDERS_DB, REMINDERS_SCHEMA)
+        self.reminder_scheduler = Scheduler(self._fire_reminders)
+        self.reminders_by_user: dict[int, set[int]] = {}
+        self.poll_db = Database(POLLS_DB, POLLS_SCHEMA)
+        self.poll_scheduler = Scheduler(self._close_polls)
+        self.polls: dict[int, PollState] = {}
+        self.pending_votes: dict[tuple[int, int], int] = {}
+        self.trivia_pool = TriviaPool()
+
+    async def cog_load(self):
+        self.trivia_pool.refill()
+        self.bot.add_dynamic_items(PollButton)
+        for poll, closes_at in await self.poll_db.run(_load_open_polls):
+            self.polls[poll.id] = poll
+            self.poll_scheduler.schedule(poll.id, closes_at)
+        self.poll_scheduler.start()
+        self._flush_votes.start()
+
+        for row in await self.reminder_db.fetchall("SELECT id, user_id, due_at FROM reminders"):
+            self.reminders_by_user.setdefault(row["user_id"], set()).add(row["id"])
+            self.reminder_scheduler.schedule(row["id"], row["due_at"])
+        self.reminder_scheduler.start()
+
+    async def cog_unload(self):
+        self.trivia_pool.close()
+        self.bot.remove_dynamic_items(PollButton)
+        self.poll_scheduler.close()
+        self._flush_votes.cancel()
+        await self._flush_votes()
+        await self.poll_db.close()
+        self.reminder_scheduler.close()
+        await self.reminder_db.close()
 
     # ── Snipe ──────────────────────────────────────────────────
 
@@ -156,116 +435,297 @@ class Extras(commands.Cog):
     async def on_message_delete(self, message: discord.Message):
         if message.author.bot or not message.guild:
             return
-        snipe_cache[message.channel.id] = {
-            "content": message.content,
-            "author": str(message.author),
-            "avatar": message.author.display_avatar.url,
-            "timestamp": message.created_at
-        }
+        snipe_cache.add(message.channel.id, SnipeRecord(
+            message.content, str(message.author), message.author.display_avatar.url, message.created_at))
 
-    def _snipe_embed(self, channel_id: int, channel_name: str):
-        data = snipe_cache.get(channel_id)
-        if not data:
+    def _snipe_embed(self, channel_id: int, channel_name: str, index: int = 1):
+        data, count = snipe_cache.get(channel_id, index)
+        if not count:
             return discord.Embed(description="🔍 Nothing to snipe — the cache is empty.", colour=discord.Colour.orange()), False
-        embed = discord.Embed(description=data["content"] or "*[no text content]*", colour=ACCENT, timestamp=data["timestamp"])
-        embed.set_author(name=data["author"], icon_url=data["avatar"])
-        embed.set_footer(text=f"Sniped in #{channel_name}")
+        if not data:
+            return discord.Embed(description=f"🔍 Only **{count}** deleted message{'s' if count != 1 else ''} cached here.", colour=discord.Colour.orange()), False
+        embed = discord.Embed(description=data.content or "*[no text content]*", colour=ACCENT, timestamp=data.timestamp)
+        embed.set_author(name=data.author, icon_url=data.avatar)
+        embed.set_footer(text=f"Sniped in #{channel_name}  •  {index}/{count}")
         return embed, True
 
     @commands.command()
     @commands.guild_only()
-    async def snipe(self, ctx: CustomContext):
-        """ Show the last deleted message in this channel. """
-        embed, _ = self._snipe_embed(ctx.channel.id, ctx.channel.name)
+    async def snipe(self, ctx: CustomContext, index: int = 1):
+        """ Show a recently deleted message in this channel (1 = most recent). """
+        embed, _ = self._snipe_embed(ctx.channel.id, ctx.channel.name, index)
         await ctx.send(embed=embed)
 
-    @app_commands.command(name="snipe", description="Show the last deleted message in this channel.")
-    async def slash_snipe(self, interaction: discord.Interaction):
-        embed, _ = self._snipe_embed(interaction.channel_id, interaction.channel.name)
+    @app_commands.command(name="snipe", description="Show a recently deleted message in this channel.")
+    @app_commands.describe(index="How far back to go (1 = most recent)")
+    async def slash_snipe(self, interaction: discord.Interaction, index: app_commands.Range[int, 1, SNIPE_DEPTH] = 1):
+        embed, _ = self._snipe_embed(interaction.channel_id, interaction.channel.name, index)
         await interaction.response.send_message(embed=embed)
 
+    @commands.command()
+    @commands.check(permissions.is_owner)
+    async def snipestats(self, ctx: CustomContext):
+        """ Show snipe cache usage. """
+        stats = snipe_cache.stats()
+        embed = discord.Embed(title="🔍  Snipe Cache", colour=ACCENT)
+        embed.add_field(name="📺 Channels",  value=f"**{stats['channels']}**", inline=True)
+        embed.add_field(name="🗂️ Messages",  value=f"**{stats['records']}**",  inline=True)
+        embed.add_field(name="💾 Size",      value=f"**{stats['bytes'] / 1024:.1f} KB** / {SNIPE_MAX_BYTES // 1024} KB", inline=True)
+        embed.add_field(name="🧹 Evicted",   value=f"**{stats['evictions']}**",   inline=True)
+        embed.add_field(name="⌛ Expired",   value=f"**{stats['expirations']}**", inline=True)
+        await ctx.send(embed=embed)
+
     # ── Poll ───────────────────────────────────────────────────
 
-    async def _create_poll(self, question: str, options: list, author: discord.Member, send_fn):
-        number_emojis = ["1️⃣","2️⃣","3️⃣","4️⃣","5️⃣","6️⃣","7️⃣","8️⃣","9️⃣"]
-        if len(options) < 2:
-            return None, "❌ Please provide at least **2 options**."
-        if len(options) > 9:
-            return None, "❌ Maximum **9 options** allowed."
+    def _poll_embed(self, poll_id: int, question: str, options: list, author: discord.abc.User, closes_at: float) -> discord.Embed:
         embed = discord.Embed(title=f"📊  {question}", colour=ACCENT)
         embed.set_author(name=author.display_name, icon_url=author.display_avatar.url)
-        embed.description = "\n\n".join(f"{number_emojis[i]}  {opt}" for i, opt in enumerate(options))
-        embed.set_footer(text="Vote by reacting below!")
-        return embed, None
+        embed.description = "\n\n".join(f"{NUMBER_EMOJIS[i]}  {opt}" for i, opt in enumerate(options))
+        embed.add_field(name="Closes", value=f"<t:{int(closes_at)}:R>")
+        embed.set_footer(text=f"Poll #{poll_id} • One vote per person — vote with the buttons below!")
+        return embed
+
+    def _poll_results_embed(self, question: str, options: list, tallies: list) -> discord.Embed:
+        total = sum(tallies)
+        embed = discord.Embed(title=f"📊  {question}", colour=discord.Colour.green())
+        lines = []
+        for i, (opt, count) in enumerate(zip(options, tallies)):
+            pct = count / total * 100 if total else 0
+            bar = "█" * round(pct / 10) + "░" * (10 - round(pct / 10))
+            lines.append(f"{NUMBER_EMOJIS[i]}  {opt}\n`{bar}` **{count}** ({pct:.0f}%)")
+        embed.description = "\n\n".join(lines)
+        embed.set_footer(text=f"Poll closed • {total} vote{'s' if total != 1 else ''}")
+        return embed
+
+    async def _create_poll(self, question: str, options: list, author: discord.abc.User, channel, seconds: int, send_fn):
+        if len(options) < 2:
+            return "❌ Please provide at least **2 options**."
+        if len(options) > 9:
+            return "❌ Maximum **9 options** allowed."
+        closes_at = time.time() + seconds
+        poll_id = await self.poll_db.run(lambda conn: _insert_poll(conn, channel, author.id, question, options, closes_at))
+        view = discord.ui.View(timeout=None)
+        for i, opt in enumerate(options):
+            view.add_item(PollButton(poll_id, i, opt))
+        # Registered before sending so votes cast the moment the buttons appear aren't turned away
+        poll = self.polls[poll_id] = PollState(poll_id, channel.id, None, author.id, question, options)
+        try:
+            msg = await send_fn(embed=self._poll_embed(poll_id, question, options, author, closes_at), view=view)
+        except Exception:
+            self.polls.pop(poll_id, None)
+            await self.poll_db.execute("DELETE FROM polls WHERE id = ?", (poll_id,))
+            raise
+        poll.message_id = msg.id
+        await self.poll_db.execute("UPDATE polls SET message_id = ? WHERE id = ?", (msg.id, poll_id))
+        self.poll_scheduler.schedule(poll_id, closes_at)
+
+    async def _vote(self, interaction: discord.Interaction, poll_id: int, option: int):
+        poll = self.polls.get(poll_id)
+        if poll is None or option >= len(poll.options):
+            return await interaction.response.send_message("❌ This poll is closed.", ephemeral=True)
+        previous = poll.votes.get(interaction.user.id)
+        if previous == option:
+            return await interaction.response.send_message(f"🗳️ You already voted for **{poll.options[option]}**.", ephemeral=True)
+        if previous is not None:
+            poll.tallies[previous] -= 1
+        poll.votes[interaction.user.id] = option
+        poll.tallies[option] += 1
+        self.pending_votes[(poll_id, interaction.user.id)] = option
+        changed = " (changed)" if previous is not None else ""
+        await interaction.response.send_message(f"🗳️ Vote recorded for **{poll.options[option]}**{changed}.", ephemeral=True)
+
+    @tasks.loop(seconds=POLL_FLUSH_INTERVAL)
+    async def _flush_votes(self):
+        if not self.pending_votes:
+            return
+        rows = [(poll_id, user_id, option) for (poll_id, user_id), option in self.pending_votes.items()]
+        self.pending_votes.clear()
+        await self.poll_db.executemany("INSERT OR REPLACE INTO poll_votes (poll_id, user_id, option) VALUES (?, ?, ?)", rows)
+
+    async def _close_polls(self, ids: list):
+        await self._flush_votes()
+        await self.poll_db.executemany("UPDATE polls SET closed = 1 WHERE id = ?", [(i,) for i in ids])
+        await self.bot.wait_until_ready()
+        for poll_id in ids:
+            poll = self.polls.pop(poll_id, None)
+            if poll is None:
+                continue
+            channel = self.bot.get_channel(poll.channel_id)
+            if channel is None:
+                continue
+            try:
+                await channel.get_partial_message(poll.message_id).edit(
+                    embed=self._poll_results_embed(poll.question, poll.options, poll.tallies), view=None)
+            except discord.HTTPException:
+                pass
+
+    async def _end_poll(self, user: discord.Member, poll_id: int) -> discord.Embed:
+        poll = self.polls.get(poll_id)
+        if poll is None:
+            return discord.Embed(description=f"❌ No open poll **#{poll_id}**.", colour=discord.Colour.red())
+        channel = self.bot.get_channel(poll.channel_id)
+        can_manage = channel is not None and hasattr(user, "guild") and channel.permissions_for(user).manage_messages
+        if user.id != poll.author_id and not can_manage:
+            return discord.Embed(description="❌ Only the poll author or a moderator can close this poll.", colour=discord.Colour.red())
+        self.poll_scheduler.cancel(poll_id)
+        await self._close_polls([poll_id])
+        return discord.Embed(description=f"✅ Poll **#{poll_id}** closed.", colour=discord.Colour.green())
 
     @commands.command()
     @commands.guild_only()
-    async def poll(self, ctx: CustomContext, question: str, *options: str):
-        """ Create a reaction poll. Up to 9 options. Usage: !poll "Question" "Option 1" "Option 2" """
-        embed, error = await self._create_poll(question, list(options), ctx.author, None)
+    async def poll(self, ctx: CustomContext, duration: typing.Optional[default.Duration], question: str, *options: str):
+        """ Create a button poll. Up to 9 options. Usage: !poll [1h] "Question" "Option 1" "Option 2" """
+        seconds = duration or POLL_DEFAULT_DURATION
+        if seconds > POLL_MAX_DURATION:
+            return await ctx.send(embed=discord.Embed(description="❌ Maximum poll duration is **7 days**.", colour=discord.Colour.red()))
+        error = await self._create_poll(question, list(options), ctx.author, ctx.channel, seconds, ctx.send)
         if error:
             return await ctx.send(embed=discord.Embed(description=error, colour=discord.Colour.red()))
         try: await ctx.message.delete()
         except discord.Forbidden: pass
-        msg = await ctx.send(embed=embed)
-        for i in range(len(options)):
-            await msg.add_reaction(["1️⃣","2️⃣","3️⃣","4️⃣","5️⃣","6️⃣","7️⃣","8️⃣","9️⃣"][i])
 
-    @app_commands.command(name="poll", description="Create a reaction poll with up to 4 options.")
-    @app_commands.describe(question="Poll question", option1="Option 1", option2="Option 2", option3="Option 3 (optional)", option4="Option 4 (optional)")
-    async def slash_poll(self, interaction: discord.Interaction, question: str, option1: str, option2: str, option3: str = None, option4: str = None):
+    @app_commands.command(name="poll", description="Create a button poll with up to 4 options.")
+    @app_commands.describe(question="Poll question", option1="Option 1", option2="Option 2", option3="Option 3 (optional)", option4="Option 4 (optional)",
+        duration="How long the poll stays open (e.g. 30m, 2h, 1d — default 1d)")
+    async def slash_poll(self, interaction: discord.Interaction, question: str, option1: str, option2: str, option3: str = None, option4: str = None, duration: str = None):
         options = [o for o in [option1, option2, option3, option4] if o]
-        embed, error = await self._create_poll(question, options, interaction.user, None)
+        seconds, error = self._parse_time(duration, "poll duration", POLL_MAX_DURATION) if duration else (POLL_DEFAULT_DURATION, None)
         if error:
             return await interaction.response.send_message(embed=discord.Embed(description=error, colour=discord.Colour.red()), ephemeral=True)
-        await interaction.response.send_message(embed=embed)
-        msg = await interaction.original_response()
-        for i in range(len(options)):
-            await msg.add_reaction(["1️⃣","2️⃣","3️⃣","4️⃣","5️⃣","6️⃣","7️⃣","8️⃣","9️⃣"][i])
+
+        async def send(**kwargs):
+            await interaction.response.send_message(**kwargs)
+            return await interaction.original_response()
+
+        error = await self._create_poll(question, options, interaction.user, interaction.channel, seconds, send)
+        if error:
+            return await interaction.response.send_message(embed=discord.Embed(description=error, colour=discord.Colour.red()), ephemeral=True)
+
+    @commands.command(aliases=["endpoll"])
+    @commands.guild_only()
+    async def pollclose(self, ctx: CustomContext, poll_id: int):
+        """ Close one of your polls early and post the results. """
+        await ctx.send(embed=await self._end_poll(ctx.author, poll_id))
+
+    @app_commands.command(name="pollclose", description="Close a poll early and post the results.")
+    @app_commands.describe(poll_id="The poll number shown in the poll's footer")
+    async def slash_pollclose(self, interaction: discord.Interaction, poll_id: int):
+        await interaction.response.send_message(embed=await self._end_poll(interaction.user, poll_id), ephemeral=True)
 
     # ── Remind Me ──────────────────────────────────────────────
 
-    def _parse_time(self, time_str: str):
-        units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-        unit = time_str[-1].lower()
-        if unit not in units or not time_str[:-1].isdigit():
+    def _parse_time(self, time_str: str, what: str = "reminder time", limit: int = 604800):
+        seconds = default.parse_duration(time_str)
+        if not seconds:
             return None, "❌ Invalid time format. Use `10s`, `5m`, `2h`, or `1d`."
-        seconds = int(time_str[:-1]) * units[unit]
-        if seconds > 604800:
-            return None, "❌ Maximum reminder time is **7 days**."
+        if seconds > limit:
+            return None, f"❌ Maximum {what} is **{limit // 86400} days**."
         return seconds, None
 
+    def _reminder_set_embed(self, reminder_id: int, reminder: str, due: float) -> discord.Embed:
+        embed = discord.Embed(title="⏰  Reminder Set", description=f"I'll remind you about:\n> {reminder}", colour=discord.Colour.green())
+        embed.add_field(name="Fires", value=f"<t:{int(due)}:R>  (<t:{int(due)}:t>)")
+        embed.set_footer(text=f"Reminder #{reminder_id} • Will be sent in this channel.")
+        return embed
+
+    async def _add_reminder(self, user_id: int, channel_id: int, guild_id: int | None, reminder: str, seconds: int):
+        if len(self.reminders_by_user.get(user_id, ())) >= MAX_REMINDERS:
+            return None, None, f"❌ You already have **{MAX_REMINDERS}** pending reminders."
+        now = time.time()
+        due = now + seconds
+        reminder_id = await self.reminder_db.run(lambda conn: _insert_reminder(conn, user_id, channel_id, guild_id, reminder, now, due))
+        self.reminders_by_user.setdefault(user_id, set()).add(reminder_id)
+        self.reminder_scheduler.schedule(reminder_id, due)
+        return reminder_id, due, None
+
+    def _forget_reminder(self, user_id: int, reminder_id: int):
+        ids = self.reminders_by_user.get(user_id)
+        if ids is not None:
+            ids.discard(reminder_id)
+            if not ids:
+                del self.reminders_by_user[user_id]
+
+    async def _fire_reminders(self, ids: list):
+        await self.bot.wait_until_ready()
+        marks = ",".join("?" * len(ids))
+        rows = await self.reminder_db.fetchall(f"SELECT * FROM reminders WHERE id IN ({marks})", tuple(ids))
+        await self.reminder_db.execute(f"DELETE FROM reminders WHERE id IN ({marks})", tuple(ids))
+        for row in rows:
+            self._forget_reminder(row["user_id"], row["id"])
+        await asyncio.gather(*(self._send_reminder(row) for row in rows))
+
+    async def _send_reminder(self, row):
+        fire = discord.Embed(title="⏰  Reminder!", description=f"> {row['content']}", colour=ACCENT,
+            timestamp=datetime.fromtimestamp(row["created_at"], timezone.utc))
+        fire.set_footer(text=f"Reminder #{row['id']} • Set")
+        try:
+            channel = self.bot.get_channel(row["channel_id"]) or await self.bot.fetch_channel(row["channel_id"])
+            await channel.send(content=f"<@{row['user_id']}>", embed=fire)
+        except discord.HTTPException:
+            try:
+                user = await self.bot.fetch_user(row["user_id"])
+                await user.send(embed=fire)
+            except discord.HTTPException:
+                pass
+
+    async def _reminders_embed(self, user: discord.abc.User) -> discord.Embed:
+        rows = await self.reminder_db.fetchall(
+            "SELECT id, content, due_at FROM reminders WHERE user_id = ? ORDER BY due_at", (user.id,))
+        embed = discord.Embed(title=f"⏰  Reminders — {user.display_name}", colour=ACCENT)
+        if not rows:
+            embed.description = "You have no pending reminders."
+            return embed
+        embed.description = "\n".join(
+            f"`#{r['id']}` <t:{int(r['due_at'])}:R> — {r['content'][:80]}" for r in rows)
+        embed.set_footer(text="Cancel one with remindcancel <id>")
+        return embed
+
+    async def _cancel_reminder(self, user_id: int, reminder_id: int) -> discord.Embed:
+        if reminder_id not in self.reminders_by_user.get(user_id, ()):
+            return discord.Embed(description=f"❌ You have no pending reminder **#{reminder_id}**.", colour=discord.Colour.red())
+        self.reminder_scheduler.cancel(reminder_id)
+        self._forget_reminder(user_id, reminder_id)
+        await self.reminder_db.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+        return discord.Embed(description=f"🗑️ Reminder **#{reminder_id}** cancelled.", colour=discord.Colour.green())
+
     @commands.command(aliases=["remind", "reminder"])
     async def remindme(self, ctx: CustomContext, time: str, *, reminder: str):
         """ Set a reminder. Format: 10s, 5m, 2h, 1d. Example: !remindme 30m do homework """
         seconds, error = self._parse_time(time)
+        if not error:
+            reminder_id, due, error = await self._add_reminder(ctx.author.id, ctx.channel.id, ctx.guild.id if ctx.guild else None, reminder, seconds)
         if error:
             return await ctx.send(embed=discord.Embed(description=error, colour=discord.Colour.red()))
-        unix = int((datetime.utcnow() + timedelta(seconds=seconds)).timestamp())
-        embed = discord.Embed(title="⏰  Reminder Set", description=f"I'll remind you about:\n> {reminder}", colour=discord.Colour.green())
-        embed.add_field(name="Fires", value=f"<t:{unix}:R>  (<t:{unix}:t>)")
-        embed.set_footer(text="Reminder will be sent in this channel.")
-        await ctx.send(embed=embed)
-        await asyncio.sleep(seconds)
-        fire = discord.Embed(title="⏰  Reminder!", description=f"> {reminder}", colour=ACCENT)
-        fire.set_footer(text=f"Set {time} ago")
-        await ctx.send(content=ctx.author.mention, embed=fire)
+        await ctx.send(embed=self._reminder_set_embed(reminder_id, reminder, due))
 
     @app_commands.command(name="remindme", description="Set a reminder. Format: 10s, 5m, 2h, 1d.")
     @app_commands.describe(time="Time until reminder (e.g. 30m, 2h, 1d)", reminder="What to remind you about")
     async def slash_remindme(self, interaction: discord.Interaction, time: str, reminder: str):
         seconds, error = self._parse_time(time)
+        if not error:
+            reminder_id, due, error = await self._add_reminder(interaction.user.id, interaction.channel_id, interaction.guild_id, reminder, seconds)
         if error:
             return await interaction.response.send_message(embed=discord.Embed(description=error, colour=discord.Colour.red()), ephemeral=True)
-        unix = int((datetime.utcnow() + timedelta(seconds=seconds)).timestamp())
-        embed = discord.Embed(title="⏰  Reminder Set", description=f"I'll remind you about:\n> {reminder}", colour=discord.Colour.green())
-        embed.add_field(name="Fires", value=f"<t:{unix}:R>  (<t:{unix}:t>)")
-        embed.set_footer(text="Reminder will be sent in this channel.")
-        await interaction.response.send_message(embed=embed)
-        await asyncio.sleep(seconds)
-        fire = discord.Embed(title="⏰  Reminder!", description=f"> {reminder}", colour=ACCENT)
-        fire.set_footer(text=f"Set {time} ago")
-        await interaction.followup.send(content=interaction.user.mention, embed=fire)
+        await interaction.response.send_message(embed=self._reminder_set_embed(reminder_id, reminder, due))
+
+    @commands.command(aliases=["myreminders"])
+    async def reminders(self, ctx: CustomContext):
+        """ List your pending reminders. """
+        await ctx.send(embed=await self._reminders_embed(ctx.author))
+
+    @app_commands.command(name="reminders", description="List your pending reminders.")
+    async def slash_reminders(self, interaction: discord.Interaction):
+        await interaction.response.send_message(embed=await self._reminders_embed(interaction.user), ephemeral=True)
+
+    @commands.command(aliases=["cancelreminder", "delreminder"])
+    async def remindcancel(self, ctx: CustomContext, reminder_id: int):
+        """ Cancel one of your pending reminders by its ID. """
+        await ctx.send(embed=await self._cancel_reminder(ctx.author.id, reminder_id))
+
+    @app_commands.command(name="remindcancel", description="Cancel one of your pending reminders.")
+    @app_commands.describe(reminder_id="The reminder ID shown by /reminders")
+    async def slash_remindcancel(self, interaction: discord.Interaction, reminder_id: int):
+        await interaction.response.send_message(embed=await self._cancel_reminder(interaction.user.id, reminder_id), ephemeral=True)
 
     # ── Tic Tac Toe ────────────────────────────────────────────
 
@@ -301,24 +761,14 @@ class Extras(commands.Cog):
     @commands.cooldown(rate=1, per=5.0, type=commands.BucketType.user)
     async def trivia(self, ctx: CustomContext):
         """ Answer a random trivia question! """
-        async with ctx.channel.typing():
-            try:
-                data = await fetch_trivia()
-            except Exception:
-                return await ctx.send(embed=discord.Embed(description="❌ Could not reach the trivia API.", colour=discord.Colour.red()))
-        embed, view = trivia_embed_and_view(data, ctx.author.id)
+        embed, view = trivia_embed_and_view(self.trivia_pool.take(), ctx.author.id)
         view.message = await ctx.send(embed=embed, view=view)
 
     @app_commands.command(name="trivia", description="Answer a random trivia question!")
     async def slash_trivia(self, interaction: discord.Interaction):
-        await interaction.response.defer()
-        try:
-            data = await fetch_trivia()
-        except Exception:
-            return await interaction.followup.send(embed=discord.Embed(description="❌ Could not reach the trivia API.", colour=discord.Colour.red()))
-        embed, view = trivia_embed_and_view(data, interaction.user.id)
-        msg = await interaction.followup.send(embed=embed, view=view)
-        view.message = msg
+        embed, view = trivia_embed_and_view(self.trivia_pool.take(), interaction.user.id)
+        await interaction.response.send_message(embed=embed, view=view)
+        view.message = await interaction.original_response()
 
     # ── Autorole listener ──────────────────────────────────────
 
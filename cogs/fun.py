@@ -3,8 +3,11 @@ import discord
 import secrets
 import asyncio
 import aiohttp
+import time
 
+from collections import deque
 from io import BytesIO
+from urllib.parse import quote
 from utils.default import CustomContext
 from discord.ext import commands
 from discord import app_commands
@@ -12,11 +15,94 @@ from utils import permissions, http
 from utils.data import DiscordBot
 
 ACCENT = discord.Colour.from_str("#5865F2")
+URBAN_TTL = 600      # seconds a definition is served from cache
+URBAN_STALE = 3600   # ...and how long after that it may be served while refreshing
+
+# ─── Random image pools ─────────────────────────────────────────
+IMAGE_SOURCES = {
+    "duck":   ("https://random-d.uk/api/v1/random", "url"),
+    "coffee": ("https://coffee.alexflipnote.dev/random.json", "file"),
+    "cat":    ("https://api.alexflipnote.dev/cats", "file"),
+    "dog":    ("https://api.alexflipnote.dev/dogs", "file"),
+}
+IMAGE_POOL_MIN = 3           # URLs kept ready even when nobody is asking
+IMAGE_POOL_MAX = 30
+IMAGE_DEMAND_WINDOW = 300    # seconds of requests used to size each pool
+IMAGE_FETCH_CONCURRENCY = 3  # background fetches in flight across all sources
+IMAGE_RETRY_DELAY = 30       # seconds to wait before refilling after a failed round
+
+
+class ImagePool:
+    """ Pre-fetched image URLs for one API, topped up in the background to match recent demand. """
+
+    def __init__(self, url: str, key: str, semaphore: asyncio.Semaphore):
+        self.url = url
+        self.key = key
+        self.semaphore = semaphore
+        self.urls: deque[str] = deque()
+        self.demand: deque[float] = deque()
+        self.next_fetch = 0.0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def target(self) -> int:
+        # Roughly two minutes' worth of the current request rate, on top of the floor
+        per_minute = len(self.demand) * 60 / IMAGE_DEMAND_WINDOW
+        return min(IMAGE_POOL_MAX, IMAGE_POOL_MIN + round(per_minute * 2))
+
+    async def fetch(self) -> str | None:
+        try:
+            r = await http.get(self.url, res_method="json")
+            return r.response[self.key]
+        except Exception:
+            return None
+
+    async def take(self) -> str | None:
+        """ A pooled URL if one is ready, otherwise a live fetch. """
+        now = time.monotonic()
+        self.demand.append(now)
+        while self.demand[0] < now - IMAGE_DEMAND_WINDOW:
+            self.demand.popleft()
+        url = self.urls.popleft() if self.urls else None
+        self.refill()
+        return url or await self.fetch()
+
+    def refill(self):
+        if (self._task is None or self._task.done()) and time.monotonic() >= self.next_fetch and len(self.urls) < self.target:
+            self._task = asyncio.create_task(self._fill())
+
+    async def _fetch_bounded(self) -> str | None:
+        async with self.semaphore:
+            return await self.fetch()
+
+    async def _fill(self):
+        while len(self.urls) < self.target:
+            wanted = min(self.target - len(self.urls), IMAGE_FETCH_CONCURRENCY)
+            results = await asyncio.gather(*(self._fetch_bounded() for _ in range(wanted)))
+            fresh = [url for url in results if url and url not in self.urls]
+            if not fresh:
+                self.next_fetch = time.monotonic() + IMAGE_RETRY_DELAY
+                return
+            self.urls.extend(fresh)
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
 
 
 class Fun_Commands(commands.Cog):
     def __init__(self, bot):
         self.bot: DiscordBot = bot
+        semaphore = asyncio.Semaphore(IMAGE_FETCH_CONCURRENCY)
+        self.image_pools = {name: ImagePool(url, key, semaphore) for name, (url, key) in IMAGE_SOURCES.items()}
+
+    async def cog_load(self):
+        for pool in self.image_pools.values():
+            pool.refill()
+
+    async def cog_unload(self):
+        for pool in self.image_pools.values():
+            pool.close()
 
     # ── 8ball ──────────────────────────────────────────────────────────
 
@@ -46,15 +132,8 @@ class Fun_Commands(commands.Cog):
 
     # ── Random image helpers ───────────────────────────────────────────
 
-    async def _fetch_image(self, url: str, *keys) -> str | None:
-        try:
-            r = await http.get(url, res_method="json")
-            result = r.response
-            for k in keys:
-                result = result[k]
-            return result
-        except Exception:
-            return None
+    async def _random_image(self, source: str) -> str | None:
+        return await self.image_pools[source].take()
 
     # ── Duck ──────────────────────────────────────────────────────────
 
@@ -62,12 +141,12 @@ class Fun_Commands(commands.Cog):
     @commands.cooldown(1, 1.5, commands.BucketType.user)
     async def duck(self, ctx: CustomContext):
         """ Posts a random duck 🦆 """
-        url = await self._fetch_image("https://random-d.uk/api/v1/random", "url")
+        url = await self._random_image("duck")
         await ctx.send(url or "❌ API seems down.")
 
     @app_commands.command(name="duck", description="Posts a random duck 🦆")
     async def slash_duck(self, interaction: discord.Interaction):
-        url = await self._fetch_image("https://random-d.uk/api/v1/random", "url")
+        url = await self._random_image("duck")
         await interaction.response.send_message(url or "❌ API seems down.")
 
     # ── Coffee ────────────────────────────────────────────────────────
@@ -76,12 +155,12 @@ class Fun_Commands(commands.Cog):
     @commands.cooldown(1, 1.5, commands.BucketType.user)
     async def coffee(self, ctx: CustomContext):
         """ Posts a random coffee ☕ """
-        url = await self._fetch_image("https://coffee.alexflipnote.dev/random.json", "file")
+        url = await self._random_image("coffee")
         await ctx.send(url or "❌ API seems down.")
 
     @app_commands.command(name="coffee", description="Posts a random coffee ☕")
     async def slash_coffee(self, interaction: discord.Interaction):
-        url = await self._fetch_image("https://coffee.alexflipnote.dev/random.json", "file")
+        url = await self._random_image("coffee")
         await interaction.response.send_message(url or "❌ API seems down.")
 
     # ── Cat ───────────────────────────────────────────────────────────
@@ -90,12 +169,12 @@ class Fun_Commands(commands.Cog):
     @commands.cooldown(1, 1.5, commands.BucketType.user)
     async def cat(self, ctx: CustomContext):
         """ Posts a random cat 🐱 """
-        url = await self._fetch_image("https://api.alexflipnote.dev/cats", "file")
+        url = await self._random_image("cat")
         await ctx.send(url or "❌ API seems down.")
 
     @app_commands.command(name="cat", description="Posts a random cat 🐱")
     async def slash_cat(self, interaction: discord.Interaction):
-        url = await self._fetch_image("https://api.alexflipnote.dev/cats", "file")
+        url = await self._random_image("cat")
         await interaction.response.send_message(url or "❌ API seems down.")
 
     # ── Dog ───────────────────────────────────────────────────────────
@@ -104,12 +183,12 @@ class Fun_Commands(commands.Cog):
     @commands.cooldown(1, 1.5, commands.BucketType.user)
     async def dog(self, ctx: CustomContext):
         """ Posts a random dog 🐶 """
-        url = await self._fetch_image("https://api.alexflipnote.dev/dogs", "file")
+        url = await self._random_image("dog")
         await ctx.send(url or "❌ API seems down.")
 
     @app_commands.command(name="dog", description="Posts a random dog 🐶")
     async def slash_dog(self, interaction: discord.Interaction):
-        url = await self._fetch_image("https://api.alexflipnote.dev/dogs", "file")
+        url = await self._random_image("dog")
         await interaction.response.send_message(url or "❌ API seems down.")
 
     # ── Coinflip ──────────────────────────────────────────────────────
@@ -153,7 +232,7 @@ class Fun_Commands(commands.Cog):
 
     async def _urban_embed(self, search: str) -> discord.Embed:
         try:
-            r = await http.get(f"https://api.urbandictionary.com/v0/define?term={search}", res_method="json")
+            r = await http.cached_get(f"https://api.urbandictionary.com/v0/define?term={quote(search)}", res_method="json", ttl=URBAN_TTL, stale=URBAN_STALE)
         except Exception:
             return discord.Embed(description="❌ Urban Dictionary API is unavailable.", colour=discord.Colour.red())
         if not r.response or not r.response["list"]:
@@ -8,6 +8,10 @@ from discord.ext import commands
 from discord import app_commands
 from utils import default, http
 from utils.data import DiscordBot
+from urllib.parse import quote
+
+COVID_TTL = 900      # disease.sh refreshes its country data every ~10 minutes
+COVID_STALE = 3600
 
 
 class Information(commands.Cog):
@@ -66,7 +70,10 @@ class Information(commands.Cog):
     # ── COVID ─────────────────────────────────────────────────────────
 
     async def _covid_embed(self, country: str) -> discord.Embed:
-        r = await http.get(f"https://disease.sh/v3/covid-19/countries/{country.lower()}", res_method="json")
+        try:
+            r = await http.cached_get(f"https://disease.sh/v3/covid-19/countries/{quote(country.lower())}", res_method="json", ttl=COVID_TTL, stale=COVID_STALE)
+        except Exception:
+            return discord.Embed(description="❌ COVID-19 API is unavailable.", colour=discord.Colour.red())
         if "message" in r.response:
             return discord.Embed(description=f"❌ {r.response['message']}", colour=discord.Colour.red())
         d = r.response
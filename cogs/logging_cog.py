@@ -1,16 +1,29 @@
+import aiohttp
+import asyncio
 import discord
 import json
 import os
+import random
+import time
 
+from collections import deque
 from datetime import datetime
 from discord.ext import commands
 from discord import app_commands
 from utils.default import CustomContext
 from utils.data import DiscordBot
-from utils import permissions
+from utils import permissions, http
 
 LOG_FILE = "data/log_channels.json"
 
+MAX_BATCH = 10             # Discord allows at most 10 embeds per message
+MAX_BATCH_CHARS = 6000     # ...and 6000 embed characters in total
+FLUSH_DELAY = 2.0          # seconds an event may wait for others to share its message
+MAX_DEPTH = 200            # events held per channel before the oldest are dropped
+SEND_BACKOFF_BASE = 1.0    # seconds; full-jitter exponential backoff after a failed send...
+SEND_BACKOFF_MAX = 60.0    # ...capped at this
+WEBHOOK_NAME = "Server Logs"
+
 
 def load_log_channels() -> dict:
     if not os.path.exists("data"):
@@ -27,19 +40,178 @@ def save_log_channels(data: dict):
         json.dump(data, f, indent=2)
 
 
-def get_log_channel(bot, guild_id: int):
-    data = load_log_channels()
-    channel_id = data.get(str(guild_id))
-    return bot.get_channel(channel_id) if channel_id else None
-
-
 def log_embed(title: str, colour: discord.Colour) -> discord.Embed:
     return discord.Embed(title=title, colour=colour, timestamp=datetime.utcnow())
 
 
+class LogQueue:
+    """ Per-channel log delivery: packs queued embeds into as few messages as possible. """
+
+    def __init__(self, send, *, flush_delay: float = FLUSH_DELAY, max_depth: int = MAX_DEPTH):
+        self.send = send
+        self.flush_delay = flush_delay
+        self.max_depth = max_depth
+        self.pending: dict[int, deque] = {}
+        self.channels: dict[int, discord.abc.Messageable] = {}
+        self.dropped: dict[int, int] = {}
+        self._wake: dict[int, asyncio.Event] = {}
+        self._tasks: dict[int, asyncio.Task] = {}
+        self.total_dropped = 0
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.latencies = deque(maxlen=200)
+
+    def push(self, channel, embed: discord.Embed):
+        queue = self.pending.setdefault(channel.id, deque())
+        if len(queue) >= self.max_depth:
+            queue.popleft()
+            self.dropped[channel.id] = self.dropped.get(channel.id, 0) + 1
+            self.total_dropped += 1
+        queue.append((time.monotonic(), embed))
+        self.channels[channel.id] = channel
+
+        task = self._tasks.get(channel.id)
+        if task is None or task.done():
+            self._wake[channel.id] = asyncio.Event()
+            self._tasks[channel.id] = asyncio.create_task(self._drain(channel.id))
+        elif len(queue) >= MAX_BATCH:
+            self._wake[channel.id].set()
+
+    def _take(self, channel_id: int) -> tuple[list, list, int]:
+        queue = self.pending[channel_id]
+        embeds, enqueued_at, size = [], [], 0
+        dropped = self.dropped.pop(channel_id, 0)
+        if dropped:
+            notice = log_embed(f"⚠️  {dropped} log event{'s' if dropped != 1 else ''} dropped", discord.Colour.dark_orange())
+            embeds.append(notice)
+            size += len(notice)
+        while queue and len(embeds) < MAX_BATCH:
+            enqueued, embed = queue[0]
+            if embeds and size + len(embed) > MAX_BATCH_CHARS:
+                break
+            queue.popleft()
+            embeds.append(embed)
+            enqueued_at.append(enqueued)
+            size += len(embed)
+        return embeds, enqueued_at, dropped
+
+    async def _drain(self, channel_id: int):
+        queue = self.pending[channel_id]
+        wake = self._wake[channel_id]
+        failures = 0
+        while queue:
+            if len(queue) < MAX_BATCH:
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), max(0.0, queue[0][0] + self.flush_delay - time.monotonic()))
+                except asyncio.TimeoutError:
+                    pass
+            embeds, enqueued_at, dropped = self._take(channel_id)
+            try:
+                await self.send(self.channels[channel_id], embeds)
+            except discord.HTTPException:
+                # The batch is lost; count it, and carry the earlier drop notice over to the next batch
+                self.dropped[channel_id] = self.dropped.get(channel_id, 0) + dropped + len(enqueued_at)
+                self.total_dropped += len(enqueued_at)
+                # Back off so an outage or a deleted channel isn't hammered with every queued batch
+                failures += 1
+                await asyncio.sleep(random.uniform(0, min(SEND_BACKOFF_MAX, SEND_BACKOFF_BASE * 2 ** failures)))
+                continue
+            failures = 0
+            now = time.monotonic()
+            self.sent_messages += 1
+            self.sent_embeds += len(embeds)
+            self.latencies.extend(now - t for t in enqueued_at)
+        del self.pending[channel_id], self.channels[channel_id], self._wake[channel_id], self._tasks[channel_id]
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self.pending),
+            "depth": sum(len(q) for q in self.pending.values()),
+            "sent_messages": self.sent_messages,
+            "sent_embeds": self.sent_embeds,
+            "dropped": self.total_dropped,
+            "avg_latency": sum(self.latencies) / len(self.latencies) if self.latencies else 0.0,
+            "max_latency": max(self.latencies, default=0.0),
+        }
+
+    def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+
+
+class WebhookSink:
+    """ Posts log batches through one cached webhook per channel, off the bot's own message buckets. """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.webhooks: dict[int, discord.Webhook] = {}
+        self.unavailable: set[int] = set()
+
+    async def _webhook(self, channel: discord.TextChannel) -> discord.Webhook:
+        webhook = self.webhooks.get(channel.id)
+        if webhook is not None:
+            return webhook
+        found = next((w for w in await channel.webhooks() if w.user == self.bot.user and w.token), None)
+        if found is None:
+            found = await channel.create_webhook(name=WEBHOOK_NAME, reason="Log delivery")
+        webhook = discord.Webhook.from_url(found.url, session=http.session())
+        self.webhooks[channel.id] = webhook
+        return webhook
+
+    async def send(self, channel: discord.TextChannel, embeds: list):
+        if channel.id not in self.unavailable:
+            for _ in range(2):
+                try:
+                    webhook = await self._webhook(channel)
+                    return await webhook.send(embeds=embeds, username=self.bot.user.name, avatar_url=self.bot.user.display_avatar.url)
+                except discord.NotFound:
+                    # Someone deleted the webhook; forget it and create a fresh one
+                    self.webhooks.pop(channel.id, None)
+                except discord.Forbidden:
+                    self.unavailable.add(channel.id)
+                    break
+                except (discord.HTTPException, aiohttp.ClientError):
+                    break
+        await channel.send(embeds=embeds)
+
+    def forget(self, channel_id: int):
+        self.webhooks.pop(channel_id, None)
+        self.unavailable.discard(channel_id)
+
+
 class Logging(commands.Cog):
     def __init__(self, bot):
         self.bot: DiscordBot = bot
+        self.routes: dict[int, int] = {}
+        self.queue = LogQueue(self._deliver)
+        self.sink = WebhookSink(bot) if getattr(bot.config, "discord_log_webhooks", False) else None
+
+    async def cog_load(self):
+        data = await asyncio.to_thread(load_log_channels)
+        self.routes = {int(guild_id): channel_id for guild_id, channel_id in data.items()}
+
+    async def cog_unload(self):
+        self.queue.close()
+
+    async def _deliver(self, channel, embeds: list):
+        if self.sink:
+            return await self.sink.send(channel, embeds)
+        await channel.send(embeds=embeds)
+
+    def get_log_channel(self, guild_id: int):
+        channel_id = self.routes.get(guild_id)
+        return self.bot.get_channel(channel_id) if channel_id else None
+
+    async def _set_route(self, guild_id: int, channel_id: int = None):
+        if self.sink and guild_id in self.routes:
+            self.sink.forget(self.routes[guild_id])
+        if channel_id is None:
+            self.routes.pop(guild_id, None)
+        else:
+            self.routes[guild_id] = channel_id
+        data = {str(g): c for g, c in self.routes.items()}
+        await asyncio.to_thread(save_log_channels, data)
 
     # ── Setup ──────────────────────────────────────────────────────────
 
@@ -49,9 +221,7 @@ class Logging(commands.Cog):
     async def setlog(self, ctx: CustomContext, channel: discord.TextChannel = None):
         """ Set the log channel for this server. """
         channel = channel or ctx.channel
-        data = load_log_channels()
-        data[str(ctx.guild.id)] = channel.id
-        save_log_channels(data)
+        await self._set_route(ctx.guild.id, channel.id)
         embed = discord.Embed(title="✅  Log Channel Set", colour=discord.Colour.green(),
             description=f"Events will now be logged in {channel.mention}.")
         await ctx.send(embed=embed)
@@ -61,9 +231,7 @@ class Logging(commands.Cog):
     @permissions.has_permissions(manage_guild=True)
     async def unsetlog(self, ctx: CustomContext):
         """ Disable logging for this server. """
-        data = load_log_channels()
-        data.pop(str(ctx.guild.id), None)
-        save_log_channels(data)
+        await self._set_route(ctx.guild.id)
         embed = discord.Embed(title="🗑️  Logging Disabled", colour=discord.Colour.orange(),
             description="Log channel removed. No events will be logged.")
         await ctx.send(embed=embed)
@@ -73,9 +241,7 @@ class Logging(commands.Cog):
     @app_commands.default_permissions(manage_guild=True)
     async def slash_setlog(self, interaction: discord.Interaction, channel: discord.TextChannel = None):
         channel = channel or interaction.channel
-        data = load_log_channels()
-        data[str(interaction.guild_id)] = channel.id
-        save_log_channels(data)
+        await self._set_route(interaction.guild_id, channel.id)
         embed = discord.Embed(title="✅  Log Channel Set", colour=discord.Colour.green(),
             description=f"Events will now be logged in {channel.mention}.")
         await interaction.response.send_message(embed=embed)
@@ -83,20 +249,35 @@ class Logging(commands.Cog):
     @app_commands.command(name="unsetlog", description="Disable logging for this server.")
     @app_commands.default_permissions(manage_guild=True)
     async def slash_unsetlog(self, interaction: discord.Interaction):
-        data = load_log_channels()
-        data.pop(str(interaction.guild_id), None)
-        save_log_channels(data)
+        await self._set_route(interaction.guild_id)
         embed = discord.Embed(title="🗑️  Logging Disabled", colour=discord.Colour.orange(),
             description="Log channel removed. No events will be logged.")
         await interaction.response.send_message(embed=embed)
 
+    @commands.command()
+    @commands.check(permissions.is_owner)
+    async def logstats(self, ctx: CustomContext):
+        """ Show log delivery queue statistics. """
+        stats = self.queue.stats()
+        embed = discord.Embed(title="📋  Log Delivery", colour=discord.Colour.blurple())
+        embed.add_field(name="📥 Queued",      value=f"**{stats['depth']}** event(s) in **{stats['channels']}** channel(s)", inline=False)
+        embed.add_field(name="📤 Delivered",   value=f"**{stats['sent_embeds']}** embed(s) in **{stats['sent_messages']}** message(s)", inline=True)
+        embed.add_field(name="🗑️ Dropped",     value=f"**{stats['dropped']}**", inline=True)
+        embed.add_field(name="⏱️ Flush Latency", value=f"avg `{stats['avg_latency']:.2f}s` • max `{stats['max_latency']:.2f}s`", inline=False)
+        await ctx.send(embed=embed)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if self.routes.get(channel.guild.id) == channel.id:
+            await self._set_route(channel.guild.id)
+
     # ── Messages ───────────────────────────────────────────────────────
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message):
         if not message.guild or message.author.bot:
             return
-        ch = get_log_channel(self.bot, message.guild.id)
+        ch = self.get_log_channel(message.guild.id)
         if not ch:
             return
         embed = log_embed("🗑️  Message Deleted", discord.Colour.red())
@@ -107,13 +288,13 @@ class Logging(commands.Cog):
             content = message.content[:1021] + "..." if len(message.content) > 1024 else message.content
             embed.add_field(name="📝 Content", value=content, inline=False)
         embed.set_footer(text=f"User ID: {message.author.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message):
         if not before.guild or before.author.bot or before.content == after.content:
             return
-        ch = get_log_channel(self.bot, before.guild.id)
+        ch = self.get_log_channel(before.guild.id)
         if not ch:
             return
         embed = log_embed("✏️  Message Edited", discord.Colour.gold())
@@ -124,13 +305,13 @@ class Logging(commands.Cog):
         embed.add_field(name="Before", value=before.content[:512] or "*empty*", inline=False)
         embed.add_field(name="After",  value=after.content[:512]  or "*empty*", inline=False)
         embed.set_footer(text=f"User ID: {before.author.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     # ── Members ────────────────────────────────────────────────────────
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
-        ch = get_log_channel(self.bot, member.guild.id)
+        ch = self.get_log_channel(member.guild.id)
         if not ch:
             return
         age_days = (datetime.utcnow() - member.created_at.replace(tzinfo=None)).days
@@ -142,11 +323,11 @@ class Logging(commands.Cog):
         embed.add_field(name="📅 Account Age",  value=f"<t:{int(member.created_at.timestamp())}:R>{new_flag}", inline=True)
         embed.add_field(name="👥 Member Count", value=str(member.guild.member_count),                          inline=True)
         embed.set_footer(text=f"User ID: {member.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
-        ch = get_log_channel(self.bot, member.guild.id)
+        ch = self.get_log_channel(member.guild.id)
         if not ch:
             return
 
@@ -161,7 +342,7 @@ class Logging(commands.Cog):
                     embed.add_field(name="🛡️ Moderator", value=str(entry.user),                        inline=True)
                     embed.add_field(name="📝 Reason",    value=entry.reason or "No reason provided",   inline=False)
                     embed.set_footer(text=f"User ID: {member.id}")
-                    await ch.send(embed=embed)
+                    self.queue.push(ch, embed)
                     return
         except discord.Forbidden:
             pass
@@ -177,13 +358,13 @@ class Logging(commands.Cog):
         if roles:
             embed.add_field(name="🎭 Roles", value=", ".join(roles)[:1024], inline=False)
         embed.set_footer(text=f"User ID: {member.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     # ── Bans ───────────────────────────────────────────────────────────
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User):
-        ch = get_log_channel(self.bot, guild.id)
+        ch = self.get_log_channel(guild.id)
         if not ch:
             return
         moderator = "Unknown"
@@ -203,11 +384,11 @@ class Logging(commands.Cog):
         embed.add_field(name="🛡️ Moderator", value=moderator,                   inline=True)
         embed.add_field(name="📝 Reason",    value=reason,                      inline=False)
         embed.set_footer(text=f"User ID: {user.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User):
-        ch = get_log_channel(self.bot, guild.id)
+        ch = self.get_log_channel(guild.id)
         if not ch:
             return
         moderator = "Unknown"
@@ -224,13 +405,13 @@ class Logging(commands.Cog):
         embed.add_field(name="👤 User",      value=f"`{user}`", inline=True)
         embed.add_field(name="🛡️ Moderator", value=moderator,  inline=True)
         embed.set_footer(text=f"User ID: {user.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     # ── Member Updates (nickname + roles + mute detection) ────────────
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
-        ch = get_log_channel(self.bot, before.guild.id)
+        ch = self.get_log_channel(before.guild.id)
         if not ch:
             return
 
@@ -242,32 +423,38 @@ class Logging(commands.Cog):
             embed.add_field(name="Before",    value=before.nick or "*None*", inline=True)
             embed.add_field(name="After",     value=after.nick  or "*None*", inline=True)
             embed.set_footer(text=f"User ID: {after.id}")
-            await ch.send(embed=embed)
+            self.queue.push(ch, embed)
 
         # Role changes
         added   = [r for r in after.roles  if r not in before.roles]
         removed = [r for r in before.roles if r not in after.roles]
 
-        # Mute/unmute detection via Muted role
-        for role in added:
-            if role.name == "Muted":
-                embed = log_embed("🔇  Member Muted", discord.Colour.orange())
-                embed.set_author(name=str(after), icon_url=after.display_avatar.url)
-                embed.add_field(name="👤 Member", value=f"{after.mention}\n`{after}`", inline=True)
-                embed.set_footer(text=f"User ID: {after.id}")
-                await ch.send(embed=embed)
-
-        for role in removed:
-            if role.name == "Muted":
-                embed = log_embed("🔊  Member Unmuted", discord.Colour.green())
-                embed.set_author(name=str(after), icon_url=after.display_avatar.url)
-                embed.add_field(name="👤 Member", value=f"{after.mention}\n`{after}`", inline=True)
-                embed.set_footer(text=f"User ID: {after.id}")
-                await ch.send(embed=embed)
-
-        # General role add/remove (excluding Muted which is handled above)
-        other_added   = [r for r in added   if r.name != "Muted"]
-        other_removed = [r for r in removed if r.name != "Muted"]
+        # Mute/unmute detection: the Moderator cog's cached muted role ID, and native timeouts
+        mod = self.bot.get_cog("Moderator")
+        muted_id = mod.muted_role_id(after.guild) if mod else None
+        muted   = any(r.id == muted_id for r in added)
+        unmuted = any(r.id == muted_id for r in removed)
+        if muted or unmuted:
+            embed = log_embed("🔇  Member Muted" if muted else "🔊  Member Unmuted", discord.Colour.orange() if muted else discord.Colour.green())
+            embed.set_author(name=str(after), icon_url=after.display_avatar.url)
+            embed.add_field(name="👤 Member", value=f"{after.mention}\n`{after}`", inline=True)
+            embed.set_footer(text=f"User ID: {after.id}")
+            self.queue.push(ch, embed)
+
+        if before.timed_out_until != after.timed_out_until:
+            until = after.timed_out_until
+            timed_out = until is not None and until > discord.utils.utcnow()
+            embed = log_embed("⏳  Member Timed Out" if timed_out else "✅  Timeout Lifted", discord.Colour.orange() if timed_out else discord.Colour.green())
+            embed.set_author(name=str(after), icon_url=after.display_avatar.url)
+            embed.add_field(name="👤 Member", value=f"{after.mention}\n`{after}`", inline=True)
+            if timed_out:
+                embed.add_field(name="⏳ Until", value=f"<t:{int(until.timestamp())}:F> (<t:{int(until.timestamp())}:R>)", inline=True)
+            embed.set_footer(text=f"User ID: {after.id}")
+            self.queue.push(ch, embed)
+
+        # General role add/remove (excluding the muted role, handled above)
+        other_added   = [r for r in added   if r.id != muted_id]
+        other_removed = [r for r in removed if r.id != muted_id]
         if other_added or other_removed:
             embed = log_embed("🎭  Roles Updated", discord.Colour.blurple())
             embed.set_author(name=str(after), icon_url=after.display_avatar.url)
@@ -277,13 +464,13 @@ class Logging(commands.Cog):
             if other_removed:
                 embed.add_field(name="➖ Removed", value=", ".join(r.mention for r in other_removed), inline=False)
             embed.set_footer(text=f"User ID: {after.id}")
-            await ch.send(embed=embed)
+            self.queue.push(ch, embed)
 
     # ── Channel Updates ────────────────────────────────────────────────
 
     @commands.Cog.listener()
     async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
-        ch = get_log_channel(self.bot, before.guild.id)
+        ch = self.get_log_channel(before.guild.id)
         if not ch:
             return
         changes = []
@@ -298,7 +485,7 @@ class Logging(commands.Cog):
         embed = log_embed("📺  Channel Updated", discord.Colour.blurple())
         embed.add_field(name="📺 Channel", value=after.mention,        inline=True)
         embed.add_field(name="📝 Changes", value="\n".join(changes),   inline=False)
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
     # ── Voice ──────────────────────────────────────────────────────────
 
@@ -306,7 +493,7 @@ class Logging(commands.Cog):
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         if before.channel == after.channel:
             return
-        ch = get_log_channel(self.bot, member.guild.id)
+        ch = self.get_log_channel(member.guild.id)
         if not ch:
             return
 
@@ -326,7 +513,7 @@ class Logging(commands.Cog):
 
         embed.set_author(name=str(member), icon_url=member.display_avatar.url)
         embed.set_footer(text=f"User ID: {member.id}")
-        await ch.send(embed=embed)
+        self.queue.push(ch, embed)
 
 
 async def setup(bot):
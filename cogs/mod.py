@@ -1,12 +1,22 @@
 import discord
 import re
 import asyncio
+import datetime
+import time
+import typing
 
+from collections import Counter
+from io import BytesIO
 from discord.ext import commands
 from discord import app_commands
 from utils.default import CustomContext
 from utils.data import DiscordBot
 from utils import permissions, default
+from utils.search import MemberIndex, top_matches
+from utils.db import Database
+from utils.purge import PurgeJob, ReactionClearJob, PurgeError
+from utils.filters import MessageFilter, FilterError
+from utils.scheduler import Scheduler
 
 COL_SUCCESS = discord.Colour.green()
 COL_ERROR   = discord.Colour.red()
@@ -14,6 +24,96 @@ COL_WARN    = discord.Colour.orange()
 COL_INFO    = discord.Colour.blurple()
 COL_MOD     = discord.Colour.from_str("#E74C3C")
 
+MASSBAN_CHUNK = 200            # users per bulk-ban request (Discord's limit)
+MASSBAN_MAX = 5000
+MASSBAN_CONCURRENCY = 5        # single bans in flight when the bulk endpoint refuses someone
+MASSBAN_FILE_MAX = 1024 * 1024
+MASSBAN_INLINE = 20            # reports longer than this are attached as a file
+PROGRESS_INTERVAL = 2.0
+SNOWFLAKE_RE = re.compile(r"\b\d{15,20}\b")
+
+MOD_DB = "data/mod.db"
+MOD_SCHEMA = """
+CREATE TABLE IF NOT EXISTS purge_checkpoints (
+    channel_id  INTEGER PRIMARY KEY,
+    guild_id    INTEGER NOT NULL,
+    author_id   INTEGER NOT NULL,
+    spec        TEXT NOT NULL,
+    scan_limit  INTEGER NOT NULL,
+    scanned     INTEGER NOT NULL,
+    deleted     INTEGER NOT NULL,
+    cursor_id   INTEGER NOT NULL,
+    after_id    INTEGER,
+    updated_at  REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS lockdowns (
+    guild_id    INTEGER PRIMARY KEY,
+    author_id   INTEGER NOT NULL,
+    reason      TEXT,
+    started_at  REAL NOT NULL
+);
+
+-- @everyone's overwrite in each channel before the lockdown; allow/deny are NULL when there was none
+CREATE TABLE IF NOT EXISTS lockdown_overwrites (
+    guild_id    INTEGER NOT NULL,
+    channel_id  INTEGER NOT NULL,
+    allow       INTEGER,
+    deny        INTEGER,
+    PRIMARY KEY (guild_id, channel_id)
+);
+
+-- Temporary mutes and bans, lifted by the expiry scheduler; action is 'mute' or 'ban'
+CREATE TABLE IF NOT EXISTS mod_expiries (
+    guild_id     INTEGER NOT NULL,
+    user_id      INTEGER NOT NULL,
+    action       TEXT NOT NULL,
+    role_id      INTEGER,
+    moderator_id INTEGER NOT NULL,
+    expires_at   REAL NOT NULL,
+    PRIMARY KEY (guild_id, user_id, action)
+);
+
+-- mute_mode is 'role' (the muted role) or 'timeout' (Discord's native member timeout)
+CREATE TABLE IF NOT EXISTS mod_settings (
+    guild_id      INTEGER PRIMARY KEY,
+    muted_role_id INTEGER,
+    mute_mode     TEXT NOT NULL DEFAULT 'role'
+);
+"""
+
+MUTED_ROLE_NAME = "Muted"      # used when a guild hasn't configured a muted role
+NO_MUTED_ROLE = "No **Muted** role found. Create one named exactly `Muted` or pick one with `muteconfig role`."
+
+EXPIRY_CONCURRENCY = 5         # mutes/bans lifted at once when a batch comes due
+EXPIRY_RETRY = 300             # seconds before retrying an expiry Discord refused with a server error
+TIMEOUT_MAX = 28 * 86400       # Discord's longest timeout
+
+LOCKDOWN_CONCURRENCY = 5       # channel permission edits in flight
+LOCKDOWN_FAILURES_SHOWN = 10
+LOCKDOWN_DENY = ("send_messages", "send_messages_in_threads", "create_public_threads", "create_private_threads", "add_reactions")
+
+PURGE_MAX = 50000
+REACTIONS_MAX = 10000
+CUSTOM_EMOJI_RE = re.compile(r"<a?:(.*?):(\d{17,21})>|[\u263a-\U0001f645]")
+
+# Prune filters by name, so a checkpointed purge can rebuild its predicate from "name" or "name:arg"
+PRUNE_FILTERS = {
+    "embeds":   lambda arg: lambda m: len(m.embeds),
+    "files":    lambda arg: lambda m: len(m.attachments),
+    "mentions": lambda arg: lambda m: len(m.mentions) or len(m.role_mentions),
+    "images":   lambda arg: lambda m: len(m.embeds) or len(m.attachments),
+    "all":      lambda arg: lambda m: True,
+    "user":     lambda arg: lambda m: m.author.id == int(arg),
+    "contains": lambda arg: lambda m: arg in m.content,
+    "bots":     lambda arg: lambda m: (m.webhook_id is None and m.author.bot) or m.content.startswith(tuple(arg)),
+    "users":    lambda arg: lambda m: not m.author.bot,
+    "emojis":   lambda arg: lambda m: CUSTOM_EMOJI_RE.search(m.content),
+}
+
+FUZZY_FIELDS = ("name", "nick", "global_name")
+FUZZY_RESULTS = 10
+
 
 def err(text):
     return discord.Embed(description=f"❌  {text}", colour=COL_ERROR)
@@ -30,8 +130,18 @@ class MemberID(commands.Converter):
             try:
                 return int(argument, base=10)
             except ValueError:
-                raise commands.BadArgument(f"`{argument}` is not a valid member or member ID.") from None
-        return m.id
+                pass
+        else:
+            return m.id
+
+        # Typos: MemberID feeds ban/unban/massban, so only suggest the closest names, never act on a guess
+        cog = ctx.bot.get_cog("Moderator")
+        matches = await cog.fuzzy_members(ctx.guild, argument, 3, include_bots=True) if cog and ctx.guild else []
+        if matches:
+            raise default.MemberSuggestions(
+                f"`{argument}` is not a valid member or member ID. Did you mean {', '.join(f'`{m}`' for _, m in matches)}?"
+            )
+        raise commands.BadArgument(f"`{argument}` is not a valid member or member ID.")
 
 
 class ActionReason(commands.Converter):
@@ -41,9 +151,170 @@ class ActionReason(commands.Converter):
         return argument
 
 
+class PurgeView(discord.ui.View):
+    def __init__(self, job: PurgeJob | ReactionClearJob, author_id: int):
+        super().__init__(timeout=None)
+        self.job = job
+        self.author_id = author_id
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id == self.author_id or interaction.permissions.manage_messages:
+            return True
+        await interaction.response.send_message("❌ You can't cancel this prune.", ephemeral=True)
+        return False
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, emoji="⏹️")
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.job.cancel()
+        button.disabled = True
+        button.label = "Cancelling…"
+        await interaction.response.edit_message(view=self)
+
+
 class Moderator(commands.Cog):
     def __init__(self, bot):
         self.bot: DiscordBot = bot
+        self.member_indexes: dict[int, MemberIndex] = {}
+        self.db = Database(MOD_DB, MOD_SCHEMA)
+        self.purges: dict[int, PurgeJob | ReactionClearJob] = {}
+        self.expiries = Scheduler(self._lift_expired)
+        self.mute_settings: dict[int, tuple[int | None, str]] = {}
+        self.muted_roles: dict[int, int | None] = {}
+
+    async def cog_load(self):
+        # Anything that came due while the bot was offline is already past due, so it fires in the first batch
+        for row in await self.db.fetchall("SELECT guild_id, user_id, action, expires_at FROM mod_expiries"):
+            self.expiries.schedule((row["guild_id"], row["user_id"], row["action"]), row["expires_at"])
+        self.expiries.start()
+        for row in await self.db.fetchall("SELECT * FROM mod_settings"):
+            self.mute_settings[row["guild_id"]] = (row["muted_role_id"], row["mute_mode"])
+
+    # ── Member search index ────────────────────────────────────────────
+
+    async def search_members(self, guild: discord.Guild, field: str, query: str) -> list[int]:
+        """ IDs of members whose field contains query, from the guild's lazily built search index. """
+        index = self.member_indexes.get(guild.id)
+        if index is None:
+            index = self.member_indexes[guild.id] = MemberIndex()
+        field_index = await index.ensure_built(field, guild.members)
+        return list(field_index.contains(query))
+
+    async def fuzzy_members(self, guild: discord.Guild, query: str, k: int = FUZZY_RESULTS, include_bots: bool = False) -> list[tuple[float, discord.Member]]:
+        """ The k members whose username, nickname or display name is most similar to query. """
+        index = self.member_indexes.get(guild.id)
+        if index is None:
+            index = self.member_indexes[guild.id] = MemberIndex()
+        score_maps = [(await index.ensure_built(field, guild.members)).similar(query) for field in FUZZY_FIELDS]
+
+        def keep(member_id: int) -> bool:
+            member = guild.get_member(member_id)
+            return member is not None and (include_bots or not member.bot)
+
+        return [(score, guild.get_member(member_id)) for score, member_id in top_matches(score_maps, k, keep)]
+
+    async def cog_unload(self):
+        for index in self.member_indexes.values():
+            index.close()
+        # Running purges stop at their last checkpoint and can be resumed after the reload
+        for job in self.purges.values():
+            job.cancel()
+        self.expiries.close()
+        await self.db.close()
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if index := self.member_indexes.get(member.guild.id):
+            index.add(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        if index := self.member_indexes.get(member.guild.id):
+            index.remove(member.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.nick != after.nick and (index := self.member_indexes.get(after.guild.id)):
+            index.add(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.name == after.name and before.global_name == after.global_name:
+            return
+        for guild in after.mutual_guilds:
+            index = self.member_indexes.get(guild.id)
+            member = guild.get_member(after.id)
+            if index and member:
+                index.add(member)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        if index := self.member_indexes.pop(guild.id, None):
+            index.close()
+        self.muted_roles.pop(guild.id, None)
+
+    # ── Temporary mutes & bans ─────────────────────────────────────────
+
+    async def _set_expiry(self, guild_id: int, user_id: int, action: str, moderator_id: int, seconds: int | None, role_id: int = None) -> float | None:
+        """ Store and schedule when a mute/ban ends; no duration makes it permanent, dropping any earlier expiry. """
+        if not seconds:
+            await self._clear_expiry(guild_id, user_id, action)
+            return None
+        expires_at = time.time() + seconds
+        await self.db.execute(
+            "INSERT OR REPLACE INTO mod_expiries VALUES (?, ?, ?, ?, ?, ?)",
+            (guild_id, user_id, action, role_id, moderator_id, expires_at)
+        )
+        self.expiries.schedule((guild_id, user_id, action), expires_at)
+        return expires_at
+
+    async def _clear_expiry(self, guild_id: int, user_id: int, action: str) -> None:
+        self.expiries.cancel((guild_id, user_id, action))
+        await self.db.execute("DELETE FROM mod_expiries WHERE guild_id = ? AND user_id = ? AND action = ?", (guild_id, user_id, action))
+
+    async def _lift(self, row) -> bool:
+        """ Undo one expired mute/ban; False means Discord had a problem and it should be retried later. """
+        guild = self.bot.get_guild(row["guild_id"])
+        if guild is None:
+            return True
+        if guild.unavailable:
+            return False
+        reason = f"Temporary {row['action']} expired"
+        try:
+            if row["action"] == "ban":
+                await guild.unban(discord.Object(id=row["user_id"]), reason=reason)
+            else:
+                member = guild.get_member(row["user_id"])
+                role = guild.get_role(row["role_id"])
+                if member is not None and role is not None and role in member.roles:
+                    await member.remove_roles(role, reason=reason)
+        except (discord.NotFound, discord.Forbidden):
+            pass
+        except discord.HTTPException:
+            return False
+        return True
+
+    async def _lift_expired(self, keys: list) -> None:
+        await self.bot.wait_until_ready()
+        rows = await self.db.run(lambda conn: [conn.execute(
+            "SELECT * FROM mod_expiries WHERE guild_id = ? AND user_id = ? AND action = ?", key).fetchone() for key in keys])
+        # A mute/ban redone with a new duration since this key was scheduled isn't due; its own entry handles it
+        due = [(key, row) for key, row in zip(keys, rows) if row is not None and row["expires_at"] <= time.time()]
+        semaphore = asyncio.Semaphore(EXPIRY_CONCURRENCY)
+
+        async def lift(row) -> bool:
+            async with semaphore:
+                return await self._lift(row)
+
+        results = await asyncio.gather(*(lift(row) for _, row in due))
+        for (key, _), lifted in zip(due, results):
+            # Redone while the lift was in flight: the new expiry is already scheduled
+            if not lifted and key not in self.expiries:
+                self.expiries.schedule(key, time.time() + EXPIRY_RETRY)
+        # Matching expires_at as well leaves alone any row replaced while the lifts were in flight
+        await self.db.executemany(
+            "DELETE FROM mod_expiries WHERE guild_id = ? AND user_id = ? AND action = ? AND expires_at = ?",
+            [(*key, row["expires_at"]) for (key, row), lifted in zip(due, results) if lifted]
+        )
 
     # ── Kick ──────────────────────────────────────────────────────────
 
@@ -130,11 +401,13 @@ class Moderator(commands.Cog):
 
     # ── Ban ────────────────────────────────────────────────────────────
 
-    def _ban_embed(self, user, moderator, reason):
+    def _ban_embed(self, user, moderator, reason, expires_at: float = None):
         embed = discord.Embed(title="🔨  Member Banned", colour=COL_MOD)
         embed.set_thumbnail(url=user.display_avatar.url)
         embed.add_field(name="👤 User",      value=f"{user.mention}\n`{user}`", inline=True)
         embed.add_field(name="🛡️ Moderator", value=moderator.mention,          inline=True)
+        if expires_at:
+            embed.add_field(name="⏳ Expires", value=f"<t:{int(expires_at)}:R>", inline=True)
         embed.add_field(name="📝 Reason",    value=reason or "No reason provided", inline=False)
         embed.set_footer(text=f"User ID: {user.id}")
         return embed
@@ -142,24 +415,29 @@ class Moderator(commands.Cog):
     @commands.command()
     @commands.guild_only()
     @permissions.has_permissions(ban_members=True)
-    async def ban(self, ctx: CustomContext, member: MemberID, *, reason: str = None):
-        """ Ban a user from the server. """
+    async def ban(self, ctx: CustomContext, member: MemberID, duration: typing.Optional[default.Duration] = None, *, reason: str = None):
+        """ Ban a user from the server, optionally for a while (e.g. ban @user 7d spam). """
         m = ctx.guild.get_member(member)
         if m is not None and await permissions.check_priv(ctx, m): return
         try:
             await ctx.guild.ban(discord.Object(id=member), reason=default.responsible(ctx.author, reason))
+            expires_at = await self._set_expiry(ctx.guild.id, member, "ban", ctx.author.id, duration)
             target = m or await self.bot.fetch_user(member)
-            await ctx.send(embed=self._ban_embed(target, ctx.author, reason))
+            await ctx.send(embed=self._ban_embed(target, ctx.author, reason, expires_at))
         except Exception as e:
             await ctx.send(embed=err(e))
 
     @app_commands.command(name="ban", description="Ban a member from the server.")
-    @app_commands.describe(member="Member to ban", reason="Reason for ban")
+    @app_commands.describe(member="Member to ban", reason="Reason for ban", duration="How long the ban lasts (e.g. 12h, 7d — default forever)")
     @app_commands.default_permissions(ban_members=True)
-    async def slash_ban(self, interaction: discord.Interaction, member: discord.Member, reason: str = None):
+    async def slash_ban(self, interaction: discord.Interaction, member: discord.Member, reason: str = None, duration: str = None):
+        seconds = default.parse_duration(duration) if duration else None
+        if duration and not seconds:
+            return await interaction.response.send_message(embed=err(f"`{duration}` is not a valid duration (e.g. 10m, 2h, 1d)."), ephemeral=True)
         try:
             await member.ban(reason=f"[ {interaction.user} ] {reason or 'No reason provided'}")
-            await interaction.response.send_message(embed=self._ban_embed(member, interaction.user, reason))
+            expires_at = await self._set_expiry(interaction.guild.id, member.id, "ban", interaction.user.id, seconds)
+            await interaction.response.send_message(embed=self._ban_embed(member, interaction.user, reason, expires_at))
         except Exception as e:
             await interaction.response.send_message(embed=err(e), ephemeral=True)
 
@@ -173,6 +451,7 @@ class Moderator(commands.Cog):
         try:
             target = await self.bot.fetch_user(member)
             await ctx.guild.unban(discord.Object(id=member), reason=default.responsible(ctx.author, reason))
+            await self._clear_expiry(ctx.guild.id, member, "ban")
             embed = discord.Embed(title="✅  Member Unbanned", colour=COL_SUCCESS)
             embed.set_thumbnail(url=target.display_avatar.url)
             embed.add_field(name="👤 User",      value=f"`{target}`",          inline=True)
@@ -191,6 +470,7 @@ class Moderator(commands.Cog):
             uid = int(user_id)
             target = await self.bot.fetch_user(uid)
             await interaction.guild.unban(discord.Object(id=uid), reason=f"[ {interaction.user} ] {reason or 'No reason'}")
+            await self._clear_expiry(interaction.guild.id, uid, "ban")
             embed = discord.Embed(title="✅  Member Unbanned", colour=COL_SUCCESS)
             embed.set_thumbnail(url=target.display_avatar.url)
             embed.add_field(name="👤 User",      value=f"`{target}`",             inline=True)
@@ -201,43 +481,148 @@ class Moderator(commands.Cog):
 
     # ── Mute ───────────────────────────────────────────────────────────
 
-    def _get_muted_role(self, guild):
-        return next((r for r in guild.roles if r.name == "Muted"), None)
+    def muted_role_id(self, guild: discord.Guild) -> int | None:
+        """ The guild's muted role: the configured one, else a role named 'Muted'. Cached until roles change. """
+        if guild.id in self.muted_roles:
+            return self.muted_roles[guild.id]
+        role_id, _ = self.mute_settings.get(guild.id, (None, "role"))
+        role = guild.get_role(role_id) if role_id else None
+        if role is None:
+            role = discord.utils.get(guild.roles, name=MUTED_ROLE_NAME)
+        self.muted_roles[guild.id] = role.id if role else None
+        return self.muted_roles[guild.id]
 
-    def _mute_embed(self, member, moderator, reason, title, colour):
+    def _get_muted_role(self, guild):
+        role_id = self.muted_role_id(guild)
+        return guild.get_role(role_id) if role_id else None
+
+    def _uses_timeout(self, guild: discord.Guild) -> bool:
+        return self.mute_settings.get(guild.id, (None, "role"))[1] == "timeout"
+
+    async def _save_mute_settings(self, guild_id: int, role_id: int | None, mode: str) -> None:
+        await self.db.execute("INSERT OR REPLACE INTO mod_settings VALUES (?, ?, ?)", (guild_id, role_id, mode))
+        self.mute_settings[guild_id] = (role_id, mode)
+        self.muted_roles.pop(guild_id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self.muted_roles.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.muted_roles.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            self.muted_roles.pop(after.guild.id, None)
+
+    async def _mute(self, guild: discord.Guild, member: discord.Member, moderator_id: int, seconds: int | None, audit_reason: str):
+        """ Mute with the guild's muted role or a native timeout; returns (expires_at, error). """
+        if self._uses_timeout(guild):
+            seconds = seconds or TIMEOUT_MAX
+            if seconds > TIMEOUT_MAX:
+                return None, "Timeout mutes can last at most **28 days**."
+            await member.timeout(datetime.timedelta(seconds=seconds), reason=audit_reason)
+            # Discord lifts timeouts itself; drop any role mute expiry left from before the switch
+            await self._clear_expiry(guild.id, member.id, "mute")
+            return time.time() + seconds, None
+        muted_role = self._get_muted_role(guild)
+        if not muted_role:
+            return None, NO_MUTED_ROLE
+        await member.add_roles(muted_role, reason=audit_reason)
+        return await self._set_expiry(guild.id, member.id, "mute", moderator_id, seconds, muted_role.id), None
+
+    async def _unmute(self, guild: discord.Guild, member: discord.Member, audit_reason: str) -> str | None:
+        """ Lift a mute of either kind; returns an error message if there was nothing to lift. """
+        muted_role = self._get_muted_role(guild)
+        if member.is_timed_out():
+            await member.timeout(None, reason=audit_reason)
+        elif muted_role is None or muted_role not in member.roles:
+            return f"{member.mention} is not muted."
+        if muted_role is not None and muted_role in member.roles:
+            await member.remove_roles(muted_role, reason=audit_reason)
+        await self._clear_expiry(guild.id, member.id, "mute")
+
+    def _mute_embed(self, member, moderator, reason, title, colour, expires_at: float = None):
         embed = discord.Embed(title=title, colour=colour)
         embed.set_thumbnail(url=member.display_avatar.url)
         embed.add_field(name="👤 Member",    value=f"{member.mention}\n`{member}`", inline=True)
         embed.add_field(name="🛡️ Moderator", value=moderator.mention,              inline=True)
+        if expires_at:
+            embed.add_field(name="⏳ Expires", value=f"<t:{int(expires_at)}:R>", inline=True)
         embed.add_field(name="📝 Reason",    value=reason or "No reason provided",  inline=False)
         embed.set_footer(text=f"User ID: {member.id}")
         return embed
 
+    def _muted_embed(self, guild, member, moderator, reason, seconds, expires_at) -> discord.Embed:
+        embed = self._mute_embed(member, moderator, reason, "🔇  Member Muted", COL_WARN, expires_at)
+        if not seconds and self._uses_timeout(guild):
+            # Timeouts can't be permanent, so say plainly that an open-ended mute was capped
+            embed.description = f"No duration given, so {member.mention} is timed out for the maximum 28 days, until <t:{int(expires_at)}:F>."
+        return embed
+
+    @commands.group(invoke_without_command=True)
+    @commands.guild_only()
+    @permissions.has_permissions(manage_roles=True)
+    async def muteconfig(self, ctx: CustomContext):
+        """ Show how mute works here: which role it uses, or native timeouts. """
+        role = self._get_muted_role(ctx.guild)
+        embed = discord.Embed(title="🔇  Mute Settings", colour=COL_INFO)
+        embed.add_field(name="⚙️ Mode", value="Native timeout" if self._uses_timeout(ctx.guild) else "Muted role", inline=True)
+        embed.add_field(name="🎭 Role", value=role.mention if role else "*None*", inline=True)
+        embed.set_footer(text=f"Change with {ctx.prefix}muteconfig role <role> or {ctx.prefix}muteconfig mode <role|timeout>")
+        await ctx.send(embed=embed)
+
+    @muteconfig.command(name="role")
+    @commands.guild_only()
+    @permissions.has_permissions(manage_roles=True)
+    async def muteconfig_role(self, ctx: CustomContext, *, role: discord.Role):
+        """ Use this role for mutes. """
+        if role >= ctx.me.top_role:
+            return await ctx.send(embed=err("That role is above my permission level."))
+        _, mode = self.mute_settings.get(ctx.guild.id, (None, "role"))
+        await self._save_mute_settings(ctx.guild.id, role.id, mode)
+        await ctx.send(embed=ok(f"Mutes will now use {role.mention}."))
+
+    @muteconfig.command(name="mode")
+    @commands.guild_only()
+    @permissions.has_permissions(manage_roles=True)
+    async def muteconfig_mode(self, ctx: CustomContext, mode: str):
+        """ Mute with the muted role (role) or Discord's native timeout (timeout). """
+        mode = mode.lower()
+        if mode not in ("role", "timeout"):
+            return await ctx.send(embed=err("Mode must be `role` or `timeout`."))
+        role_id, _ = self.mute_settings.get(ctx.guild.id, (None, "role"))
+        await self._save_mute_settings(ctx.guild.id, role_id, mode)
+        await ctx.send(embed=ok("Mutes will now use Discord's native timeout (max 28 days)." if mode == "timeout" else "Mutes will now use the muted role."))
+
     @commands.command()
     @commands.guild_only()
     @permissions.has_permissions(manage_roles=True)
-    async def mute(self, ctx: CustomContext, member: discord.Member, *, reason: str = None):
-        """ Mute a member (requires a role named 'Muted'). """
+    async def mute(self, ctx: CustomContext, member: discord.Member, duration: typing.Optional[default.Duration] = None, *, reason: str = None):
+        """ Mute a member, optionally for a while (see muteconfig for role or timeout mutes). """
         if await permissions.check_priv(ctx, member): return
-        muted_role = self._get_muted_role(ctx.guild)
-        if not muted_role:
-            return await ctx.send(embed=err("No **Muted** role found. Create one named exactly `Muted`."))
         try:
-            await member.add_roles(muted_role, reason=default.responsible(ctx.author, reason))
-            await ctx.send(embed=self._mute_embed(member, ctx.author, reason, "🔇  Member Muted", COL_WARN))
+            expires_at, error = await self._mute(ctx.guild, member, ctx.author.id, duration, default.responsible(ctx.author, reason))
+            if error:
+                return await ctx.send(embed=err(error))
+            await ctx.send(embed=self._muted_embed(ctx.guild, member, ctx.author, reason, duration, expires_at))
         except Exception as e:
             await ctx.send(embed=err(e))
 
-    @app_commands.command(name="mute", description="Mute a member (requires a 'Muted' role).")
-    @app_commands.describe(member="Member to mute", reason="Reason for mute")
+    @app_commands.command(name="mute", description="Mute a member with the muted role or a timeout.")
+    @app_commands.describe(member="Member to mute", reason="Reason for mute", duration="How long the mute lasts (e.g. 30m, 2h — default forever, or 28 days in timeout mode)")
     @app_commands.default_permissions(manage_roles=True)
-    async def slash_mute(self, interaction: discord.Interaction, member: discord.Member, reason: str = None):
-        muted_role = self._get_muted_role(interaction.guild)
-        if not muted_role:
-            return await interaction.response.send_message(embed=err("No **Muted** role found. Create one named exactly `Muted`."), ephemeral=True)
+    async def slash_mute(self, interaction: discord.Interaction, member: discord.Member, reason: str = None, duration: str = None):
+        seconds = default.parse_duration(duration) if duration else None
+        if duration and not seconds:
+            return await interaction.response.send_message(embed=err(f"`{duration}` is not a valid duration (e.g. 10m, 2h, 1d)."), ephemeral=True)
         try:
-            await member.add_roles(muted_role, reason=f"[ {interaction.user} ] {reason or 'No reason'}")
-            await interaction.response.send_message(embed=self._mute_embed(member, interaction.user, reason, "🔇  Member Muted", COL_WARN))
+            expires_at, error = await self._mute(interaction.guild, member, interaction.user.id, seconds, f"[ {interaction.user} ] {reason or 'No reason'}")
+            if error:
+                return await interaction.response.send_message(embed=err(error), ephemeral=True)
+            await interaction.response.send_message(embed=self._muted_embed(interaction.guild, member, interaction.user, reason, seconds, expires_at))
         except Exception as e:
             await interaction.response.send_message(embed=err(e), ephemeral=True)
 
@@ -247,11 +632,9 @@ class Moderator(commands.Cog):
     async def unmute(self, ctx: CustomContext, member: discord.Member, *, reason: str = None):
         """ Unmute a member. """
         if await permissions.check_priv(ctx, member): return
-        muted_role = self._get_muted_role(ctx.guild)
-        if not muted_role:
-            return await ctx.send(embed=err("No **Muted** role found. Create one named exactly `Muted`."))
         try:
-            await member.remove_roles(muted_role, reason=default.responsible(ctx.author, reason))
+            if error := await self._unmute(ctx.guild, member, default.responsible(ctx.author, reason)):
+                return await ctx.send(embed=err(error))
             await ctx.send(embed=self._mute_embed(member, ctx.author, reason, "🔊  Member Unmuted", COL_SUCCESS))
         except Exception as e:
             await ctx.send(embed=err(e))
@@ -260,15 +643,57 @@ class Moderator(commands.Cog):
     @app_commands.describe(member="Member to unmute", reason="Reason for unmute")
     @app_commands.default_permissions(manage_roles=True)
     async def slash_unmute(self, interaction: discord.Interaction, member: discord.Member, reason: str = None):
-        muted_role = self._get_muted_role(interaction.guild)
-        if not muted_role:
-            return await interaction.response.send_message(embed=err("No **Muted** role found."), ephemeral=True)
         try:
-            await member.remove_roles(muted_role, reason=f"[ {interaction.user} ] {reason or 'No reason'}")
+            if error := await self._unmute(interaction.guild, member, f"[ {interaction.user} ] {reason or 'No reason'}"):
+                return await interaction.response.send_message(embed=err(error), ephemeral=True)
             await interaction.response.send_message(embed=self._mute_embed(member, interaction.user, reason, "🔊  Member Unmuted", COL_SUCCESS))
         except Exception as e:
             await interaction.response.send_message(embed=err(e), ephemeral=True)
 
+    # ── Timeout ────────────────────────────────────────────────────────
+
+    @commands.command()
+    @commands.guild_only()
+    @permissions.has_permissions(moderate_members=True)
+    async def timeout(self, ctx: CustomContext, member: discord.Member, duration: default.Duration, *, reason: str = None):
+        """ Time a member out for a while (up to 28 days). """
+        if await permissions.check_priv(ctx, member): return
+        if duration > TIMEOUT_MAX:
+            return await ctx.send(embed=err("Timeouts can last at most **28 days**."))
+        try:
+            await member.timeout(datetime.timedelta(seconds=duration), reason=default.responsible(ctx.author, reason))
+            await ctx.send(embed=self._mute_embed(member, ctx.author, reason, "⏳  Member Timed Out", COL_WARN, time.time() + duration))
+        except Exception as e:
+            await ctx.send(embed=err(e))
+
+    @app_commands.command(name="timeout", description="Time a member out for a while (up to 28 days).")
+    @app_commands.describe(member="Member to time out", duration="How long (e.g. 10m, 2h, 1d)", reason="Reason for timeout")
+    @app_commands.default_permissions(moderate_members=True)
+    async def slash_timeout(self, interaction: discord.Interaction, member: discord.Member, duration: str, reason: str = None):
+        seconds = default.parse_duration(duration)
+        if not seconds:
+            return await interaction.response.send_message(embed=err(f"`{duration}` is not a valid duration (e.g. 10m, 2h, 1d)."), ephemeral=True)
+        if seconds > TIMEOUT_MAX:
+            return await interaction.response.send_message(embed=err("Timeouts can last at most **28 days**."), ephemeral=True)
+        try:
+            await member.timeout(datetime.timedelta(seconds=seconds), reason=f"[ {interaction.user} ] {reason or 'No reason'}")
+            await interaction.response.send_message(embed=self._mute_embed(member, interaction.user, reason, "⏳  Member Timed Out", COL_WARN, time.time() + seconds))
+        except Exception as e:
+            await interaction.response.send_message(embed=err(e), ephemeral=True)
+
+    @commands.command()
+    @commands.guild_only()
+    @permissions.has_permissions(moderate_members=True)
+    async def untimeout(self, ctx: CustomContext, member: discord.Member, *, reason: str = None):
+        """ Lift a member's timeout early. """
+        if not member.is_timed_out():
+            return await ctx.send(embed=err(f"{member.mention} is not timed out."))
+        try:
+            await member.timeout(None, reason=default.responsible(ctx.author, reason))
+            await ctx.send(embed=self._mute_embed(member, ctx.author, reason, "✅  Timeout Lifted", COL_SUCCESS))
+        except Exception as e:
+            await ctx.send(embed=err(e))
+
     # ── Slowmode ───────────────────────────────────────────────────────
 
     def _slowmode_embed(self, seconds, channel, moderator):
@@ -462,26 +887,225 @@ class Moderator(commands.Cog):
         except Exception as e:
             await interaction.response.send_message(embed=err(e), ephemeral=True)
 
+    # ── Lockdown ───────────────────────────────────────────────────────
+
+    def _lockdown_overwrite(self, channel: discord.abc.GuildChannel) -> discord.PermissionOverwrite | None:
+        """ The locked version of @everyone's overwrite here, or None if the channel is already locked. """
+        current = channel.overwrites_for(channel.guild.default_role)
+        locked = discord.PermissionOverwrite(**dict(current))
+        locked.update(**{perm: False for perm in LOCKDOWN_DENY})
+        if isinstance(channel, (discord.VoiceChannel, discord.StageChannel)):
+            locked.update(connect=False)
+        return None if locked == current else locked
+
+    def _lockdown_embed(self, progress: dict, total: int, moderator, reason: str, ending: bool, done: bool) -> discord.Embed:
+        if not done:
+            title, colour = ("⏳  Lifting Lockdown", COL_WARN) if ending else ("⏳  Locking Down Server", COL_WARN)
+        else:
+            title, colour = ("🔓  Lockdown Lifted", COL_SUCCESS) if ending else ("🔒  Server Locked Down", COL_MOD)
+        failed = progress["failed"]
+        embed = discord.Embed(title=title, colour=colour)
+        embed.add_field(name="📺 Channels",  value=f"**{len(progress['done'])}** / {total}", inline=True)
+        embed.add_field(name="❌ Failed",     value=f"**{len(failed)}**",                    inline=True)
+        embed.add_field(name="🛡️ Moderator", value=moderator.mention,                       inline=True)
+        embed.add_field(name="📝 Reason",    value=reason or "No reason provided",         inline=False)
+        if failed:
+            lines = [f"<#{cid}> — {detail}" for cid, detail in list(failed.items())[:LOCKDOWN_FAILURES_SHOWN]]
+            if len(failed) > LOCKDOWN_FAILURES_SHOWN:
+                lines.append(f"…and {len(failed) - LOCKDOWN_FAILURES_SHOWN} more")
+            embed.description = "\n".join(lines)
+            if done:
+                embed.set_footer(text="Run lockdown end to retry the failed channels." if ending else
+                    "Failed channels were left unchanged.")
+        return embed
+
+    async def _apply_overwrites(self, ctx: CustomContext, changes: list, reason: str, ending: bool) -> dict:
+        """ Set @everyone's overwrite in every (channel, overwrite) pair, a few at a time, with one live progress embed. """
+        progress = {"done": [], "failed": {}}
+        semaphore = asyncio.Semaphore(LOCKDOWN_CONCURRENCY)
+        audit_reason = default.responsible(ctx.author, reason)
+
+        async def apply(channel, overwrite):
+            async with semaphore:
+                try:
+                    await channel.set_permissions(ctx.guild.default_role, overwrite=overwrite, reason=audit_reason)
+                except discord.HTTPException as e:
+                    progress["failed"][channel.id] = e.text or str(e.status)
+                else:
+                    progress["done"].append(channel.id)
+
+        message = await ctx.send(embed=self._lockdown_embed(progress, len(changes), ctx.author, reason, ending, done=False))
+        work = asyncio.gather(*(apply(channel, overwrite) for channel, overwrite in changes))
+        while not work.done():
+            await asyncio.wait({work}, timeout=PROGRESS_INTERVAL)
+            if not work.done():
+                await message.edit(embed=self._lockdown_embed(progress, len(changes), ctx.author, reason, ending, done=False))
+        work.result()
+        await message.edit(embed=self._lockdown_embed(progress, len(changes), ctx.author, reason, ending, done=True))
+        return progress
+
+    @commands.group(invoke_without_command=True)
+    @commands.guild_only()
+    @commands.max_concurrency(1, per=commands.BucketType.guild)
+    @permissions.has_permissions(manage_channels=True, manage_roles=True)
+    async def lockdown(self, ctx: CustomContext, *, reason: str = None):
+        """ Lock every channel in the server; lockdown end restores them exactly as they were. """
+        if await self.db.fetchone("SELECT 1 FROM lockdowns WHERE guild_id = ?", (ctx.guild.id,)):
+            return await ctx.send(embed=err("The server is already in lockdown. Use `lockdown end` to lift it."))
+        changes = []
+        for channel in ctx.guild.channels:
+            if isinstance(channel, discord.CategoryChannel):
+                continue
+            if (locked := self._lockdown_overwrite(channel)) is not None:
+                changes.append((channel, locked))
+        if not changes:
+            return await ctx.send(embed=err("Every channel is already locked."))
+
+        # Snapshot before touching anything, so even an interrupted lockdown can be lifted
+        snapshot = []
+        for channel, _ in changes:
+            current = channel.overwrites.get(ctx.guild.default_role)
+            if current is None:
+                snapshot.append((ctx.guild.id, channel.id, None, None))
+            else:
+                allow, deny = current.pair()
+                snapshot.append((ctx.guild.id, channel.id, allow.value, deny.value))
+
+        def save(conn):
+            with conn:
+                conn.execute("INSERT INTO lockdowns VALUES (?, ?, ?, ?)", (ctx.guild.id, ctx.author.id, reason, time.time()))
+                conn.executemany("INSERT OR REPLACE INTO lockdown_overwrites VALUES (?, ?, ?, ?)", snapshot)
+        await self.db.run(save)
+
+        progress = await self._apply_overwrites(ctx, changes, reason, ending=False)
+        if progress["failed"]:
+            # Nothing changed there, so there's nothing to restore
+            await self.db.executemany(
+                "DELETE FROM lockdown_overwrites WHERE guild_id = ? AND channel_id = ?",
+                [(ctx.guild.id, cid) for cid in progress["failed"]]
+            )
+
+    @lockdown.command(name="end")
+    @commands.guild_only()
+    @commands.max_concurrency(1, per=commands.BucketType.guild)
+    @permissions.has_permissions(manage_channels=True, manage_roles=True)
+    async def lockdown_end(self, ctx: CustomContext, *, reason: str = None):
+        """ Lift the lockdown, restoring every channel's previous @everyone overwrite. """
+        if not await self.db.fetchone("SELECT 1 FROM lockdowns WHERE guild_id = ?", (ctx.guild.id,)):
+            return await ctx.send(embed=err("The server isn't in lockdown."))
+        rows = await self.db.fetchall("SELECT * FROM lockdown_overwrites WHERE guild_id = ?", (ctx.guild.id,))
+        changes = []
+        for row in rows:
+            channel = ctx.guild.get_channel(row["channel_id"])
+            if channel is None:
+                continue
+            if row["allow"] is None:
+                changes.append((channel, None))
+            else:
+                changes.append((channel, discord.PermissionOverwrite.from_pair(
+                    discord.Permissions(row["allow"]), discord.Permissions(row["deny"]))))
+
+        progress = await self._apply_overwrites(ctx, changes, reason, ending=True)
+
+        # Failed channels keep their snapshot (and the guild stays in lockdown) so lockdown end can retry them
+        restored = {row["channel_id"] for row in rows} - set(progress["failed"])
+
+        def save(conn):
+            with conn:
+                conn.executemany("DELETE FROM lockdown_overwrites WHERE guild_id = ? AND channel_id = ?",
+                    [(ctx.guild.id, cid) for cid in restored])
+                if not progress["failed"]:
+                    conn.execute("DELETE FROM lockdowns WHERE guild_id = ?", (ctx.guild.id,))
+        await self.db.run(save)
+
     # ── Massban ────────────────────────────────────────────────────────
 
+    def _massban_embed(self, report: dict, total: int, reason: str, moderator: discord.Member, done: bool) -> discord.Embed:
+        counts = Counter(status for status, _ in report.values())
+        embed = discord.Embed(
+            title="🔨  Mass Ban" if done else "⏳  Mass Ban in Progress",
+            description=f"Processed **{len(report)}** / **{total}** ID(s).",
+            colour=COL_MOD if done else COL_WARN
+        )
+        embed.add_field(name="🔨 Banned",         value=f"**{counts['banned']}**",  inline=True)
+        embed.add_field(name="♻️ Already Banned", value=f"**{counts['already']}**", inline=True)
+        embed.add_field(name="⚠️ Failed",         value=f"**{counts['failed']}**",  inline=True)
+        if done and report and len(report) <= MASSBAN_INLINE:
+            lines = [f"`{uid}` — {status}{f' ({detail})' if detail else ''}" for uid, (status, detail) in report.items()]
+            embed.add_field(name="📋 Report", value="\n".join(lines)[:1024], inline=False)
+        embed.add_field(name="📝 Reason",    value=reason,             inline=True)
+        embed.add_field(name="🛡️ Moderator", value=moderator.mention,  inline=True)
+        return embed
+
+    async def _massban_ids(self, ctx: CustomContext, members: tuple) -> list[int]:
+        ids = list(members)
+        for attachment in ctx.message.attachments:
+            text = (await attachment.read()).decode("utf-8", errors="ignore")
+            ids.extend(int(match) for match in SNOWFLAKE_RE.findall(text))
+        return list(dict.fromkeys(ids))
+
+    async def _bulk_ban(self, guild: discord.Guild, ids: list[int], reason: str, report: dict) -> None:
+        """ Ban through the bulk endpoint in chunks, then retry its rejects one by one to find out why. """
+        rejected = []
+        for i in range(0, len(ids), MASSBAN_CHUNK):
+            chunk = [discord.Object(id=uid) for uid in ids[i:i + MASSBAN_CHUNK]]
+            try:
+                result = await guild.bulk_ban(chunk, reason=reason)
+            except discord.HTTPException:
+                # Missing Manage Server, or nobody in the chunk could be banned
+                rejected.extend(chunk)
+                continue
+            for user in result.banned:
+                report[user.id] = ("banned", "")
+            rejected.extend(result.failed)
+
+        semaphore = asyncio.Semaphore(MASSBAN_CONCURRENCY)
+
+        async def ban_one(user: discord.Object):
+            async with semaphore:
+                try:
+                    await guild.fetch_ban(user)
+                    report[user.id] = ("already", "")
+                    return
+                except discord.HTTPException:
+                    # NotFound means not banned yet; anything else will resurface from the ban itself
+                    pass
+                try:
+                    await guild.ban(user, reason=reason)
+                    report[user.id] = ("banned", "")
+                except discord.HTTPException as e:
+                    report[user.id] = ("failed", e.text or str(e.status))
+
+        await asyncio.gather(*(ban_one(user) for user in rejected))
+
     @commands.command()
     @commands.guild_only()
     @commands.max_concurrency(1, per=commands.BucketType.user)
     @permissions.has_permissions(ban_members=True)
     async def massban(self, ctx: CustomContext, reason: ActionReason, *members: MemberID):
-        """ Mass ban multiple members from the server. """
-        if not members:
-            return await ctx.send(embed=err("Provide at least one member to ban."))
-        try:
-            for mid in members:
-                await ctx.guild.ban(discord.Object(id=mid), reason=default.responsible(ctx.author, reason))
-            embed = discord.Embed(title="🔨  Mass Ban", colour=COL_MOD,
-                description=f"Banned **{len(members)}** user(s).")
-            embed.add_field(name="📝 Reason",    value=reason,              inline=True)
-            embed.add_field(name="🛡️ Moderator", value=ctx.author.mention,  inline=True)
-            await ctx.send(embed=embed)
-        except Exception as e:
-            await ctx.send(embed=err(e))
+        """ Mass ban members by mention or ID; attach a file to ban every ID in it. """
+        oversized = next((a for a in ctx.message.attachments if a.size > MASSBAN_FILE_MAX), None)
+        if oversized:
+            return await ctx.send(embed=err(f"`{oversized.filename}` is over {MASSBAN_FILE_MAX // 1024} KB."))
+        ids = await self._massban_ids(ctx, members)
+        if not ids:
+            return await ctx.send(embed=err("Provide at least one member to ban, or attach a file of IDs."))
+        if len(ids) > MASSBAN_MAX:
+            return await ctx.send(embed=err(f"You can only mass ban up to {MASSBAN_MAX} IDs at once."))
+
+        report: dict[int, tuple[str, str]] = {}
+        message = await ctx.send(embed=self._massban_embed(report, len(ids), reason, ctx.author, done=False))
+        work = asyncio.create_task(self._bulk_ban(ctx.guild, ids, default.responsible(ctx.author, reason), report))
+        while not work.done():
+            await asyncio.wait({work}, timeout=PROGRESS_INTERVAL)
+            if not work.done():
+                await message.edit(embed=self._massban_embed(report, len(ids), reason, ctx.author, done=False))
+        work.result()
+
+        await message.edit(embed=self._massban_embed(report, len(ids), reason, ctx.author, done=True))
+        if len(report) > MASSBAN_INLINE:
+            lines = "\n".join(f"{uid}\t{status}\t{detail}" for uid, (status, detail) in report.items())
+            await ctx.send(file=discord.File(BytesIO(lines.encode("utf-8")), filename=default.timetext("Massban")))
 
     # ── Announce Role ──────────────────────────────────────────────────
 
@@ -538,24 +1162,41 @@ class Moderator(commands.Cog):
                         loop.append(f"{i} | {type(g).__name__}: {g.name} ({i.id})")
         await default.pretty_results(ctx, "playing", f"Found **{len(loop)}** result(s) for **{search}**", loop)
 
+    async def _find_members(self, guild: discord.Guild, field: str, search: str) -> list[discord.Member]:
+        members = (guild.get_member(member_id) for member_id in await self.search_members(guild, field, search))
+        return sorted((m for m in members if m and not m.bot), key=lambda m: m.name)
+
+    async def _find_results(self, ctx: CustomContext, filename: str, search, loop: list) -> None:
+        if loop:
+            return await default.pretty_results(ctx, filename, f"Found **{len(loop)}** result(s) for **{search}**", loop)
+        # Nothing contains the search as typed; show the closest names instead of an empty result
+        suggestions = [f"{m} ({m.id}) — {score:.0%}" for score, m in await self.fuzzy_members(ctx.guild, str(search))]
+        await default.pretty_results(ctx, filename, f"No exact results for **{search}**, closest matches:", suggestions)
+
     @find.command(name="username", aliases=["name"])
     async def find_name(self, ctx, *, search: str):
         """ Find members by username. """
-        loop = [f"{i} ({i.id})" for i in ctx.guild.members if search.lower() in i.name.lower() and not i.bot]
-        await default.pretty_results(ctx, "name", f"Found **{len(loop)}** result(s) for **{search}**", loop)
+        loop = [f"{i} ({i.id})" for i in await self._find_members(ctx.guild, "name", search)]
+        await self._find_results(ctx, "name", search, loop)
 
     @find.command(name="nickname", aliases=["nick"])
     async def find_nickname(self, ctx, *, search: str):
         """ Find members by nickname. """
-        loop = [f"{i.nick} | {i} ({i.id})" for i in ctx.guild.members if i.nick and search.lower() in i.nick.lower() and not i.bot]
-        await default.pretty_results(ctx, "nickname", f"Found **{len(loop)}** result(s) for **{search}**", loop)
+        loop = [f"{i.nick} | {i} ({i.id})" for i in await self._find_members(ctx.guild, "nick", search)]
+        await self._find_results(ctx, "nickname", search, loop)
 
     @find.command(name="id")
     async def find_id(self, ctx, *, search: int):
         """ Find members by ID. """
-        loop = [f"{i} ({i.id})" for i in ctx.guild.members if str(search) in str(i.id) and not i.bot]
+        loop = [f"{i} ({i.id})" for i in await self._find_members(ctx.guild, "id", str(search))]
         await default.pretty_results(ctx, "id", f"Found **{len(loop)}** result(s) for `{search}`", loop)
 
+    @find.command(name="fuzzy", aliases=["similar"])
+    async def find_fuzzy(self, ctx, *, search: str):
+        """ Find the members whose name, nickname or display name best match, typos and all. """
+        loop = [f"{m} ({m.id}) — {score:.0%}" for score, m in await self.fuzzy_members(ctx.guild, search)]
+        await default.pretty_results(ctx, "fuzzy", f"Top **{len(loop)}** match(es) for **{search}**", loop)
+
     # ── Prune ──────────────────────────────────────────────────────────
 
     @commands.group()
@@ -580,91 +1221,199 @@ class Moderator(commands.Cog):
             description=f"Deleted **{len(deleted)}** message{'s' if len(deleted) != 1 else ''}.",
             colour=COL_SUCCESS), ephemeral=True)
 
-    async def do_removal(self, ctx, limit, predicate, *, before=None, after=None, message=True):
-        if limit > 2000:
-            return await ctx.send(embed=err(f"Too many messages to search ({limit}/2000)."))
-        before = ctx.message if not before else discord.Object(id=before)
-        if after: after = discord.Object(id=after)
+    def _prune_check(self, spec: str):
+        name, _, arg = spec.partition(":")
+        if name == "custom":
+            return MessageFilter(arg).check_page
+        predicate = PRUNE_FILTERS[name](arg)
+
+        async def check(page: list[discord.Message]) -> list[bool]:
+            return [bool(predicate(m)) for m in page]
+        return check
+
+    async def _save_checkpoint(self, ctx: CustomContext, spec: str, job: PurgeJob) -> None:
+        await self.db.execute(
+            "INSERT OR REPLACE INTO purge_checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (ctx.channel.id, ctx.guild.id, ctx.author.id, spec, job.limit, job.checkpointed, job.deleted, job.cursor, job.after, time.time())
+        )
+
+    def _purge_embed(self, job: PurgeJob, channel, state: str = "running", error: str = None) -> discord.Embed:
+        title, colour = {
+            "running":   ("⏳  Pruning Messages",  COL_WARN),
+            "done":      ("🗑️  Messages Pruned",   COL_SUCCESS),
+            "cancelled": ("⏹️  Prune Cancelled",   COL_WARN),
+            "failed":    ("❌  Prune Stopped",     COL_ERROR),
+        }[state]
+        n = job.deleted
+        embed = discord.Embed(title=title, colour=colour,
+            description=error or f"Deleted **{n}** message{'s' if n != 1 else ''} from {channel.mention}.")
+        embed.add_field(name="🔍 Scanned", value=f"**{job.scanned}** / {job.limit}", inline=True)
+        if state == "running":
+            embed.add_field(name="🕰️ Old, Deleting One by One", value=f"**{job.old_pending}**", inline=True)
+        elif state != "done":
+            embed.set_footer(text="Run prune resume to continue from where this stopped.")
+        return embed
+
+    async def _run_purge(self, ctx: CustomContext, job: PurgeJob, spec: str, message: bool) -> None:
+        self.purges[ctx.channel.id] = job
+        job.on_checkpoint = lambda j: self._save_checkpoint(ctx, spec, j)
+        view = PurgeView(job, ctx.author.id)
+        status = await ctx.send(embed=self._purge_embed(job, ctx.channel), view=view)
+        await self._save_checkpoint(ctx, spec, job)
+
+        error = None
+        task = asyncio.create_task(job.run())
         try:
-            deleted = await ctx.channel.purge(limit=limit, before=before, after=after, check=predicate)
-        except discord.Forbidden:
-            return await ctx.send(embed=err("I don't have permission to delete messages here."))
-        except discord.HTTPException as e:
-            return await ctx.send(embed=err(f"{e} — try a smaller amount."))
-        if message:
-            n = len(deleted)
-            msg = await ctx.send(embed=discord.Embed(title="🗑️  Messages Pruned",
-                description=f"Deleted **{n}** message{'s' if n != 1 else ''} from {ctx.channel.mention}.",
-                colour=COL_SUCCESS))
+            while not task.done():
+                await asyncio.wait({task}, timeout=PROGRESS_INTERVAL)
+                if not task.done():
+                    await status.edit(embed=self._purge_embed(job, ctx.channel))
+            task.result()
+        except (PurgeError, FilterError) as e:
+            error = str(e)
+        finally:
+            self.purges.pop(ctx.channel.id, None)
+            view.stop()
+
+        state = "failed" if error else "cancelled" if job.cancelled else "done"
+        if state == "done":
+            await self.db.execute("DELETE FROM purge_checkpoints WHERE channel_id = ?", (ctx.channel.id,))
+        await status.edit(embed=self._purge_embed(job, ctx.channel, state, error), view=None)
+        if state == "done" and message:
             await asyncio.sleep(5)
-            await msg.delete()
+            await status.delete()
+
+    async def do_removal(self, ctx, limit, spec, *, before=None, after=None, message=True):
+        if limit > PURGE_MAX:
+            return await ctx.send(embed=err(f"Too many messages to search ({limit}/{PURGE_MAX})."))
+        if ctx.channel.id in self.purges:
+            return await ctx.send(embed=err("A prune is already running in this channel."))
+        try:
+            check = self._prune_check(spec)
+        except FilterError as e:
+            return await ctx.send(embed=err(str(e)))
+        job = PurgeJob(ctx.channel, limit, check, before=before or ctx.message.id, after=after)
+        await self._run_purge(ctx, job, spec, message)
+
+    @prune.command(name="resume")
+    async def _resume(self, ctx):
+        """ Resume an interrupted or cancelled prune in this channel. """
+        if ctx.channel.id in self.purges:
+            return await ctx.send(embed=err("A prune is already running in this channel."))
+        row = await self.db.fetchone("SELECT * FROM purge_checkpoints WHERE channel_id = ?", (ctx.channel.id,))
+        if row is None:
+            return await ctx.send(embed=err("There's no unfinished prune to resume in this channel."))
+        job = PurgeJob(
+            ctx.channel, row["scan_limit"], self._prune_check(row["spec"]),
+            before=row["cursor_id"], after=row["after_id"], scanned=row["scanned"], deleted=row["deleted"]
+        )
+        await self._run_purge(ctx, job, row["spec"], message=True)
 
     @prune.command()
     async def embeds(self, ctx, search: int = 100):
         """ Remove messages that contain embeds. """
-        await self.do_removal(ctx, search, lambda e: len(e.embeds))
+        await self.do_removal(ctx, search, "embeds")
 
     @prune.command()
     async def files(self, ctx, search: int = 100):
         """ Remove messages that contain attachments. """
-        await self.do_removal(ctx, search, lambda e: len(e.attachments))
+        await self.do_removal(ctx, search, "files")
 
     @prune.command()
     async def mentions(self, ctx, search: int = 100):
         """ Remove messages that contain mentions. """
-        await self.do_removal(ctx, search, lambda e: len(e.mentions) or len(e.role_mentions))
+        await self.do_removal(ctx, search, "mentions")
 
     @prune.command()
     async def images(self, ctx, search: int = 100):
         """ Remove messages that contain embeds or attachments. """
-        await self.do_removal(ctx, search, lambda e: len(e.embeds) or len(e.attachments))
+        await self.do_removal(ctx, search, "images")
 
     @prune.command(name="all")
     async def _remove_all(self, ctx, search: int = 100):
         """ Remove all messages. """
-        await self.do_removal(ctx, search, lambda e: True)
+        await self.do_removal(ctx, search, "all")
 
     @prune.command()
     async def user(self, ctx, member: discord.Member, search: int = 100):
         """ Remove all messages from a specific member. """
-        await self.do_removal(ctx, search, lambda e: e.author == member)
+        await self.do_removal(ctx, search, f"user:{member.id}")
 
     @prune.command()
     async def contains(self, ctx, *, substr: str):
         """ Remove messages containing a substring (min 3 chars). """
         if len(substr) < 3:
             return await ctx.send(embed=err("Substring must be at least 3 characters."))
-        await self.do_removal(ctx, 100, lambda e: substr in e.content)
+        await self.do_removal(ctx, 100, f"contains:{substr}")
 
     @prune.command(name="bots")
     async def _bots(self, ctx, search: int = 100, prefix: str = None):
         """ Remove bot messages. """
         getprefix = prefix if prefix else self.bot.config.discord_prefix
-        await self.do_removal(ctx, search, lambda m: (m.webhook_id is None and m.author.bot) or m.content.startswith(tuple(getprefix)))
+        await self.do_removal(ctx, search, f"bots:{getprefix}")
 
     @prune.command(name="users")
     async def _users(self, ctx, search: int = 100):
         """ Remove only human messages. """
-        await self.do_removal(ctx, search, lambda m: not m.author.bot)
+        await self.do_removal(ctx, search, "users")
 
     @prune.command(name="emojis")
     async def _emojis(self, ctx, search: int = 100):
         """ Remove messages containing custom emojis. """
-        custom_emoji = re.compile(r"<a?:(.*?):(\d{17,21})>|[\u263a-\U0001f645]")
-        await self.do_removal(ctx, search, lambda m: custom_emoji.search(m.content))
+        await self.do_removal(ctx, search, "emojis")
+
+    @prune.command(name="custom")
+    async def _custom(self, ctx, search: typing.Optional[int] = 100, *, expression: str):
+        """ Remove messages matching a filter expression.
+
+        Terms: from:<user>, contains:<text>, regex:"<pattern>", has:<file|image|embed|link|invite|mention|emoji|reaction>,
+        older:<duration>, newer:<duration>, mentions:<count>, bot, human, webhook, pinned.
+        Combine them with and, or, not and parentheses, e.g.
+        prune custom 500 from:@user and (has:link or regex:"free.?nitro") and not older:1d
+        """
+        await self.do_removal(ctx, search, f"custom:{expression}")
+
+    def _reactions_embed(self, job: ReactionClearJob, channel, state: str = "running", error: str = None) -> discord.Embed:
+        title, colour = {
+            "running":   ("⏳  Clearing Reactions",  COL_WARN),
+            "done":      ("✅  Reactions Cleared",   COL_SUCCESS),
+            "cancelled": ("⏹️  Clearing Cancelled",  COL_WARN),
+            "failed":    ("❌  Clearing Stopped",    COL_ERROR),
+        }[state]
+        embed = discord.Embed(title=title, colour=colour,
+            description=error or f"Removed **{job.removed}** reaction(s) from **{job.touched}** message(s) in {channel.mention}.")
+        embed.add_field(name="🔍 Scanned", value=f"**{job.scanned}** / {job.limit}", inline=True)
+        if state == "running":
+            embed.add_field(name="⏳ Queued", value=f"**{job.pending}**", inline=True)
+        return embed
 
     @prune.command(name="reactions")
     async def _reactions(self, ctx, search: int = 100):
         """ Remove all reactions from recent messages. """
-        if search > 2000:
-            return await ctx.send(embed=err(f"Too many messages ({search}/2000)."))
-        total = 0
-        async for message in ctx.history(limit=search, before=ctx.message):
-            if message.reactions:
-                total += sum(r.count for r in message.reactions)
-                await message.clear_reactions()
-        await ctx.send(embed=discord.Embed(title="✅  Reactions Cleared",
-            description=f"Removed **{total}** reaction(s) from the last **{search}** messages.", colour=COL_SUCCESS))
+        if search > REACTIONS_MAX:
+            return await ctx.send(embed=err(f"Too many messages ({search}/{REACTIONS_MAX})."))
+        if ctx.channel.id in self.purges:
+            return await ctx.send(embed=err("A prune is already running in this channel."))
+        job = self.purges[ctx.channel.id] = ReactionClearJob(ctx.channel, search, before=ctx.message.id)
+        view = PurgeView(job, ctx.author.id)
+        status = await ctx.send(embed=self._reactions_embed(job, ctx.channel), view=view)
+
+        error = None
+        task = asyncio.create_task(job.run())
+        try:
+            while not task.done():
+                await asyncio.wait({task}, timeout=PROGRESS_INTERVAL)
+                if not task.done():
+                    await status.edit(embed=self._reactions_embed(job, ctx.channel))
+            task.result()
+        except PurgeError as e:
+            error = str(e)
+        finally:
+            self.purges.pop(ctx.channel.id, None)
+            view.stop()
+
+        state = "failed" if error else "cancelled" if job.cancelled else "done"
+        await status.edit(embed=self._reactions_embed(job, ctx.channel, state, error), view=None)
 
 
 async def setup(bot):
@@ -8,39 +8,81 @@ from discord import app_commands
 from utils.default import CustomContext
 from utils.data import DiscordBot
 from utils import permissions
+from utils.db import Database
 
 WARNS_FILE = "data/warns.json"
-
-
-def load_warns() -> dict:
-    if not os.path.exists("data"):
-        os.makedirs("data")
-    if not os.path.exists(WARNS_FILE):
-        with open(WARNS_FILE, "w") as f:
-            json.dump({}, f)
+WARNS_DB = "data/warns.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS warns (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id     INTEGER NOT NULL,
+    user_id      INTEGER NOT NULL,
+    reason       TEXT    NOT NULL,
+    moderator    TEXT    NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    timestamp    TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_warns_member ON warns (guild_id, user_id, id);
+"""
+
+
+def _migrate_json(conn):
+    """ One-time import of the legacy data/warns.json into the SQLite store. """
+    if not os.path.exists(WARNS_FILE) or conn.execute("SELECT 1 FROM warns LIMIT 1").fetchone():
+        return
     with open(WARNS_FILE, "r") as f:
-        return json.load(f)
+        data = json.load(f)
+    rows = [
+        (int(guild_id), int(user_id), w["reason"], w["moderator"], w["moderator_id"], w.get("timestamp", ""))
+        for guild_id, users in data.items()
+        for user_id, warns in users.items()
+        for w in warns
+    ]
+    with conn:
+        conn.executemany(
+            "INSERT INTO warns (guild_id, user_id, reason, moderator, moderator_id, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+    os.replace(WARNS_FILE, f"{WARNS_FILE}.migrated")
+
+
+async def _add_warn(db: Database, guild_id: int, user_id: int, reason: str, moderator: str, moderator_id: int) -> int:
+    def _insert(conn):
+        with conn:
+            conn.execute(
+                "INSERT INTO warns (guild_id, user_id, reason, moderator, moderator_id, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                (guild_id, user_id, reason, moderator, moderator_id, datetime.utcnow().isoformat())
+            )
+            return conn.execute("SELECT COUNT(*) FROM warns WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)).fetchone()[0]
+    return await db.run(_insert)
+
+
+async def _get_warns(db: Database, guild_id: int, user_id: int) -> list:
+    return await db.fetchall(
+        "SELECT id, reason, moderator, timestamp FROM warns WHERE guild_id = ? AND user_id = ? ORDER BY id",
+        (guild_id, user_id)
+    )
 
 
-def save_warns(data: dict):
-    with open(WARNS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+async def _remove_warn(db: Database, guild_id: int, user_id: int, index: int):
+    """ Delete the index-th (1-based) warning; returns (removed row or None, total before removal). """
+    def _delete(conn):
+        with conn:
+            total = conn.execute("SELECT COUNT(*) FROM warns WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)).fetchone()[0]
+            if index < 1 or index > total:
+                return None, total
+            row = conn.execute(
+                "SELECT id, reason FROM warns WHERE guild_id = ? AND user_id = ? ORDER BY id LIMIT 1 OFFSET ?",
+                (guild_id, user_id, index - 1)
+            ).fetchone()
+            conn.execute("DELETE FROM warns WHERE id = ?", (row["id"],))
+            return row, total
+    return await db.run(_delete)
 
 
-def _add_warn(guild_id: str, user_id: str, reason: str, moderator: str, moderator_id: int) -> int:
-    data = load_warns()
-    if guild_id not in data:
-        data[guild_id] = {}
-    if user_id not in data[guild_id]:
-        data[guild_id][user_id] = []
-    data[guild_id][user_id].append({
-        "reason": reason,
-        "moderator": moderator,
-        "moderator_id": moderator_id,
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    save_warns(data)
-    return len(data[guild_id][user_id])
+async def _clear_warns(db: Database, guild_id: int, user_id: int) -> int:
+    return await db.execute("DELETE FROM warns WHERE guild_id = ? AND user_id = ?", (guild_id, user_id))
 
 
 def _warn_embed(member: discord.Member, moderator: discord.Member, reason: str, count: int) -> discord.Embed:
@@ -54,9 +96,8 @@ def _warn_embed(member: discord.Member, moderator: discord.Member, reason: str,
     return embed
 
 
-def _warnings_embed(member: discord.Member, guild_id: str) -> discord.Embed:
-    data = load_warns()
-    warns = data.get(guild_id, {}).get(str(member.id), [])
+async def _warnings_embed(db: Database, member: discord.Member, guild_id: int) -> discord.Embed:
+    warns = await _get_warns(db, guild_id, member.id)
     embed = discord.Embed(
         title=f"📋  Warnings — {member.display_name}",
         colour=discord.Colour.orange() if warns else discord.Colour.green()
@@ -68,7 +109,7 @@ def _warnings_embed(member: discord.Member, guild_id: str) -> discord.Embed:
         embed.description = f"**{len(warns)}** warning{'s' if len(warns) != 1 else ''} on record."
         for i, w in enumerate(warns, 1):
             try:
-                unix = int(datetime.fromisoformat(w.get("timestamp", "")).timestamp())
+                unix = int(datetime.fromisoformat(w["timestamp"]).timestamp())
                 time_str = f"<t:{unix}:R>"
             except Exception:
                 time_str = "Unknown time"
@@ -81,6 +122,13 @@ def _warnings_embed(member: discord.Member, guild_id: str) -> discord.Embed:
 class Warns(commands.Cog):
     def __init__(self, bot):
         self.bot: DiscordBot = bot
+        self.db = Database(WARNS_DB, SCHEMA)
+
+    async def cog_load(self):
+        await self.db.run(_migrate_json)
+
+    async def cog_unload(self):
+        await self.db.close()
 
     # ── Warn ──────────────────────────────────────────────────────────
 
@@ -91,7 +139,7 @@ class Warns(commands.Cog):
         """ Warn a member. """
         if await permissions.check_priv(ctx, member):
             return
-        count = _add_warn(str(ctx.guild.id), str(member.id), reason, str(ctx.author), ctx.author.id)
+        count = await _add_warn(self.db, ctx.guild.id, member.id, reason, str(ctx.author), ctx.author.id)
         await ctx.send(embed=_warn_embed(member, ctx.author, reason, count))
         try:
             dm = discord.Embed(title=f"⚠️  You were warned in {ctx.guild.name}",
@@ -108,7 +156,7 @@ class Warns(commands.Cog):
     async def slash_warn(self, interaction: discord.Interaction, member: discord.Member, reason: str = "No reason provided"):
         if member.id == interaction.user.id:
             return await interaction.response.send_message("❌ You can't warn yourself.", ephemeral=True)
-        count = _add_warn(str(interaction.guild_id), str(member.id), reason, str(interaction.user), interaction.user.id)
+        count = await _add_warn(self.db, interaction.guild_id, member.id, reason, str(interaction.user), interaction.user.id)
         await interaction.response.send_message(embed=_warn_embed(member, interaction.user, reason, count))
         try:
             dm = discord.Embed(title=f"⚠️  You were warned in {interaction.guild.name}",
@@ -126,13 +174,13 @@ class Warns(commands.Cog):
     @permissions.has_permissions(kick_members=True)
     async def warnings(self, ctx: CustomContext, member: discord.Member = None):
         """ View warnings for a member. """
-        await ctx.send(embed=_warnings_embed(member or ctx.author, str(ctx.guild.id)))
+        await ctx.send(embed=await _warnings_embed(self.db, member or ctx.author, ctx.guild.id))
 
     @app_commands.command(name="warnings", description="View warnings for a member.")
     @app_commands.describe(member="Member to check (default: yourself)")
     @app_commands.default_permissions(kick_members=True)
     async def slash_warnings(self, interaction: discord.Interaction, member: discord.Member = None):
-        await interaction.response.send_message(embed=_warnings_embed(member or interaction.user, str(interaction.guild_id)))
+        await interaction.response.send_message(embed=await _warnings_embed(self.db, member or interaction.user, interaction.guild_id))
 
     # ── Clear Warn ────────────────────────────────────────────────────
 
@@ -141,26 +189,20 @@ class Warns(commands.Cog):
     @permissions.has_permissions(kick_members=True)
     async def clearwarn(self, ctx: CustomContext, member: discord.Member, index: int = None):
         """ Clear all warnings or a specific one (by number) for a member. """
-        data = load_warns()
-        guild_id = str(ctx.guild.id)
-        user_id = str(member.id)
-        warns = data.get(guild_id, {}).get(user_id, [])
-        if not warns:
-            return await ctx.send(embed=discord.Embed(description=f"✅ **{member.display_name}** has no warnings to clear.", colour=discord.Colour.green()))
         if index is not None:
-            if index < 1 or index > len(warns):
-                return await ctx.send(embed=discord.Embed(description=f"❌ Invalid number. They have **{len(warns)}** warning(s).", colour=discord.Colour.red()))
-            removed = warns.pop(index - 1)
-            data[guild_id][user_id] = warns
-            save_warns(data)
+            removed, total = await _remove_warn(self.db, ctx.guild.id, member.id, index)
+            if not total:
+                return await ctx.send(embed=discord.Embed(description=f"✅ **{member.display_name}** has no warnings to clear.", colour=discord.Colour.green()))
+            if removed is None:
+                return await ctx.send(embed=discord.Embed(description=f"❌ Invalid number. They have **{total}** warning(s).", colour=discord.Colour.red()))
             embed = discord.Embed(title="🗑️  Warning Removed", colour=discord.Colour.green())
             embed.add_field(name="Member",          value=member.mention,    inline=True)
             embed.add_field(name="Removed #",       value=str(index),        inline=True)
             embed.add_field(name="Reason was",      value=removed["reason"], inline=False)
         else:
-            count = len(warns)
-            data[guild_id][user_id] = []
-            save_warns(data)
+            count = await _clear_warns(self.db, ctx.guild.id, member.id)
+            if not count:
+                return await ctx.send(embed=discord.Embed(description=f"✅ **{member.display_name}** has no warnings to clear.", colour=discord.Colour.green()))
             embed = discord.Embed(title="🗑️  All Warnings Cleared",
                 description=f"Removed **{count}** warning{'s' if count != 1 else ''} from {member.mention}.",
                 colour=discord.Colour.green())
@@ -171,26 +213,20 @@ class Warns(commands.Cog):
     @app_commands.describe(member="Member to clear warnings for", index="Warning number to remove (leave blank to clear all)")
     @app_commands.default_permissions(kick_members=True)
     async def slash_clearwarn(self, interaction: discord.Interaction, member: discord.Member, index: int = None):
-        data = load_warns()
-        guild_id = str(interaction.guild_id)
-        user_id = str(member.id)
-        warns = data.get(guild_id, {}).get(user_id, [])
-        if not warns:
-            return await interaction.response.send_message(embed=discord.Embed(description=f"✅ **{member.display_name}** has no warnings.", colour=discord.Colour.green()))
         if index is not None:
-            if index < 1 or index > len(warns):
-                return await interaction.response.send_message(embed=discord.Embed(description=f"❌ Invalid number. They have **{len(warns)}** warning(s).", colour=discord.Colour.red()))
-            removed = warns.pop(index - 1)
-            data[guild_id][user_id] = warns
-            save_warns(data)
+            removed, total = await _remove_warn(self.db, interaction.guild_id, member.id, index)
+            if not total:
+                return await interaction.response.send_message(embed=discord.Embed(description=f"✅ **{member.display_name}** has no warnings.", colour=discord.Colour.green()))
+            if removed is None:
+                return await interaction.response.send_message(embed=discord.Embed(description=f"❌ Invalid number. They have **{total}** warning(s).", colour=discord.Colour.red()))
             embed = discord.Embed(title="🗑️  Warning Removed", colour=discord.Colour.green())
             embed.add_field(name="Member", value=member.mention, inline=True)
             embed.add_field(name="Removed #", value=str(index), inline=True)
             embed.add_field(name="Reason was", value=removed["reason"], inline=False)
         else:
-            count = len(warns)
-            data[guild_id][user_id] = []
-            save_warns(data)
+            count = await _clear_warns(self.db, interaction.guild_id, member.id)
+            if not count:
+                return await interaction.response.send_message(embed=discord.Embed(description=f"✅ **{member.display_name}** has no warnings.", colour=discord.Colour.green()))
             embed = discord.Embed(title="🗑️  All Warnings Cleared",
                 description=f"Removed **{count}** warning{'s' if count != 1 else ''} from {member.mention}.",
                 colour=discord.Colour.green())
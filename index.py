@@ -12,6 +12,7 @@ config = Config(
     discord_activity_type="playing",
     discord_status_type="online",
     discord_autorole_id=None,
+    discord_log_webhooks=False,
 )
 
 print("Logging in...")
@@ -11,3 +11,4 @@ class Config:
     discord_activity_type: str
     discord_status_type: str
     discord_autorole_id: int = None   # Optional: role ID to auto-assign on join
+    discord_log_webhooks: bool = False   # Optional: post server logs through per-channel webhooks
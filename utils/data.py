@@ -3,7 +3,7 @@ import os
 
 from discord.ext import commands
 from discord.ext.commands import AutoShardedBot
-from utils import permissions, default
+from utils import permissions, default, http
 from utils.config import Config
 
 COG_META = {
@@ -180,6 +180,7 @@ class DiscordBot(AutoShardedBot):
         self.config = config
 
     async def setup_hook(self):
+        await http.open_session()
         for file in os.listdir("cogs"):
             if not file.endswith(".py"):
                 continue
@@ -188,6 +189,10 @@ class DiscordBot(AutoShardedBot):
         await self.tree.sync()
         print("✅ Slash commands synced globally.")
 
+    async def close(self):
+        await super().close()
+        await http.close_session()
+
     async def on_message(self, msg: discord.Message):
         if not self.is_ready() or msg.author.bot or not permissions.can_handle(msg, "send_messages"):
             return
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import sqlite3
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class Database:
+    """ A single SQLite connection in WAL mode, driven from one worker thread. """
+
+    def __init__(self, path: str, schema: str = ""):
+        self.path = path
+        self.schema = schema
+        self._conn: sqlite3.Connection | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"sqlite-{os.path.basename(path)}")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            folder = os.path.dirname(self.path)
+            if folder and not os.path.exists(folder):
+                os.makedirs(folder)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if self.schema:
+                conn.executescript(self.schema)
+            self._conn = conn
+        return self._conn
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        """ Run fn(conn, *args) on the database thread and return its result. """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: fn(self._connect(), *args))
+
+    async def execute(self, sql: str, params: tuple = ()) -> int:
+        def _execute(conn):
+            with conn:
+                return conn.execute(sql, params).rowcount
+        return await self.run(_execute)
+
+    async def executemany(self, sql: str, rows: list) -> int:
+        def _executemany(conn):
+            with conn:
+                return conn.executemany(sql, rows).rowcount
+        return await self.run(_executemany)
+
+    async def fetchone(self, sql: str, params: tuple = ()) -> sqlite3.Row | None:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchone())
+
+    async def fetchall(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        return await self.run(lambda conn: conn.execute(sql, params).fetchall())
+
+    async def close(self) -> None:
+        def _close(_):
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        if self._conn is not None:
+            await self.run(_close)
+        self._executor.shutdown(wait=False)
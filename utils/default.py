@@ -1,3 +1,4 @@
+import re
 import time
 import json
 import discord
@@ -18,6 +19,30 @@ class CustomContext(commands.Context):
         super().__init__(**kwargs)
 
 
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def parse_duration(text: str) -> int | None:
+    """ Parse durations like 10s, 5m, 2h, 1d, 1w or 1h30m into seconds. """
+    text = text.lower().strip()
+    if not re.fullmatch(r"(?:\d+[smhdw])+", text):
+        return None
+    return sum(int(n) * DURATION_UNITS[u] for n, u in re.findall(r"(\d+)([smhdw])", text))
+
+
+class Duration(commands.Converter):
+    async def convert(self, ctx, argument) -> int:
+        seconds = parse_duration(argument)
+        if not seconds:
+            raise commands.BadArgument(f"`{argument}` is not a valid duration (e.g. 10m, 2h, 1d).")
+        return seconds
+
+
+class MemberSuggestions(commands.BadArgument):
+    """ A member lookup that failed but has close matches; shown to the user instead of the command help. """
+    pass
+
+
 def load_json(filename: str = "config.json") -> dict:
     try:
         with open(filename, encoding='utf8') as data:
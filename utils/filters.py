@@ -0,0 +1,212 @@
+import asyncio
+import datetime
+import json
+import re
+import sys
+import discord
+
+from typing import Callable
+
+from utils.default import parse_duration
+
+# Filter language for prune custom, e.g.
+#   from:@raider and (has:link or regex:"disc(or)?d\.gg") and not older:1d
+#   bot or mentions:5 or (has:file and newer:10m)
+# Terms combine with and / or / not and parentheses; "and" binds tighter than "or".
+
+MAX_REGEX_LENGTH = 200
+PAGE_TIMEOUT = 5.0    # seconds a page of messages may spend in user regexes before the prune is stopped
+
+TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|([^\s()"]+:"(?:[^"\\]|\\.)*")|([^\s()]+))')
+LINK_RE = re.compile(r"https?://\S+")
+INVITE_RE = re.compile(r"(?:discord(?:app)?\.com/invite|discord\.gg)/\S+", re.IGNORECASE)
+EMOJI_RE = re.compile(r"<a?:(.*?):(\d{17,21})>|[\u263a-\U0001f645]")
+MENTION_ID_RE = re.compile(r"<@!?(\d{15,20})>|(\d{15,20})")
+
+Predicate = Callable[[discord.Message], bool]
+
+# Runs a filter's regexes over a page of message contents and reports the matching indexes per pattern
+REGEX_WORKER = """
+import json, re, sys
+job = json.load(sys.stdin)
+contents = job["contents"]
+json.dump([[i for i, c in enumerate(contents) if p.search(c)] for p in map(re.compile, job["patterns"])], sys.stdout)
+"""
+
+
+class FilterError(Exception):
+    pass
+
+
+HAS = {
+    "file":       lambda m: bool(m.attachments),
+    "attachment": lambda m: bool(m.attachments),
+    "image":      lambda m: any((a.content_type or "").startswith("image/") for a in m.attachments) or any(e.image or e.thumbnail for e in m.embeds),
+    "embed":      lambda m: bool(m.embeds),
+    "link":       lambda m: bool(LINK_RE.search(m.content)),
+    "invite":     lambda m: bool(INVITE_RE.search(m.content)),
+    "mention":    lambda m: bool(m.mentions or m.role_mentions or m.mention_everyone),
+    "emoji":      lambda m: bool(EMOJI_RE.search(m.content)),
+    "reaction":   lambda m: bool(m.reactions),
+}
+
+KEYWORDS = {
+    "bot":     lambda m: m.author.bot and m.webhook_id is None,
+    "human":   lambda m: not m.author.bot,
+    "webhook": lambda m: m.webhook_id is not None,
+    "pinned":  lambda m: m.pinned,
+    "all":     lambda m: True,
+}
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        # Only \" and \\ are quoting escapes; anything else (\d, \. in a regex) passes through untouched
+        return re.sub(r'\\(["\\])', r'\1', value[1:-1])
+    return value
+
+
+def _term(token: str, regexes: list, regex_hits: list) -> Predicate:
+    if token.lower() in KEYWORDS:
+        return KEYWORDS[token.lower()]
+    key, sep, raw = token.partition(":")
+    key, value = key.lower(), _unquote(raw)
+    if not sep or not value:
+        raise FilterError(f"`{token}` isn't a filter term. Try things like `from:@user`, `has:link` or `older:2d`.")
+
+    if key in ("from", "author"):
+        match = MENTION_ID_RE.fullmatch(value)
+        if not match:
+            raise FilterError(f"`{value}` isn't a user mention or ID.")
+        user_id = int(match.group(1) or match.group(2))
+        return lambda m: m.author.id == user_id
+    if key == "has":
+        if value.lower() not in HAS:
+            raise FilterError(f"`has:{value}` isn't supported. Use one of: {', '.join(HAS)}")
+        return HAS[value.lower()]
+    if key == "contains":
+        needle = value.casefold()
+        return lambda m: needle in m.content.casefold()
+    if key == "regex":
+        if len(value) > MAX_REGEX_LENGTH:
+            raise FilterError(f"Regexes are limited to {MAX_REGEX_LENGTH} characters.")
+        try:
+            pattern = re.compile(value)
+        except re.error as e:
+            raise FilterError(f"Invalid regex `{value}`: {e}")
+        # Matched ahead of time, out of process, by MessageFilter.check_page
+        hits = set()
+        regexes.append(pattern)
+        regex_hits.append(hits)
+        return lambda m: m.id in hits
+    if key in ("older", "newer"):
+        seconds = parse_duration(value)
+        if seconds is None:
+            raise FilterError(f"`{value}` isn't a duration. Use something like `30m`, `2h` or `1d12h`.")
+        cutoff = discord.utils.utcnow() - datetime.timedelta(seconds=seconds)
+        return (lambda m: m.created_at < cutoff) if key == "older" else (lambda m: m.created_at >= cutoff)
+    if key == "mentions":
+        if not value.isdigit():
+            raise FilterError("`mentions:` takes a number, e.g. `mentions:5`.")
+        count = int(value)
+        return lambda m: len(m.raw_mentions) + len(m.raw_role_mentions) >= count
+    raise FilterError(f"Unknown filter `{key}:`.")
+
+
+class MessageFilter:
+    """ A prune filter expression compiled once into a single predicate. """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.regexes: list[re.Pattern] = []
+        self.regex_hits: list[set[int]] = []
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+        self.predicate = self._or()
+        if self.pos != len(self.tokens):
+            raise FilterError(f"Unexpected `{self.tokens[self.pos]}`.")
+        del self.tokens
+
+    @staticmethod
+    def _tokenize(text: str) -> list[str]:
+        tokens, pos = [], 0
+        text = text.strip()
+        while pos < len(text):
+            match = TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                raise FilterError(f"Couldn't read the filter from `{text[pos:pos + 20]}`.")
+            tokens.append(next(group for group in match.groups() if group))
+            pos = match.end()
+        if not tokens:
+            raise FilterError("The filter is empty.")
+        return tokens
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos].lower() if self.pos < len(self.tokens) else None
+
+    def _or(self) -> Predicate:
+        parts = [self._and()]
+        while self._peek() == "or":
+            self.pos += 1
+            parts.append(self._and())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda m: any(p(m) for p in parts)
+
+    def _and(self) -> Predicate:
+        parts = [self._not()]
+        while self._peek() == "and":
+            self.pos += 1
+            parts.append(self._not())
+        if len(parts) == 1:
+            return parts[0]
+        return lambda m: all(p(m) for p in parts)
+
+    def _not(self) -> Predicate:
+        if self._peek() == "not":
+            self.pos += 1
+            inner = self._not()
+            return lambda m: not inner(m)
+        return self._atom()
+
+    def _atom(self) -> Predicate:
+        token = self._peek()
+        if token is None:
+            raise FilterError("The filter ends too early.")
+        if token == "(":
+            self.pos += 1
+            inner = self._or()
+            if self._peek() != ")":
+                raise FilterError("Missing `)`.")
+            self.pos += 1
+            return inner
+        if token in (")", "and", "or"):
+            raise FilterError(f"Unexpected `{self.tokens[self.pos]}`.")
+        self.pos += 1
+        return _term(self.tokens[self.pos - 1], self.regexes, self.regex_hits)
+
+    async def check_page(self, page: list[discord.Message]) -> list[bool]:
+        """ Evaluate a page of messages. Regexes run in a child process that is killed if it overruns. """
+        if self.regexes:
+            await self._match_regexes(page)
+        return [self.predicate(m) for m in page]
+
+    async def _match_regexes(self, page: list[discord.Message]) -> None:
+        # re holds the GIL for a whole match, so a thread can't protect the event loop from a pattern
+        # that backtracks forever; a separate process can simply be killed
+        payload = json.dumps({"patterns": [p.pattern for p in self.regexes], "contents": [m.content for m in page]})
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-I", "-c", REGEX_WORKER,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(payload.encode()), PAGE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise FilterError("The filter's regex took too long to run, so the prune was stopped. Try a simpler pattern.")
+        if proc.returncode != 0:
+            raise FilterError("The filter's regex couldn't be run.")
+        for hits, indexes in zip(self.regex_hits, json.loads(out)):
+            hits.clear()
+            hits.update(page[i].id for i in indexes)
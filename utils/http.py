@@ -1,8 +1,41 @@
 import aiohttp
+import asyncio
+import hashlib
 import json
+import random
+import time
 
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
 from aiohttp.client_exceptions import ContentTypeError
 
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+CACHE_MAX_ENTRIES = 512
+
+BREAKER_THRESHOLD = 5       # consecutive failures that open a host's circuit
+BREAKER_COOLDOWN = 30.0     # seconds an open circuit waits before letting one probe through
+RETRY_ATTEMPTS = 2          # extra tries for idempotent requests
+RETRY_RATIO = 0.2           # retries may add at most 20% on top of a host's first attempts
+RETRY_BURST = 10.0          # ...with this many banked for bursts
+RETRY_BASE_DELAY = 0.25     # seconds; full-jitter exponential backoff between tries
+RETRY_METHODS = {"get", "head", "options"}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+DOWNLOAD_MAX_BYTES = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+SNIFF_BYTES = 12
+
+# Leading bytes of the binary formats we care about, checked against the first chunk
+MAGIC_BYTES = [
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+]
+
+# Survives `reloadutils http`, which re-runs this module in the same namespace
+_session: aiohttp.ClientSession | None = globals().get("_session")
+
 
 class HTTPResponse:
     def __init__(
@@ -18,25 +51,238 @@ class HTTPResponse:
         return f"<HTTPResponse status={self.status} res_method='{self.res_method}'>"
 
 
-async def query(url, method="get", res_method="text", *args, **kwargs) -> HTTPResponse:
-    session = aiohttp.ClientSession()
+def session() -> aiohttp.ClientSession:
+    """ The bot-wide pooled session; opened on first use if setup_hook hasn't done it yet. """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        _session = aiohttp.ClientSession(connector=connector, timeout=DEFAULT_TIMEOUT)
+    return _session
+
+
+async def open_session() -> aiohttp.ClientSession:
+    return session()
+
+
+async def close_session() -> None:
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+class CircuitOpenError(Exception):
+    """ Raised without touching the network while a host is known to be down. """
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} is unavailable, retrying in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class HostHealth:
+    """ Circuit breaker, retry budget and latency stats for one host. """
+
+    def __init__(self, host: str):
+        self.host = host
+        self.state = "closed"
+        self.streak = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.retry_tokens = RETRY_BURST
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.rejected = 0
+        self.latencies: deque[float] = deque(maxlen=100)
+
+    def acquire(self) -> None:
+        """ Raise CircuitOpenError unless a request to this host may go out now. """
+        if self.state == "open":
+            retry_in = self.opened_at + BREAKER_COOLDOWN - time.monotonic()
+            if retry_in > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.host, retry_in)
+            self.state = "half-open"
+        if self.state == "half-open":
+            if self.probing:
+                self.rejected += 1
+                raise CircuitOpenError(self.host, BREAKER_COOLDOWN)
+            self.probing = True
+        self.requests += 1
+
+    def release(self) -> None:
+        # The request ended without telling us anything about the host (cancelled, bad body)
+        self.probing = False
+
+    def success(self, latency: float) -> None:
+        self.latencies.append(latency)
+        self.state = "closed"
+        self.streak = 0
+        self.probing = False
+
+    def failure(self) -> None:
+        self.failures += 1
+        self.streak += 1
+        self.probing = False
+        if self.state == "half-open" or self.streak >= BREAKER_THRESHOLD:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def deposit(self) -> None:
+        self.retry_tokens = min(RETRY_BURST, self.retry_tokens + RETRY_RATIO)
+
+    def withdraw(self) -> bool:
+        if self.state != "closed" or self.retry_tokens < 1:
+            return False
+        self.retry_tokens -= 1
+        self.retries += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "rejected": self.rejected,
+            "avg_latency": sum(self.latencies) / len(self.latencies) if self.latencies else 0.0,
+            "max_latency": max(self.latencies, default=0.0),
+        }
+
+
+hosts: dict[str, HostHealth] = globals().get("hosts") or {}
+
+
+async def _read_body(res: aiohttp.ClientResponse, res_method: str) -> HTTPResponse:
+    try:
+        r = await getattr(res, res_method)()
+    except ContentTypeError:
+        if res_method != "json":
+            raise
+        r = json.loads(await res.text())
+
+    return HTTPResponse(
+        status=res.status,
+        response=r,
+        res_method=res_method,
+        headers=res.headers
+    )
+
+
+async def _send(health: HostHealth, method: str, url, read, *args, **kwargs) -> HTTPResponse:
+    health.acquire()
+    started = time.monotonic()
+    responded = False
+    try:
+        async with getattr(session(), method)(url, *args, **kwargs) as res:
+            responded = True
+            if res.status in RETRY_STATUSES:
+                health.failure()
+            else:
+                health.success(time.monotonic() - started)
+            return await read(res)
+    except aiohttp.InvalidURL:
+        raise
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        if not responded:
+            health.failure()
+        raise
+    finally:
+        health.release()
+
 
-    async with getattr(session, method.lower())(url, *args, **kwargs) as res:
+async def _request(url, method: str, read, *args, **kwargs) -> HTTPResponse:
+    method = method.lower()
+    host = urlsplit(str(url)).hostname or ""
+    health = hosts.get(host)
+    if health is None:
+        health = hosts[host] = HostHealth(host)
+
+    health.deposit()
+    attempts = 1 + (RETRY_ATTEMPTS if method in RETRY_METHODS else 0)
+    for attempt in range(attempts):
+        last = attempt + 1 == attempts
         try:
-            r = await getattr(res, res_method)()
-        except ContentTypeError:
-            if res_method == "json":
-                r = json.loads(await res.text())
+            response = await _send(health, method, url, read, *args, **kwargs)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if last or isinstance(e, (aiohttp.InvalidURL, ContentTypeError)) or not health.withdraw():
+                raise
+        else:
+            if last or response.status not in RETRY_STATUSES or not health.withdraw():
+                return response
+        await asyncio.sleep(random.uniform(0, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+async def query(url, method="get", res_method="text", *args, **kwargs) -> HTTPResponse:
+    return await _request(url, method, lambda res: _read_body(res, res_method), *args, **kwargs)
+
+
+class DownloadError(Exception):
+    """ Raised when a streamed download is refused: bad status, wrong type or too large. """
+
+
+class Download:
+    def __init__(self, data: bytes, content_type: str, sha256: str, format: str | None):
+        self.data = data
+        self.content_type = content_type
+        self.sha256 = sha256
+        self.format = format
+
+    def __repr__(self) -> str:
+        return f"<Download bytes={len(self.data)} format={self.format} sha256={self.sha256[:12]}>"
+
+
+def sniff_format(head: bytes) -> str | None:
+    for magic, name in MAGIC_BYTES:
+        if head.startswith(magic):
+            return name
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+async def _read_stream(res: aiohttp.ClientResponse, max_bytes: int, content_types: tuple, formats: tuple | None) -> HTTPResponse:
+    content_type = res.content_type or ""
+    if res.status != 200:
+        return HTTPResponse(status=res.status, response=None, res_method="stream", headers=res.headers)
+    if content_types and not content_type.startswith(content_types) and content_type != "application/octet-stream":
+        raise DownloadError(f"Unexpected content type `{content_type or 'unknown'}`.")
+    if res.content_length is not None and res.content_length > max_bytes:
+        raise DownloadError(f"File is {res.content_length / 1048576:.1f} MB, the limit is {max_bytes / 1048576:.1f} MB.")
+
+    # Read chunk by chunk so an oversized or lying response never gets fully buffered
+    data = bytearray()
+    digest = hashlib.sha256()
+    kind = None
+    sniffed = False
+    async for chunk in res.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+        if len(data) + len(chunk) > max_bytes:
+            raise DownloadError(f"File is larger than the {max_bytes / 1048576:.1f} MB limit.")
+        data += chunk
+        digest.update(chunk)
+        if not sniffed and len(data) >= SNIFF_BYTES:
+            kind, sniffed = _check_format(data, formats), True
+    if not sniffed:
+        kind = _check_format(data, formats)
+
+    result = Download(bytes(data), content_type, digest.hexdigest(), kind)
+    return HTTPResponse(status=res.status, response=result, res_method="stream", headers=res.headers)
 
-        output = HTTPResponse(
-            status=res.status,
-            response=r,
-            res_method=res_method,
-            headers=res.headers
-        )
 
-    await session.close()
-    return output
+def _check_format(data: bytearray, formats: tuple | None) -> str | None:
+    kind = sniff_format(bytes(data[:SNIFF_BYTES]))
+    if formats and kind not in formats:
+        raise DownloadError(f"Expected a {'/'.join(formats)} file, got {kind or 'an unrecognised format'}.")
+    return kind
+
+
+async def download(url, *, max_bytes: int = DOWNLOAD_MAX_BYTES, content_types: tuple = ("image/",), formats: tuple | None = None, **kwargs) -> Download:
+    """ Stream a binary body into memory, aborting as soon as it breaks the size, content-type or format limits. """
+    r = await _request(url, "get", lambda res: _read_stream(res, max_bytes, content_types, formats), **kwargs)
+    if r.status != 200:
+        raise DownloadError(f"Server responded with HTTP {r.status}.")
+    return r.response
 
 
 async def get(url, *args, **kwargs) -> HTTPResponse:
@@ -45,3 +291,81 @@ async def get(url, *args, **kwargs) -> HTTPResponse:
 
 async def post(url, *args, **kwargs) -> HTTPResponse:
     return await query(url, "post", *args, **kwargs)
+
+
+class ResponseCache:
+    """ LRU cache of responses with per-entry TTLs, stale-while-revalidate and single-flight fetches. """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[float, float, HTTPResponse]] = OrderedDict()
+        self.inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    async def get(self, key: str, fetch, ttl: float, stale: float) -> HTTPResponse:
+        entry = self.entries.get(key)
+        if entry is not None:
+            fresh_until, stale_until, response = entry
+            now = time.monotonic()
+            if now < stale_until:
+                self.entries.move_to_end(key)
+                if now < fresh_until:
+                    self.hits += 1
+                else:
+                    # Serve the stale copy right away and refresh it in the background
+                    self.stale_hits += 1
+                    self._fetch(key, fetch, ttl, stale)
+                return response
+            del self.entries[key]
+
+        if key in self.inflight:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+        return await asyncio.shield(self._fetch(key, fetch, ttl, stale))
+
+    def _fetch(self, key: str, fetch, ttl: float, stale: float) -> asyncio.Task:
+        task = self.inflight.get(key)
+        if task is None:
+            task = self.inflight[key] = asyncio.create_task(self._store(key, fetch, ttl, stale))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _store(self, key: str, fetch, ttl: float, stale: float) -> HTTPResponse:
+        try:
+            response = await fetch()
+        finally:
+            self.inflight.pop(key, None)
+        # Only successes and a definitive "not found"; rate limits, server errors and other 4xx are refetched
+        if 200 <= response.status < 300 or response.status == 404:
+            now = time.monotonic()
+            self.entries[key] = (now + ttl, now + ttl + stale, response)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        return response
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "hit_ratio": (self.hits + self.stale_hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+
+cache: ResponseCache = globals().get("cache") or ResponseCache()
+
+
+async def cached_get(url, res_method="text", *, ttl: float = 60, stale: float = 300, **kwargs) -> HTTPResponse:
+    """ GET through the shared response cache; concurrent identical requests share one fetch. """
+    return await cache.get(f"{res_method}:{url}", lambda: get(url, res_method=res_method, **kwargs), ttl, stale)
@@ -0,0 +1,232 @@
+import asyncio
+import datetime
+import discord
+
+from typing import Awaitable, Callable
+
+BULK_CHUNK = 100                # messages per bulk-delete request (Discord's limit)
+PAGE_SIZE = 100                 # messages handed to the filter at once
+OLD_DELETE_INTERVAL = 1.0       # seconds between single deletes of messages too old for bulk delete
+OLD_QUEUE_DEPTH = 200           # old messages waiting for the single-delete worker before the walk pauses
+# Bulk delete refuses messages older than 14 days; keep a margin for messages that age out mid-purge
+BULK_MAX_AGE = datetime.timedelta(days=14) - datetime.timedelta(minutes=5)
+REACTION_WORKERS = 4            # clear-reaction requests in flight; discord.py's rate limiter paces them further
+REACTION_QUEUE_DEPTH = 50       # messages waiting for a worker before the walk pauses
+
+PageCheck = Callable[[list[discord.Message]], Awaitable[list[bool]]]
+
+
+class PurgeError(Exception):
+    pass
+
+
+class PurgeJob:
+    """ Walks a channel's history newest first. Recent matches are bulk deleted in chunks of 100;
+    older ones go to a paced single-delete worker. A checkpoint is reported whenever everything
+    scanned so far is dealt with, so an interrupted purge can resume from there. """
+
+    def __init__(
+        self, channel: discord.abc.Messageable, limit: int, check: PageCheck, *,
+        before: int, after: int | None = None, scanned: int = 0, deleted: int = 0,
+        on_checkpoint: Callable[["PurgeJob"], Awaitable[None]] | None = None
+    ):
+        self.channel = channel
+        self.limit = limit
+        self.check = check
+        self.cursor = before
+        self.after = after
+        self.scanned = scanned
+        self.deleted = deleted
+        self.checkpointed = scanned
+        self.on_checkpoint = on_checkpoint
+        self.old_pending = 0
+        self.cancelled = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=OLD_QUEUE_DEPTH)
+        self._worker: asyncio.Task | None = None
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    async def _checkpoint(self, message_id: int, position: int) -> None:
+        self.cursor = message_id
+        self.checkpointed = position
+        if self.on_checkpoint is not None:
+            await self.on_checkpoint(self)
+
+    async def _pages(self):
+        page = []
+        history = self.channel.history(
+            limit=self.limit - self.scanned,
+            before=discord.Object(id=self.cursor),
+            after=discord.Object(id=self.after) if self.after else None,
+            oldest_first=False
+        )
+        async for message in history:
+            page.append(message)
+            if len(page) == PAGE_SIZE:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    async def _hand_off(self, item: tuple[discord.Message, int] | None) -> bool:
+        """ Queue an item for the single-delete worker, waiting while it is behind. False if the worker
+        has stopped (cancelled); its error, if it failed, is raised instead. """
+        if self._worker.done():
+            self._worker.result()
+            return False
+        put = asyncio.ensure_future(self._queue.put(item))
+        await asyncio.wait({put, self._worker}, return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            self._worker.result()
+            return False
+        return True
+
+    async def _queue_old(self, message: discord.Message, position: int) -> bool:
+        """ Hand a message to the single-delete worker; waits while it is behind, which paces the walk. """
+        self.old_pending += 1
+        return await self._hand_off((message, position))
+
+    async def _bulk_delete(self, chunk: list[tuple[discord.Message, int]]) -> bool:
+        try:
+            await self.channel.delete_messages([message for message, _ in chunk])
+        except discord.NotFound:
+            pass
+        except discord.Forbidden:
+            raise PurgeError("I don't have permission to delete messages here.")
+        except discord.HTTPException:
+            # Something in the chunk was refused (aged out mid-purge, usually); retry them one by one
+            for message, position in chunk:
+                if not await self._queue_old(message, position):
+                    return False
+            return True
+        else:
+            self.deleted += len(chunk)
+        if not self.old_pending:
+            message, position = chunk[-1]
+            await self._checkpoint(message.id, position)
+        return True
+
+    async def _old_worker(self) -> None:
+        while not self.cancelled and (item := await self._queue.get()) is not None:
+            message, position = item
+            try:
+                await message.delete()
+                self.deleted += 1
+            except discord.NotFound:
+                pass
+            except discord.Forbidden:
+                raise PurgeError("I don't have permission to delete messages here.")
+            self.old_pending -= 1
+            await self._checkpoint(message.id, position)
+            await asyncio.sleep(OLD_DELETE_INTERVAL)
+
+    async def run(self) -> None:
+        self._worker = asyncio.create_task(self._old_worker())
+        try:
+            await self._walk()
+        except discord.Forbidden:
+            raise PurgeError("I don't have permission to delete messages here.")
+        except discord.HTTPException as e:
+            raise PurgeError(f"{e} — try a smaller amount.")
+        finally:
+            self._worker.cancel()
+
+    async def _walk(self) -> None:
+        bulk: list[tuple[discord.Message, int]] = []
+        async for page in self._pages():
+            cutoff = discord.utils.utcnow() - BULK_MAX_AGE
+            for message, matched in zip(page, await self.check(page)):
+                self.scanned += 1
+                if not matched:
+                    continue
+                if message.created_at > cutoff:
+                    bulk.append((message, self.scanned))
+                    if len(bulk) < BULK_CHUNK:
+                        continue
+                    items, bulk = bulk, []
+                    if not await self._bulk_delete(items):
+                        return
+                else:
+                    # History is newest first, so from here on everything is too old for bulk delete
+                    if bulk and not await self._bulk_delete(bulk):
+                        return
+                    bulk = []
+                    if not await self._queue_old(message, self.scanned):
+                        return
+            if not bulk and not self.old_pending:
+                # Nothing scanned so far is waiting on a delete, so none of it needs rescanning on resume
+                await self._checkpoint(page[-1].id, self.scanned)
+            if self.cancelled:
+                return
+        if bulk and not await self._bulk_delete(bulk):
+            return
+        if await self._hand_off(None):
+            await self._worker
+
+
+class ReactionClearJob:
+    """ Walks a channel's history newest first, handing messages with reactions to a small pool
+    of workers that clear them. The walk pauses whenever the workers fall behind. """
+
+    def __init__(self, channel: discord.abc.Messageable, limit: int, *, before: int):
+        self.channel = channel
+        self.limit = limit
+        self.before = before
+        self.scanned = 0
+        self.touched = 0
+        self.removed = 0
+        self.pending = 0
+        self.cancelled = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=REACTION_QUEUE_DEPTH)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    async def _worker(self) -> None:
+        while (message := await self._queue.get()) is not None:
+            try:
+                if not self.cancelled:
+                    await message.clear_reactions()
+                    self.touched += 1
+                    self.removed += sum(r.count for r in message.reactions)
+            except discord.NotFound:
+                pass
+            except discord.Forbidden:
+                raise PurgeError("I don't have permission to remove reactions here.")
+            finally:
+                self.pending -= 1
+
+    async def _hand_off(self, item: discord.Message | None, workers: list[asyncio.Task]) -> None:
+        """ Queue an item for the workers, raising a worker's failure rather than waiting on it forever. """
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            while not put.done():
+                await asyncio.wait({put, *(w for w in workers if not w.done())}, return_when=asyncio.FIRST_COMPLETED)
+                for worker in workers:
+                    if worker.done() and worker.exception():
+                        raise worker.exception()
+        finally:
+            put.cancel()
+
+    async def run(self) -> None:
+        workers = [asyncio.create_task(self._worker()) for _ in range(REACTION_WORKERS)]
+        try:
+            async for message in self.channel.history(limit=self.limit, before=discord.Object(id=self.before)):
+                self.scanned += 1
+                if message.reactions:
+                    self.pending += 1
+                    await self._hand_off(message, workers)
+                if self.cancelled:
+                    break
+            for _ in workers:
+                await self._hand_off(None, workers)
+            await asyncio.gather(*workers)
+        except discord.Forbidden:
+            raise PurgeError("I don't have permission to remove reactions here.")
+        except discord.HTTPException as e:
+            raise PurgeError(f"{e} — try a smaller amount.")
+        finally:
+            for worker in workers:
+                worker.cancel()
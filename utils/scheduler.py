@@ -0,0 +1,70 @@
+import asyncio
+import heapq
+import itertools
+import time
+import traceback
+
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class Scheduler:
+    """ One background task that sleeps until the earliest due key, then fires every due key in a batch. """
+
+    def __init__(self, callback: Callable[[list], Awaitable[Any]]):
+        self.callback = callback
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._due: dict[Hashable, float] = {}
+        self._counter = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._due
+
+    def schedule(self, key: Hashable, when: float) -> None:
+        """ Fire key at the unix timestamp when; rescheduling a key replaces its old time. """
+        self._due[key] = when
+        heapq.heappush(self._heap, (when, next(self._counter), key))
+        if self._heap[0][2] == key:
+            self._wake.set()
+
+    def cancel(self, key: Hashable) -> bool:
+        return self._due.pop(key, None) is not None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    def _pop_due(self, now: float) -> list:
+        batch = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, key = heapq.heappop(self._heap)
+            # Entries whose key was cancelled or rescheduled are skipped lazily
+            if self._due.get(key) == when:
+                del self._due[key]
+                batch.append(key)
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = self._pop_due(time.time())
+            if batch:
+                try:
+                    await self.callback(batch)
+                except Exception:
+                    traceback.print_exc()
+                continue
+
+            self._wake.clear()
+            timeout = max(0.0, self._heap[0][0] - time.time()) if self._heap else None
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,154 @@
+import asyncio
+import heapq
+
+from collections import Counter
+from typing import Callable, Iterable, Iterator
+
+BUILD_BATCH = 2000          # members indexed between yields to the event loop
+SIMILARITY_THRESHOLD = 0.3  # same default as pg_trgm
+EDIT_SLACK = 2              # length difference within which a near miss is rescored by edit distance
+
+
+def trigrams(text: str) -> set[str]:
+    """ pg_trgm-style trigrams of a casefolded string, padded so word edges and short strings count. """
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """ Optimal string alignment distance: insertions, deletions, substitutions and adjacent swaps. """
+    before, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        before, previous = previous, current
+    return previous[-1]
+
+
+class FieldIndex:
+    """ Trigram postings for one searchable string per member. """
+
+    def __init__(self):
+        self.values: dict[int, str] = {}
+        self.gram_counts: dict[int, int] = {}
+        self.postings: dict[str, set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def set(self, key: int, value: str | None) -> None:
+        value = value.casefold() if value else None
+        if self.values.get(key) == value:
+            return
+        self.discard(key)
+        if value is None:
+            return
+        self.values[key] = value
+        grams = trigrams(value)
+        self.gram_counts[key] = len(grams)
+        for gram in grams:
+            bucket = self.postings.get(gram)
+            if bucket is None:
+                bucket = self.postings[gram] = set()
+            bucket.add(key)
+
+    def discard(self, key: int) -> None:
+        value = self.values.pop(key, None)
+        if value is None:
+            return
+        del self.gram_counts[key]
+        for gram in trigrams(value):
+            bucket = self.postings.get(gram)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.postings[gram]
+
+    def contains(self, query: str) -> Iterator[int]:
+        """ Keys whose value contains query, narrowed by the rarest of its trigrams before checking. """
+        query = query.casefold()
+        grams = {query[i:i + 3] for i in range(len(query) - 2)}
+        if not grams:
+            # One- and two-character queries have no trigram to narrow on
+            return (key for key, value in self.values.items() if query in value)
+        buckets = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        candidates = buckets[0].intersection(*buckets[1:])
+        return (key for key in candidates if query in self.values[key])
+
+    def similar(self, query: str, threshold: float = SIMILARITY_THRESHOLD) -> dict[int, float]:
+        """ Similarity of every value at or above threshold: trigram overlap (shared / union),
+        raised to edit-distance similarity for near misses that trigrams punish, like swapped letters. """
+        query = query.casefold()
+        grams = trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            bucket = self.postings.get(gram)
+            if bucket:
+                shared.update(bucket)
+        scores = {}
+        for key, common in shared.items():
+            score = common / (len(grams) + self.gram_counts[key] - common)
+            if score < threshold and common >= 2:
+                value = self.values[key]
+                if abs(len(value) - len(query)) <= EDIT_SLACK:
+                    score = max(score, 1 - edit_distance(query, value) / max(len(query), len(value)))
+            if score >= threshold:
+                scores[key] = score
+        return scores
+
+
+def top_matches(score_maps: Iterable[dict[int, float]], k: int, keep: Callable[[int], bool] = None) -> list[tuple[float, int]]:
+    """ The k best (score, key) pairs, taking each key's best score across fields. """
+    best: dict[int, float] = {}
+    for scores in score_maps:
+        for key, score in scores.items():
+            if score > best.get(key, 0.0):
+                best[key] = score
+    candidates = ((score, key) for key, score in best.items() if keep is None or keep(key))
+    return heapq.nlargest(k, candidates)
+
+
+class MemberIndex:
+    """ Per-guild search index over member names, nicknames, display names and IDs.
+
+    Each field is built the first time it is searched and patched from member events after that.
+    """
+
+    FIELDS = {
+        "name": lambda m: m.name,
+        "nick": lambda m: m.nick,
+        "global_name": lambda m: m.global_name,
+        "id":   lambda m: str(m.id),
+    }
+
+    def __init__(self):
+        self.fields: dict[str, FieldIndex] = {}
+        self._builds: dict[str, asyncio.Task] = {}
+
+    def add(self, member) -> None:
+        for field, index in self.fields.items():
+            index.set(member.id, self.FIELDS[field](member))
+
+    def remove(self, member_id: int) -> None:
+        for index in self.fields.values():
+            index.discard(member_id)
+
+    async def _populate(self, index: FieldIndex, getter, members: list) -> None:
+        for i, member in enumerate(members, start=1):
+            index.set(member.id, getter(member))
+            if i % BUILD_BATCH == 0:
+                await asyncio.sleep(0)
+
+    async def ensure_built(self, field: str, members: Iterable) -> FieldIndex:
+        if field not in self._builds:
+            index = self.fields[field] = FieldIndex()
+            self._builds[field] = asyncio.create_task(self._populate(index, self.FIELDS[field], list(members)))
+        await asyncio.shield(self._builds[field])
+        return self.fields[field]
+
+    def close(self) -> None:
+        for task in self._builds.values():
+            task.cancel()
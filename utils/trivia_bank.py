@@ -0,0 +1,58 @@
+# Offline trivia questions, in the same shape as opentdb.com results.
+# Served by the trivia command whenever the upstream API is slow or unreachable.
+
+def _q(category: str, difficulty: str, question: str, correct: str, *incorrect: str) -> dict:
+    return {
+        "category": category,
+        "difficulty": difficulty,
+        "question": question,
+        "correct_answer": correct,
+        "incorrect_answers": list(incorrect),
+    }
+
+
+QUESTIONS = [
+    _q("Science: Nature", "easy", "What is the largest planet in our Solar System?", "Jupiter", "Saturn", "Neptune", "Earth"),
+    _q("Science: Nature", "easy", "What gas do plants absorb from the atmosphere?", "Carbon dioxide", "Oxygen", "Nitrogen", "Helium"),
+    _q("Science: Nature", "medium", "What is the chemical symbol for gold?", "Au", "Ag", "Gd", "Go"),
+    _q("Science: Nature", "medium", "How many bones are in the adult human body?", "206", "201", "212", "198"),
+    _q("Science: Nature", "hard", "What is the most abundant gas in Earth's atmosphere?", "Nitrogen", "Oxygen", "Argon", "Carbon dioxide"),
+    _q("Science: Nature", "medium", "Which planet is known as the Red Planet?", "Mars", "Venus", "Mercury", "Jupiter"),
+    _q("Science: Nature", "hard", "What is the hardest natural substance on Earth?", "Diamond", "Quartz", "Topaz", "Corundum"),
+    _q("Science: Computers", "easy", "What does \"CPU\" stand for?", "Central Processing Unit", "Central Program Utility", "Computer Personal Unit", "Core Processing Unit"),
+    _q("Science: Computers", "easy", "The Python programming language is named after which comedy group?", "Monty Python", "The Marx Brothers", "The Three Stooges", "The Goons"),
+    _q("Science: Computers", "medium", "How many bits are in a byte?", "8", "4", "16", "32"),
+    _q("Science: Computers", "medium", "What does \"HTTP\" stand for?", "Hypertext Transfer Protocol", "High Transfer Text Protocol", "Hyperlink Text Transport Process", "Host Transfer Text Protocol"),
+    _q("Science: Computers", "hard", "In what year was the first version of Python released?", "1991", "1989", "1995", "2000"),
+    _q("Science: Computers", "medium", "Which data structure works on a last-in, first-out basis?", "Stack", "Queue", "Heap", "Linked list"),
+    _q("Geography", "easy", "What is the capital of France?", "Paris", "Lyon", "Marseille", "Nice"),
+    _q("Geography", "easy", "Which is the largest ocean on Earth?", "Pacific Ocean", "Atlantic Ocean", "Indian Ocean", "Arctic Ocean"),
+    _q("Geography", "medium", "What is the capital of Australia?", "Canberra", "Sydney", "Melbourne", "Perth"),
+    _q("Geography", "medium", "Which river flows through Cairo?", "Nile", "Tigris", "Euphrates", "Congo"),
+    _q("Geography", "hard", "Which country has the most natural lakes?", "Canada", "Russia", "United States", "Finland"),
+    _q("Geography", "medium", "Mount Kilimanjaro is located in which country?", "Tanzania", "Kenya", "Uganda", "Ethiopia"),
+    _q("Geography", "hard", "What is the smallest country in the world by area?", "Vatican City", "Monaco", "San Marino", "Liechtenstein"),
+    _q("History", "easy", "In which year did World War II end?", "1945", "1944", "1946", "1939"),
+    _q("History", "medium", "Who was the first person to walk on the Moon?", "Neil Armstrong", "Buzz Aldrin", "Yuri Gagarin", "Michael Collins"),
+    _q("History", "medium", "Which ancient civilisation built Machu Picchu?", "Inca", "Aztec", "Maya", "Olmec"),
+    _q("History", "hard", "In which year did the Berlin Wall fall?", "1989", "1987", "1991", "1985"),
+    _q("History", "medium", "Who painted the Mona Lisa?", "Leonardo da Vinci", "Michelangelo", "Raphael", "Donatello"),
+    _q("History", "hard", "Which empire was ruled by Mansa Musa?", "Mali Empire", "Songhai Empire", "Ghana Empire", "Ottoman Empire"),
+    _q("Entertainment: Video Games", "easy", "What is the name of the princess Mario usually rescues?", "Peach", "Daisy", "Rosalina", "Zelda"),
+    _q("Entertainment: Video Games", "medium", "Which block do you need to mine obsidian in Minecraft with?", "Diamond pickaxe", "Iron pickaxe", "Stone pickaxe", "Golden pickaxe"),
+    _q("Entertainment: Video Games", "medium", "In Pokémon, what type is Pikachu?", "Electric", "Normal", "Fire", "Psychic"),
+    _q("Entertainment: Video Games", "hard", "What was the first commercially successful video game?", "Pong", "Space Invaders", "Pac-Man", "Tetris"),
+    _q("Entertainment: Film", "easy", "Which movie features a clownfish named Nemo?", "Finding Nemo", "Shark Tale", "The Little Mermaid", "Moana"),
+    _q("Entertainment: Film", "medium", "Who directed \"Jurassic Park\" (1993)?", "Steven Spielberg", "James Cameron", "George Lucas", "Ridley Scott"),
+    _q("Entertainment: Film", "hard", "Which film won the first ever Academy Award for Best Picture?", "Wings", "Sunrise", "The Jazz Singer", "Metropolis"),
+    _q("Entertainment: Music", "easy", "How many strings does a standard guitar have?", "6", "4", "7", "12"),
+    _q("Entertainment: Music", "medium", "Which band released the album \"Abbey Road\"?", "The Beatles", "The Rolling Stones", "Pink Floyd", "Queen"),
+    _q("Sports", "easy", "How many players are on a football (soccer) team on the field?", "11", "10", "9", "12"),
+    _q("Sports", "medium", "In which sport would you perform a slam dunk?", "Basketball", "Volleyball", "Tennis", "Handball"),
+    _q("Sports", "hard", "Which country has won the most FIFA World Cups?", "Brazil", "Germany", "Italy", "Argentina"),
+    _q("General Knowledge", "easy", "How many days are there in a leap year?", "366", "365", "364", "367"),
+    _q("General Knowledge", "easy", "What colour do you get by mixing blue and yellow?", "Green", "Purple", "Orange", "Brown"),
+    _q("General Knowledge", "medium", "How many sides does a hexagon have?", "6", "5", "7", "8"),
+    _q("General Knowledge", "medium", "Which animal is known as the \"Ship of the Desert\"?", "Camel", "Horse", "Elephant", "Llama"),
+    _q("General Knowledge", "hard", "What is the only letter that does not appear in any U.S. state name?", "Q", "Z", "X", "J"),
+]